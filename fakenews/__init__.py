@@ -16,9 +16,23 @@
 # DEALINGS IN THE SOFTWARE.
 
 # Define the version of the template module.
+import time
+
+# Start of the package import, the first phase reported by the startup timer.
+IMPORT_STARTED_AT = time.perf_counter()
+
 __version__ = "0.2.3"
 version_split = __version__.split(".")
 __spec_version__ = (1000 * int(version_split[0])) + (10 * int(version_split[1])) + (1 * int(version_split[2]))
 
-# Import all submodules.
-from . import base, protocol, schemas, services, validator  # noqa: E402
+# Submodules are imported on first access. They import bittensor, which parses the command line as it is imported, so
+# the command line tools of the package parse their own arguments first.
+_SUBMODULES = ("base", "protocol", "schemas", "services", "validator")
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        import importlib  # noqa: PLC0415 - only needed on first access
+
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
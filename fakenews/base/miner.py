@@ -17,9 +17,9 @@
 
 import argparse
 import asyncio
+import copy
 import sys
 import threading
-import time
 import traceback
 from typing import Union
 
@@ -36,6 +36,8 @@ class BaseMinerNeuron(BaseNeuron):
     """
 
     neuron_type: str = "MinerNeuron"
+    # Seconds between two checks of `should_exit` while waiting for the next sync.
+    EXIT_CHECK_INTERVAL: int = 1
 
     @classmethod
     def add_args(cls, parser: argparse.ArgumentParser):
@@ -115,18 +117,15 @@ class BaseMinerNeuron(BaseNeuron):
         # This loop maintains the miner's operations until intentionally stopped.
         while not self.should_exit:
             try:
-                while self.block - self.metagraph.last_update[self.uid] < self.config.neuron.epoch_length:
-                    # Wait before checking again.
-                    time.sleep(1)
-
-                    # Check if we should exit.
-                    if self.should_exit:
-                        break
+                # Sleep until the next sync is due, woken up by the block tracker.
+                next_sync_block = self.next_sync_block()
+                if self.block < next_sync_block:
+                    self.block_tracker.wait_for_block_sync(next_sync_block, timeout=self.EXIT_CHECK_INTERVAL)
+                    continue
 
                 # Sync metagraph and potentially set weights.
                 self.sync()
                 self.step += 1
-                time.sleep(60)
 
             # If someone intentionally stops the miner, it'll safely terminate operations.
             except KeyboardInterrupt:
@@ -137,7 +136,8 @@ class BaseMinerNeuron(BaseNeuron):
             # In case of unforeseen errors, the miner will log the error and continue operations.
             except Exception:
                 bt.logging.error(traceback.format_exc())
-                time.sleep(60)
+                # Retry on the next block.
+                self.block_tracker.wait_for_block_sync(self.block + 1, timeout=self.block_tracker.BLOCK_TIME * 5)
 
     def run_in_background_thread(self):
         """
@@ -191,11 +191,20 @@ class BaseMinerNeuron(BaseNeuron):
         """Resyncs the metagraph and updates the hotkeys and moving averages based on the new metagraph."""
         bt.logging.info("resync_metagraph()")
 
-        # Sync the metagraph.
-        self.metagraph.sync(subtensor=self.subtensor)
+        # Sync a copy of the metagraph and swap it in, the axon handlers keep reading a consistent metagraph
+        # while the sync is in progress.
+        metagraph = copy.deepcopy(self.metagraph)
+        metagraph.sync(subtensor=self.subtensor)
+        self.metagraph = metagraph
+
         self._check_miner_minimum_alpha()
 
-        time.sleep(10)
+    def next_sync_block(self) -> int:
+        """Returns the first block at which the metagraph is due for a resync."""
+        return max(
+            int(self.metagraph.last_update[self.uid]) + self.config.neuron.epoch_length,
+            self.last_update + self.config.neuron.epoch_length + 1,
+        )
 
     def _check_miner_minimum_alpha(self):
         miners_coldkey = self.metagraph.coldkeys[self.uid]
@@ -23,10 +23,10 @@ import bittensor as bt
 
 from fakenews import __spec_version__ as spec_version
 from fakenews.mock import MockMetagraph, MockSubtensor
+from fakenews.utils.block_tracker import BlockTracker
 
 # Sync calls set weights and also resyncs the metagraph.
 from fakenews.utils.config import add_args, check_config, config
-from fakenews.utils.misc import ttl_get_block
 
 
 class BaseNeuron(ABC):
@@ -57,7 +57,7 @@ class BaseNeuron(ABC):
 
     @property
     def block(self):
-        return ttl_get_block(self)
+        return self.block_tracker.block
 
     def __init__(self, config=None):
         base_config = copy.deepcopy(config or BaseNeuron.config())
@@ -79,14 +79,11 @@ class BaseNeuron(ABC):
         bt.logging.info("Setting up bittensor objects.")
 
         # The wallet holds the cryptographic key pairs for the miner.
-        if self.config.mock:
-            self.wallet = bt.MockWallet(config=self.config)
-            self.subtensor = MockSubtensor(self.config.netuid, wallet=self.wallet)
-            self.metagraph = MockMetagraph(self.config.netuid, subtensor=self.subtensor)
-        else:
-            self.wallet = bt.wallet(config=self.config)
-            self.subtensor = bt.subtensor(config=self.config)
-            self.metagraph = self.subtensor.metagraph(self.config.netuid)
+        self.wallet, self.subtensor, self.metagraph = self.create_network()
+
+        # Follows the chain head in the background, so reading the current block never waits for an RPC.
+        self.block_tracker = self.create_block_tracker()
+        self.block_tracker.start()
 
         bt.logging.info(f"Wallet: {self.wallet}")
         bt.logging.info(f"Subtensor: {self.subtensor}")
@@ -103,6 +100,22 @@ class BaseNeuron(ABC):
         self.step = 0
         self.last_update = 0
 
+    def create_network(self) -> tuple["bt.wallet", "bt.subtensor", "bt.metagraph"]:
+        """Builds the wallet, subtensor and metagraph, mocked with --mock."""
+        if self.config.mock:
+            wallet = bt.MockWallet(config=self.config)
+            subtensor = MockSubtensor(self.config.netuid, wallet=wallet)
+            return wallet, subtensor, MockMetagraph(self.config.netuid, subtensor=subtensor)
+
+        wallet = bt.wallet(config=self.config)
+        subtensor = bt.subtensor(config=self.config)
+        return wallet, subtensor, subtensor.metagraph(self.config.netuid)
+
+    def create_block_tracker(self) -> BlockTracker:
+        if self.config.mock:
+            return BlockTracker(lambda: self.subtensor)
+        return BlockTracker(lambda: bt.subtensor(config=self.config))
+
     @abstractmethod
     async def forward(self, synapse: bt.Synapse) -> bt.Synapse: ...
 
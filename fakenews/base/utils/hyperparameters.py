@@ -0,0 +1,86 @@
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import bittensor as bt
+
+
+class SubnetHyperparameterCache:
+    """
+    Caches subnet hyperparameters read from the chain.
+
+    Every parameter is read with the subtensor method of the same name, e.g. `min_allowed_weights`, and kept for
+    `ttl_blocks` blocks. The cache is also invalidated when a synced metagraph reports different hyperparameters
+    than the previous one, see `observe_metagraph`.
+    """
+
+    DEFAULT_PARAMETERS = ("min_allowed_weights", "max_weight_limit")
+
+    def __init__(
+        self,
+        subtensor: "bt.subtensor",
+        netuid: int,
+        get_block: Callable[[], int],
+        ttl_blocks: int = 720,
+    ):
+        self.subtensor = subtensor
+        self.netuid = netuid
+        self.ttl_blocks = ttl_blocks
+
+        self._get_block = get_block
+        self._values: dict[str, tuple[Any, int]] = {}
+        self._metagraph_hparams = None
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Any:
+        """Returns the value of a hyperparameter, reading it from the chain if it isn't cached or expired."""
+        block = self._get_block()
+        with self._lock:
+            cached = self._values.get(name)
+        if cached is not None and block - cached[1] < self.ttl_blocks:
+            return cached[0]
+
+        value = getattr(self.subtensor, name)(netuid=self.netuid)
+        with self._lock:
+            self._values[name] = (value, block)
+        return value
+
+    def min_allowed_weights(self) -> int:
+        return self.get("min_allowed_weights")
+
+    def max_weight_limit(self) -> float:
+        return self.get("max_weight_limit")
+
+    def invalidate(self, *names: str):
+        """Drops the given hyperparameters from the cache, all of them if none is given."""
+        with self._lock:
+            if not names:
+                self._values.clear()
+            for name in names:
+                self._values.pop(name, None)
+
+    def prewarm(self, names: tuple[str, ...] = DEFAULT_PARAMETERS):
+        """Reads the given hyperparameters, so the first weights setting doesn't wait for them."""
+        for name in names:
+            try:
+                self.get(name)
+            except Exception as e:
+                bt.logging.warning(f"Failed to prewarm subnet hyperparameter {name}: {e}")
+
+    def observe_metagraph(self, metagraph: "bt.metagraph") -> bool:
+        """
+        Invalidates the cache if the hyperparameters of a freshly synced metagraph changed since the last one.
+
+        Returns:
+            bool: Whether a change was detected.
+        """
+        hparams = getattr(metagraph, "hparams", None)
+        if hparams is None:
+            return False
+
+        changed = self._metagraph_hparams is not None and hparams != self._metagraph_hparams
+        self._metagraph_hparams = hparams
+        if changed:
+            bt.logging.info("Subnet hyperparameters changed, invalidating the cached values")
+            self.invalidate()
+        return changed
@@ -4,6 +4,9 @@ import bittensor
 import numpy as np
 from numpy import complexfloating, dtype, floating, ndarray
 
+from fakenews.base.utils.hyperparameters import SubnetHyperparameterCache
+from fakenews.utils.logging import is_log_level_enabled
+
 U32_MAX = 4294967295
 U16_MAX = 65535
 
@@ -35,7 +38,7 @@ def normalize_max_weight(x: np.ndarray, limit: float = 0.1) -> np.ndarray:
     cumsum = np.cumsum(estimation, 0)
 
     # Determine the index of cutoff
-    estimation_sum = np.array([(len(values) - i - 1) * estimation[i] for i in range(len(values))])
+    estimation_sum = np.arange(len(values) - 1, -1, -1, dtype=estimation.dtype) * estimation
     n_values = (estimation / (estimation_sum + cumsum + epsilon) < limit).sum()
 
     # Determine the cutoff based on the index
@@ -66,14 +69,14 @@ def convert_weights_and_uids_for_emit(uids: np.ndarray, weights: np.ndarray) ->
     weights = np.asarray(weights)
 
     # Get non-zero weights and corresponding uids
-    non_zero_weights = weights[weights > 0]
-    non_zero_weight_uids = uids[weights > 0]
-
-    # Debugging information
-    bittensor.logging.debug(f"weights: {weights.tolist()}")
-    bittensor.logging.debug(f"non_zero_weights: {non_zero_weights.tolist()}")
-    bittensor.logging.debug(f"uids: {uids.tolist()}")
-    bittensor.logging.debug(f"non_zero_weight_uids: {non_zero_weight_uids.tolist()}")
+    debug = is_log_level_enabled("debug")
+    if debug:
+        non_zero_weights = weights[weights > 0]
+        non_zero_weight_uids = uids[weights > 0]
+        bittensor.logging.debug(f"weights: {weights.tolist()}")
+        bittensor.logging.debug(f"non_zero_weights: {non_zero_weights.tolist()}")
+        bittensor.logging.debug(f"uids: {uids.tolist()}")
+        bittensor.logging.debug(f"non_zero_weight_uids: {non_zero_weight_uids.tolist()}")
 
     if np.min(weights) < 0:
         raise ValueError("Passed weight is negative cannot exist on chain {}".format(weights))
@@ -85,29 +88,30 @@ def convert_weights_and_uids_for_emit(uids: np.ndarray, weights: np.ndarray) ->
         bittensor.logging.debug("nothing to set on chain")
         return [], []  # Nothing to set on chain.
     max_weight = float(np.max(weights))
-    weights = [float(value) / max_weight for value in weights]  # max-upscale values (max_weight = 1).
-    bittensor.logging.debug(f"setting on chain max: {max_weight} and weights: {weights}")
-
-    weight_vals = []
-    weight_uids = []
-    for _, (weight_i, uid_i) in enumerate(list(zip(weights, uids))):
-        uint16_val = round(float(weight_i) * int(U16_MAX))  # convert to int representation.
-
-        # Filter zeros
-        if uint16_val != 0:  # Filter zeros
-            weight_vals.append(uint16_val)
-            weight_uids.append(uid_i)
-    bittensor.logging.debug(f"final params: {weight_uids} : {weight_vals}")
+    weights = weights.astype(np.float64) / max_weight  # max-upscale values (max_weight = 1).
+    if debug:
+        bittensor.logging.debug(f"setting on chain max: {max_weight} and weights: {weights.tolist()}")
+
+    # Convert to int representation, np.round rounds half to even like the builtin round.
+    uint16_vals = np.round(weights * int(U16_MAX)).astype(np.int64)
+
+    # Filter zeros
+    non_zero = uint16_vals != 0
+    weight_vals = uint16_vals[non_zero].tolist()
+    weight_uids = uids[non_zero].tolist()
+    if debug:
+        bittensor.logging.debug(f"final params: {weight_uids} : {weight_vals}")
     return weight_uids, weight_vals
 
 
-def process_weights_for_netuid(
+def process_weights_for_netuid(  # noqa: PLR0915
     uids,
     weights: np.ndarray,
     netuid: int,
     subtensor: "bittensor.subtensor",
     metagraph: "bittensor.metagraph" = None,
     exclude_quantile: int = 0,
+    hyperparameters: SubnetHyperparameterCache | None = None,
 ) -> Union[
     tuple[
         ndarray[Any, dtype[Any]],
@@ -122,8 +126,10 @@ def process_weights_for_netuid(
     tuple[ndarray[Any, dtype[Any]], ndarray],
     tuple[Any, ndarray],
 ]:
+    debug = is_log_level_enabled("debug")
     bittensor.logging.debug("process_weights_for_netuid()")
-    bittensor.logging.debug("weights", weights.tolist())
+    if debug:
+        bittensor.logging.debug("weights", weights.tolist())
     bittensor.logging.debug("netuid", netuid)
     bittensor.logging.debug("subtensor", subtensor)
     bittensor.logging.debug("metagraph", metagraph)
@@ -139,8 +145,12 @@ def process_weights_for_netuid(
     # Network configuration parameters from an subtensor.
     # These parameters determine the range of acceptable weights for each neuron.
     quantile = exclude_quantile / U16_MAX
-    min_allowed_weights = subtensor.min_allowed_weights(netuid=netuid)
-    max_weight_limit = subtensor.max_weight_limit(netuid=netuid)
+    if hyperparameters is not None:
+        min_allowed_weights = hyperparameters.min_allowed_weights()
+        max_weight_limit = hyperparameters.max_weight_limit()
+    else:
+        min_allowed_weights = subtensor.min_allowed_weights(netuid=netuid)
+        max_weight_limit = subtensor.max_weight_limit(netuid=netuid)
     bittensor.logging.debug("quantile", quantile)
     bittensor.logging.debug("min_allowed_weights", min_allowed_weights)
     bittensor.logging.debug("max_weight_limit", max_weight_limit)
@@ -153,18 +163,21 @@ def process_weights_for_netuid(
     if non_zero_weights.size == 0 or metagraph.n < min_allowed_weights:
         bittensor.logging.warning("No non-zero weights returning all ones.")
         final_weights = np.ones(metagraph.n) / metagraph.n
-        bittensor.logging.debug("final_weights", final_weights.tolist())
+        if debug:
+            bittensor.logging.debug("final_weights", final_weights.tolist())
         return np.arange(len(final_weights)), final_weights
 
     if non_zero_weights.size < min_allowed_weights:
         bittensor.logging.warning("No non-zero weights less then min allowed weight, returning all ones.")
         weights = np.ones(metagraph.n) * 1e-5  # creating minimum even non-zero weights
         weights[non_zero_weight_idx] += non_zero_weights
-        bittensor.logging.debug("final_weights", weights.tolist())
+        if debug:
+            bittensor.logging.debug("final_weights", weights.tolist())
         normalized_weights = normalize_max_weight(x=weights, limit=max_weight_limit)
         return np.arange(len(normalized_weights)), normalized_weights
 
-    bittensor.logging.debug("non_zero_weights", non_zero_weights.tolist())
+    if debug:
+        bittensor.logging.debug("non_zero_weights", non_zero_weights.tolist())
 
     # Compute the exclude quantile and find the weights in the lowest quantile
     max_exclude = max(0, len(non_zero_weights) - min_allowed_weights) / len(non_zero_weights)
@@ -177,11 +190,13 @@ def process_weights_for_netuid(
     # Exclude all weights below the allowed quantile.
     non_zero_weight_uids = non_zero_weight_uids[lowest_quantile <= non_zero_weights]
     non_zero_weights = non_zero_weights[lowest_quantile <= non_zero_weights]
-    bittensor.logging.debug("non_zero_weight_uids", non_zero_weight_uids.tolist())
-    bittensor.logging.debug("non_zero_weights", non_zero_weights.tolist())
+    if debug:
+        bittensor.logging.debug("non_zero_weight_uids", non_zero_weight_uids.tolist())
+        bittensor.logging.debug("non_zero_weights", non_zero_weights.tolist())
 
     # Normalize weights and return.
     normalized_weights = normalize_max_weight(x=non_zero_weights, limit=max_weight_limit)
-    bittensor.logging.debug("final_weights", normalized_weights.tolist())
+    if debug:
+        bittensor.logging.debug("final_weights", normalized_weights.tolist())
 
     return non_zero_weight_uids, normalized_weights
@@ -20,6 +20,7 @@ import argparse
 import asyncio
 import copy
 import datetime as dt
+import json
 import os
 import sys
 import threading
@@ -28,19 +29,25 @@ from traceback import print_exception
 from typing import List, Union
 
 import bittensor as bt
-import joblib
 import numpy as np
-import wandb
 
 import fakenews
 from fakenews.base.neuron import BaseNeuron
+from fakenews.base.utils.hyperparameters import SubnetHyperparameterCache
 from fakenews.base.utils.min_miners_alpha import calculate_minimum_miner_alpha
 from fakenews.base.utils.weight_utils import convert_weights_and_uids_for_emit, process_weights_for_netuid
 from fakenews.exceptions import TaskDefinitionError
 from fakenews.mock import MockDendrite
+from fakenews.utils.checkpointer import Checkpointer, joblib_writer, json_writer, npz_writer
 from fakenews.utils.config import add_validator_args
+from fakenews.utils.logging import is_log_level_enabled
+from fakenews.utils.timing import StartupTimer
+from fakenews.utils.uids import MinerHealth, UidScheduler
 from fakenews.validator import task as tasks
 from fakenews.validator.performance_tracker import PerformanceTracker
+from fakenews.validator.recorder import StepRecorder
+from fakenews.validator.timeout import AdaptiveTimeout
+from fakenews.validator.wandb_logger import WandbLogger
 
 # Temporary solution to getting rid of annoying bittensor trace logs
 original_trace = bt.logging.trace
@@ -68,42 +75,97 @@ class BaseValidatorNeuron(BaseNeuron):
         add_validator_args(cls, parser)
 
     def __init__(self, config=None):
+        # Logged when the first forward starts.
+        self.startup_timer = StartupTimer(started_at=fakenews.IMPORT_STARTED_AT)
+        self.startup_timer.mark("imports")
+
         super().__init__(config=config)
+        self.startup_timer.mark("neuron")
 
         # Save a copy of the hotkeys to local memory.
         self.hotkeys = copy.deepcopy(self.metagraph.hotkeys)
 
         # Dendrite lets us send messages to other nodes (axons) in the network.
-        if self.config.mock:
-            self.dendrite = MockDendrite(wallet=self.wallet)
-        else:
-            self.dendrite = bt.dendrite(wallet=self.wallet)
+        self.dendrite = self.create_dendrite()
         bt.logging.info(f"Dendrite: {self.dendrite}")
 
-        # Set up initial scoring weights for validation
-        bt.logging.info("Building validation weights.")
-        self.scores = np.zeros(self.metagraph.n, dtype=np.float32)
-
-        openai_api_key = os.environ.get("OPENAI_API_KEY")
-
-        self.tasks = [
-            tasks.FakenewsDetectionNoOriginal(openai_api_key=openai_api_key, keypair=self.dendrite.keypair),
-        ]
+        # Subnet hyperparameters used to process the weights, read before the first weights setting.
+        self.hyperparameters = SubnetHyperparameterCache(
+            self.subtensor,
+            self.config.netuid,
+            get_block=lambda: self.block,
+            ttl_blocks=self.config.neuron.hyperparameters_ttl,
+        )
+        self.hyperparameters.prewarm()
+        self.startup_timer.mark("dendrite")
+
+        self.uid_scheduler = UidScheduler(self.metagraph.n.item())
+        self.miner_health = MinerHealth(
+            self.metagraph.n.item(),
+            failures_threshold=self.config.neuron.unresponsive_threshold,
+            max_backoff_steps=self.config.neuron.max_backoff_steps,
+        )
 
+        self.tasks = self.create_tasks()
         self._validate_tasks()
+        self.startup_timer.mark("tasks")
 
+        # Set up initial scoring weights for validation, one row of moving averages per task.
+        bt.logging.info("Building validation weights.")
+        self.scores = np.zeros((len(self.tasks), self.metagraph.n), dtype=np.float32)
+
+        self.bundle_caches = {
+            t: tasks.SynapseBundleCache(
+                t,
+                latency_budget=self.config.neuron.generation_latency_budget,
+                max_age=self.config.neuron.fallback_max_age,
+                max_uses=self.config.neuron.fallback_max_uses,
+                size=self.config.neuron.fallback_cache_size,
+            )
+            for t in self.tasks
+        }
+        self.timeout_controllers = {
+            t: AdaptiveTimeout(
+                floor=self.config.neuron.min_timeout,
+                ceiling=t.TIMEOUT,
+                percentile=self.config.neuron.timeout_percentile,
+                enabled=not self.config.neuron.static_timeout,
+            )
+            for t in self.tasks
+        }
         self.performance_trackers = {t: None for t in self.tasks}
+        # Trackers are loaded in the background, cleared while a load is running.
+        self._miner_history_loaded = threading.Event()
+        self._miner_history_loaded.set()
+        self.checkpointer = Checkpointer(self.config.neuron.full_path, generations=self.config.neuron.checkpoint_generations)
         self.load_state()
+        self.startup_timer.mark("state")
+
         self.init_wandb()
+        self.wandb_logger = WandbLogger(
+            queue_size=self.config.wandb.queue_size,
+            scores_every=self.config.wandb.scores_every,
+        )
+        self.startup_timer.mark("wandb")
+
+        self.step_recorder = None
+        if self.config.neuron.record_steps:
+            self.step_recorder = StepRecorder(
+                os.path.join(self.config.neuron.full_path, "steps"),
+                max_bytes=self.config.neuron.record_max_mb * 1024 * 1024,
+                max_segments=self.config.neuron.record_max_segments,
+            )
 
         # Init sync with the network. Updates the metagraph.
         self.sync()
+        self.startup_timer.mark("sync")
 
         # Serve axon to enable external connections.
         if not self.config.neuron.axon_off:
             self.serve_axon()
         else:
             bt.logging.warning("axon off, not serving ip to chain.")
+        self.startup_timer.mark("axon")
 
         # Create asyncio event loop to manage async tasks.
         self.loop = asyncio.get_event_loop()
@@ -114,6 +176,17 @@ class BaseValidatorNeuron(BaseNeuron):
         self.thread: Union[threading.Thread, None] = None
         self.lock = asyncio.Lock()
 
+    def create_dendrite(self) -> bt.dendrite:
+        if self.config.mock:
+            return MockDendrite(wallet=self.wallet)
+        return bt.dendrite(wallet=self.wallet)
+
+    def create_tasks(self) -> list[tasks.ValidatorTask]:
+        openai_api_key = os.environ.get("OPENAI_API_KEY")
+        return [
+            tasks.FakenewsDetectionNoOriginal(openai_api_key=openai_api_key, keypair=self.dendrite.keypair),
+        ]
+
     def serve_axon(self):
         """Serve axon to enable external connections."""
 
@@ -136,6 +209,13 @@ class BaseValidatorNeuron(BaseNeuron):
             bt.logging.error(f"Failed to create Axon initialize with exception: {e}")
 
     async def concurrent_forward(self):
+        # Forwards update the performance trackers, which may still be loading.
+        await asyncio.to_thread(self.wait_for_miner_history)
+        if self.startup_timer is not None:
+            self.startup_timer.mark("first_forward")
+            self.startup_timer.log()
+            self.startup_timer = None
+
         coroutines = [self.forward() for _ in range(self.config.neuron.num_concurrent_forwards)]
         await asyncio.gather(*coroutines)
 
@@ -180,13 +260,14 @@ class BaseValidatorNeuron(BaseNeuron):
                         bt.logging.info(
                             f"Current wandb run is more than {restart_wandb_every_hours} hours old. Starting a new run."
                         )
-                        self.wandb_run.finish()
+                        self.finish_wandb()
                         self.init_wandb()
 
                 # Check if we should exit.
                 if self.should_exit:
                     if not self.config.wandb.off:
-                        self.wandb_run.finish()
+                        self.finish_wandb()
+                    self.flush_checkpoints()
                     break
 
                 # Sync metagraph and potentially set weights.
@@ -201,7 +282,8 @@ class BaseValidatorNeuron(BaseNeuron):
                 self.axon.stop()
                 bt.logging.success("Validator killed by keyboard interrupt.")
                 if not self.config.wandb.off:
-                    self.wandb_run.finish()
+                    self.finish_wandb()
+                self.flush_checkpoints()
                 sys.exit()
 
             # In case of unforeseen errors, the validator will log the error and continue operations.
@@ -258,14 +340,21 @@ class BaseValidatorNeuron(BaseNeuron):
             self.is_running = False
             bt.logging.debug("Stopped")
 
+        # The run thread is a daemon, it is killed mid-step if it didn't stop in time, so the pending checkpoint is
+        # written here.
+        self.flush_checkpoints()
+
     def set_weights(self):
         """
         Sets the validator weights to the metagraph hotkeys based on the scores it has received from the miners.
         The weights determine the trust and incentive level the validator assigns to miner nodes on the network.
         """
 
-        # Check if self.scores contains any NaN values and log a warning if it does.
-        if np.isnan(self.scores).any():
+        # Combine the moving averages of every task.
+        scores = self.weighted_scores()
+
+        # Check if scores contains any NaN values and log a warning if it does.
+        if np.isnan(scores).any():
             bt.logging.warning(
                 "Scores contain NaN values."
                 "This may be due to a lack of responses from miners, or a bug in your reward functions."
@@ -274,14 +363,14 @@ class BaseValidatorNeuron(BaseNeuron):
         # Calculate the average reward for each uid across non-zero values.
         # Replace any NaN values with 0.
         # Compute the norm of the scores
-        norm = np.linalg.norm(self.scores, ord=1, axis=0, keepdims=True)
+        norm = np.linalg.norm(scores, ord=1, axis=0, keepdims=True)
 
         # Check if the norm is zero or contains NaN values
         if np.any(norm == 0) or np.isnan(norm).any():
             norm = np.ones_like(norm)  # Avoid division by zero or NaN
 
         # Compute raw_weights safely
-        raw_weights = self.scores / norm
+        raw_weights = scores / norm
 
         bt.logging.debug("raw_weights", raw_weights.tolist())
         bt.logging.debug("raw_weight_uids", str(self.metagraph.uids.tolist()))
@@ -295,6 +384,7 @@ class BaseValidatorNeuron(BaseNeuron):
             netuid=self.config.netuid,
             subtensor=self.subtensor,
             metagraph=self.metagraph,
+            hyperparameters=self.hyperparameters,
         )
         bt.logging.debug("processed_weights", processed_weights.tolist())
         bt.logging.debug("processed_weight_uids", processed_weight_uids.tolist())
@@ -321,6 +411,8 @@ class BaseValidatorNeuron(BaseNeuron):
             bt.logging.info("set_weights on chain successfully!")
         else:
             bt.logging.error("set_weights failed", msg)
+            # The weights may have been rejected because of stale hyperparameters, read them again next time.
+            self.hyperparameters.invalidate()
 
     def resync_metagraph(self):
         """Resyncs the metagraph and updates the hotkeys and moving averages based on the new metagraph."""
@@ -331,6 +423,7 @@ class BaseValidatorNeuron(BaseNeuron):
 
         # Sync the metagraph.
         self.metagraph.sync(subtensor=self.subtensor)
+        self.hyperparameters.observe_metagraph(self.metagraph)
 
         self.has_enough_stake = np.zeros(len(self.metagraph.hotkeys), dtype=np.float32)
 
@@ -363,22 +456,33 @@ class BaseValidatorNeuron(BaseNeuron):
         # Zero out all hotkeys that have been replaced.
         for uid, hotkey in enumerate(self.hotkeys):
             if hotkey != self.metagraph.hotkeys[uid]:
-                self.scores[uid] = 0  # hotkey has been replaced
+                self.scores[:, uid] = 0  # hotkey has been replaced
+                self.uid_scheduler.reset(uid)
+                self.miner_health.reset(uid)
 
         # Check to see if the metagraph has changed size.
         # If so, we need to add new hotkeys and moving averages.
         if len(self.hotkeys) < len(self.metagraph.hotkeys):
             # Update the size of the moving average scores.
-            new_moving_average = np.zeros((self.metagraph.n))
-            min_len = min(len(self.hotkeys), len(self.scores))
-            new_moving_average[:min_len] = self.scores[:min_len]
+            new_moving_average = np.zeros((len(self.tasks), self.metagraph.n), dtype=np.float32)
+            min_len = min(len(self.hotkeys), self.scores.shape[1])
+            new_moving_average[:, :min_len] = self.scores[:, :min_len]
             self.scores = new_moving_average
+            self.uid_scheduler.resize(self.metagraph.n.item())
+            self.miner_health.resize(self.metagraph.n.item())
 
         # Update the hotkeys.
         self.hotkeys = copy.deepcopy(self.metagraph.hotkeys)
 
-    def update_scores(self, rewards: np.ndarray, uids: List[int]):
-        """Performs exponential moving average on the scores based on the rewards received from the miners."""
+    def weighted_scores(self) -> np.ndarray:
+        """Returns the scores of every uid, the moving averages of the tasks combined by their reward weight."""
+        reward_weights = np.array([task.REWARD_WEIGHT for task in self.tasks], dtype=np.float32)
+        return reward_weights @ self.scores
+
+    def update_scores(self, rewards: np.ndarray, uids: List[int], task: tasks.ValidatorTask):
+        """
+        Performs exponential moving average on the scores of a task based on the rewards received from the miners.
+        """
 
         # Check if rewards contains NaN values.
         if np.isnan(rewards).any():
@@ -408,83 +512,190 @@ class BaseValidatorNeuron(BaseNeuron):
         rewards = rewards * self.has_enough_stake[uids_array]
         bt.logging.debug(f"Rewards after considering minimum miner alpha amount: {rewards.tolist()}")
 
-        # Update scores with rewards produced by this step.
+        # Update the scores of the task with rewards produced by this step.
+        row = self.tasks.index(task)
         alpha: float = self.config.neuron.moving_average_alpha
-        self.scores[uids_array] = alpha * rewards + (1 - alpha) * self.scores[uids_array]
-        bt.logging.debug(f"Updated moving avg scores: {self.scores.tolist()}")
+        self.scores[row, uids_array] = alpha * rewards + (1 - alpha) * self.scores[row, uids_array]
+        if is_log_level_enabled("debug"):
+            bt.logging.debug(f"Updated moving avg scores of {task.TASK_NAME}: {self.scores[row].tolist()}")
 
     def save_state(self):
-        """Saves the state of the validator to a file."""
+        """Snapshots the state of the validator, the checkpointer writes it to files in the background."""
         bt.logging.info("Saving validator state.")
 
-        # Save the state of the validator to file.
-        np.savez(
-            self.config.neuron.full_path + "/state.npz",
-            step=self.step,
-            scores=self.scores,
-            hotkeys=self.hotkeys,
-            has_enough_stake=self.has_enough_stake,
-        )
-        self.save_miner_history()
+        state = {
+            "step": self.step,
+            "scores": self.scores.copy(),
+            "task_names": [task.TASK_NAME for task in self.tasks],
+            "hotkeys": list(self.hotkeys),
+            "has_enough_stake": self.has_enough_stake.copy(),
+            "query_counts": self.uid_scheduler.query_counts.copy(),
+            "last_queried_step": self.uid_scheduler.last_queried_step.copy(),
+        }
+        self.checkpointer.save({"state.npz": npz_writer(state), **self._miner_history_files()})
+
+    def flush_checkpoints(self, timeout: float = 60):
+        if not self.checkpointer.flush(timeout):
+            bt.logging.warning("Timed out waiting for the validator state to be saved")
+        if self.step_recorder is not None and not self.step_recorder.close(timeout):
+            bt.logging.warning("Timed out waiting for the recorded steps to be written")
 
     def load_state(self):
-        """Loads the state of the validator from a file."""
+        """Loads the state of the validator, falling back to the older generations of the state if needed."""
         bt.logging.info("Loading validator state.")
 
-        # Load the state of the validator from file.
-        try:
-            state = np.load(self.config.neuron.full_path + "/state.npz")
+        state = None
+        self._state_generation = None
+        for path in self.checkpointer.candidates("state.npz"):
+            try:
+                with np.load(path) as npz:
+                    state = dict(npz)
+                self._state_generation = self.checkpointer.generation(path)
+                bt.logging.info(f"Loaded the validator state from generation {self._state_generation} ({path})")
+                break
+            except Exception as e:
+                bt.logging.warning(f"Failed to load the validator state from {path}: {e}")
+
+        if state is None:
+            bt.logging.warning("No state file found. Starting fresh!")
+            self.step = 0
+            self.has_enough_stake = np.ones(len(self.metagraph.hotkeys), dtype=np.float32)
+        else:
             self.step = state["step"]
-            self.scores = state["scores"]
+            self.scores = self._restore_scores(state["scores"], state.get("task_names"))
             self.hotkeys = state["hotkeys"]
-            if "has_enough_stake" in state.files:
+            if "has_enough_stake" in state:
                 self.has_enough_stake = state["has_enough_stake"]
             else:
                 self.has_enough_stake = np.ones(len(self.metagraph.hotkeys), dtype=np.float32)
-
-        except OSError:
-            bt.logging.warning("No state file found. Starting fresh!")
-            self.step = 0
-            self.has_enough_stake = np.ones(len(self.metagraph.hotkeys), dtype=np.float32)
+            if "query_counts" in state:
+                self.uid_scheduler.query_counts = state["query_counts"]
+                self.uid_scheduler.last_queried_step = state["last_queried_step"]
+                self.uid_scheduler.resize(self.metagraph.n.item())
 
         self.load_miner_history()
 
+    def _restore_scores(self, scores: np.ndarray, task_names: np.ndarray | None) -> np.ndarray:
+        """
+        Maps the saved score rows to the current tasks.
+
+        States saved before the scores were kept per task hold a single vector, which is copied to every task.
+        Tasks without a saved row start from the saved scores combined by reward weight.
+        """
+        if scores.ndim == 1:
+            bt.logging.info("Migrating the saved scores to per task scores.")
+            return np.tile(scores.astype(np.float32), (len(self.tasks), 1))
+
+        if task_names is None:
+            task_names = [task.TASK_NAME for task in self.tasks]
+        rows = {str(name): row for name, row in zip(task_names, scores, strict=True)}
+
+        reward_weights = {task.TASK_NAME: task.REWARD_WEIGHT for task in self.tasks}
+        combined = np.zeros(scores.shape[1], dtype=np.float32)
+        for name, row in rows.items():
+            combined += reward_weights.get(name, 0) * row
+        return np.stack([rows.get(task.TASK_NAME, combined) for task in self.tasks]).astype(np.float32)
+
+    @staticmethod
+    def _miner_history_name(task: tasks.ValidatorTask, extension: str = "pkl") -> str:
+        return f"{task.TASK_NAME}_performance_history.{extension}"
+
     def save_miner_history(self):
+        """
+        Snapshots the performance trackers, the checkpointer writes them in the background. The trackers are saved
+        every step, they only start a new generation with the validator state, see `save_state`.
+        """
+        files = self._miner_history_files()
+        if files:
+            self.checkpointer.save(files, rotate=False)
+
+    def _miner_history_files(self) -> dict:
+        # Saves made while the trackers are loading, e.g. by the initial sync, keep the saved ones as they are.
+        if not self._miner_history_loaded.is_set():
+            return {}
+        files = {}
         for task, tracker in self.performance_trackers.items():
-            path = os.path.join(self.config.neuron.full_path, f"{task.TASK_NAME}_performance_history.pkl")
-            joblib.dump(tracker, path)
+            files[self._miner_history_name(task)] = joblib_writer(tracker.snapshot())
+            # The header is written last, so it never describes a newer tracker than the pickled one.
+            files[self._miner_history_name(task, "json")] = json_writer(tracker.header())
+        return files
 
     def load_miner_history(self):
-        def load(path):
-            if os.path.exists(path):
-                bt.logging.info(f"Loading miner performance history from {path}")
+        """
+        Logs the saved tracker headers and loads the trackers in a background thread.
+
+        Use `wait_for_miner_history` before reading or updating the trackers.
+        """
+        self.wait_for_miner_history()
+        for task in self.tasks:
+            for header_path in self.checkpointer.candidates(self._miner_history_name(task, "json")):
                 try:
-                    tracker: PerformanceTracker = joblib.load(path)
-                    tracker.validate_storage_predictions_count()
-                    num_miners_history = len(
-                        [
-                            uid
-                            for uid in tracker.prediction_history
-                            if len([p for p in tracker.prediction_history[uid] if p != -1]) > 0
-                        ]
+                    with open(header_path) as f:
+                        header = json.load(f)
+                    bt.logging.info(
+                        f"Found miner performance history of {task.TASK_NAME} with predictions of "
+                        f"{header['num_miners_with_predictions']} miners (header version {header['version']}, "
+                        f"generation {self.checkpointer.generation(header_path)})"
                     )
-                    bt.logging.info(f"Loaded history for {num_miners_history} miners")
-                except Exception as e:
-                    bt.logging.error(f"Error loading miner performance tracker: {e}")
-                    tracker = PerformanceTracker()
-            else:
-                bt.logging.info(f"No miner performance history found at {path} - starting fresh!")
-                tracker = PerformanceTracker()
-            return tracker
+                    break
+                except (OSError, ValueError, KeyError):
+                    bt.logging.debug(f"Can't read the miner performance history header at {header_path}")
 
-        for task in self.tasks:
-            path = os.path.join(self.config.neuron.full_path, f"{task.TASK_NAME}_performance_history.pkl")
-            self.performance_trackers[task] = load(path)
+        self._miner_history_loaded.clear()
+        threading.Thread(target=self._load_miner_history, name="miner-history-loader", daemon=True).start()
+
+    def wait_for_miner_history(self, timeout: float | None = None) -> bool:
+        """Blocks until the performance trackers are loaded, returns False if the timeout expired first."""
+        return self._miner_history_loaded.wait(timeout)
+
+    def _load_miner_history(self):
+        started_at = time.perf_counter()
+        try:
+            for task in self.tasks:
+                tracker, path = self._load_performance_tracker(self.checkpointer.candidates(self._miner_history_name(task)))
+                self.performance_trackers[task] = tracker
+                if path is not None:
+                    self._log_miner_history_generation(task, self.checkpointer.generation(path))
+        finally:
+            self._miner_history_loaded.set()
+        bt.logging.info(f"Loaded miner performance history in {time.perf_counter() - started_at:.2f} seconds")
+
+    def _log_miner_history_generation(self, task: tasks.ValidatorTask, generation: int):
+        message = f"Loaded miner performance history of {task.TASK_NAME} from generation {generation}"
+        if self._state_generation is not None and generation != self._state_generation:
+            bt.logging.warning(f"{message}, the validator state from generation {self._state_generation}")
+        else:
+            bt.logging.info(message)
+
+    @staticmethod
+    def _load_performance_tracker(paths: list[str]) -> tuple[PerformanceTracker, str | None]:
+        """
+        Loads the first tracker that can be loaded from the given generations, newest first.
+
+        Returns:
+            tuple[PerformanceTracker, str | None]: The tracker and the path it was loaded from, None if it starts fresh.
+        """
+        import joblib  # noqa: PLC0415 - deferred to keep it out of the startup path
+
+        for path in paths:
+            bt.logging.info(f"Loading miner performance history from {path}")
+            try:
+                tracker: PerformanceTracker = joblib.load(path)
+                tracker.validate_storage_predictions_count()
+                bt.logging.info(f"Loaded history for {tracker.header()['num_miners_with_predictions']} miners")
+                return tracker, path
+            except Exception as e:
+                bt.logging.error(f"Error loading miner performance tracker from {path}: {e}")
+
+        bt.logging.info("No miner performance history found - starting fresh!")
+        return PerformanceTracker(), None
 
     def init_wandb(self):
         if self.config.wandb.off:
             return
 
+        import wandb  # noqa: PLC0415 - wandb takes seconds to import, only import it when it's on
+
         now = dt.datetime.now()
         self.wandb_run_start = now
         run_id = now.strftime("%Y-%m-%d_%H-%M-%S")
@@ -515,6 +726,14 @@ class BaseValidatorNeuron(BaseNeuron):
 
         bt.logging.success(f"Started wandb run {run_name}")
 
+    def finish_wandb(self):
+        """Logs the payloads still queued and finishes the wandb run."""
+        if not self.wandb_logger.flush(timeout=60):
+            bt.logging.warning("Timed out waiting for the queued wandb payloads to be logged")
+        self.wandb_run.finish()
+        # Article bodies logged to the finished run are logged again to the next one.
+        self.wandb_logger.new_run()
+
     def _validate_tasks(self):
         """
         Validates the tasks provided to the validator.
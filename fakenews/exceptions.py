@@ -11,3 +11,6 @@ class OpenAIClientError(ValidatorError): ...
 
 
 class OpenAIInternalError(ValidatorError): ...
+
+
+class CircuitOpenError(ValidatorError): ...
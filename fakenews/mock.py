@@ -1,10 +1,14 @@
 import asyncio
-import random
-import time
-from typing import List
+import uuid
+from http import HTTPStatus
+from typing import TYPE_CHECKING, List, Union
 
 import bittensor as bt
 
+if TYPE_CHECKING:
+    from fakenews.simulation.miners import MinerPopulation
+    from fakenews.simulation.services import ArticleLabels
+
 
 class MockSubtensor(bt.MockSubtensor):
     def __init__(self, netuid, n=16, wallet=None, network="mock"):
@@ -52,16 +56,46 @@ class MockMetagraph(bt.metagraph):
 
 class MockDendrite(bt.dendrite):
     """
-    Replaces a real bittensor network request with a mock request that just returns some
-    static response for all axons that are passed and adds some random delay.
+    Replaces a real bittensor network request with answers of simulated miners, see `MinerPopulation`.
+
+    Every axon gets the fake probabilities of its miner profile after a log-normal response time, and a profile can
+    also make its miner unreachable, never answer or answer with a malformed payload. A query sleeps until its slowest
+    answer or the timeout, once, whatever the number of axons, and the responses are shallow copies of the synapse.
+
+    Args:
+        wallet (bt.wallet | bt.Keypair): Wallet or keypair of the validator.
+        population (MinerPopulation | None): Simulated miners, the default profiles if unset.
+        labels (ArticleLabels | None): Labels of the articles to review, unknown articles get coin flips.
+        register_unknown (bool): Whether axons of hotkeys unknown to the population get a new miner, instead of being
+            unreachable.
     """
 
-    def __init__(self, wallet):
-        super().__init__(wallet)
+    def __init__(
+        self,
+        wallet,
+        population: "MinerPopulation | None" = None,
+        labels: "ArticleLabels | None" = None,
+        *,
+        register_unknown: bool = True,
+    ):
+        # Skips bt.dendrite.__init__, which looks the external IP up over the network.
+        self.uuid = str(uuid.uuid1())
+        self.external_ip = "127.0.0.1"
+        self.keypair = getattr(wallet, "hotkey", wallet)
+        self.synapse_history: list = []
+        self._session = None
+
+        if population is None:
+            from fakenews.simulation.miners import MinerPopulation  # noqa: PLC0415 - keeps it off the validator imports
+
+            population = MinerPopulation()
+        self.population = population
+        self.labels = labels
+        self.register_unknown = register_unknown
 
     async def forward(
         self,
-        axons: List[bt.axon],
+        axons: List[Union[bt.AxonInfo, bt.axon]],
         synapse: bt.Synapse = bt.Synapse(),  # noqa: B008
         timeout: float = 12,
         *,
@@ -72,40 +106,65 @@ class MockDendrite(bt.dendrite):
         if streaming:
             raise NotImplementedError("Streaming not implemented yet.")
 
-        async def query_all_axons(streaming: bool):  # noqa: FBT001
-            """Queries all axons for responses."""
-
-            async def single_axon_response(i, axon):
-                """Queries a single axon for a response."""
-
-                start_time = time.time()
-                s = synapse.copy()
-                # Attach some more required data so it looks real
-                s = self.preprocess_synapse_for_request(axon, s, timeout)
-                # We just want to mock the response, so we'll just fill in some data
-                process_time = random.random()  # noqa: S311
-                if process_time < timeout:
-                    s.dendrite.process_time = str(time.time() - start_time)
-                    # Update the status code and status message of the dendrite to match the axon
-                    # TODO (developer): replace with your own expected synapse data
-                    s.dummy_output = s.dummy_input * 2
-                    s.dendrite.status_code = 200
-                    s.dendrite.status_message = "OK"
-                    synapse.dendrite.process_time = str(process_time)
-                else:
-                    s.dummy_output = 0
-                    s.dendrite.status_code = 408
-                    s.dendrite.status_message = "Timeout"
-                    synapse.dendrite.process_time = str(timeout)
-
-                # Return the updated synapse object after deserializing if requested
-                if deserialize:
-                    return s.deserialize()
-                return s
-
-            return await asyncio.gather(*(single_axon_response(i, target_axon) for i, target_axon in enumerate(axons)))
-
-        return await query_all_axons(streaming)
+        # The labels are looked up once for all the axons.
+        articles = getattr(synapse, "articles_to_review", [])
+        labels = [self.labels.get(article) for article in articles] if self.labels else [None] * len(articles)
+
+        responses, delays = [], []
+        for axon in axons:
+            response, delay = self._respond(axon.info() if isinstance(axon, bt.axon) else axon, synapse, labels, timeout)
+            responses.append(response)
+            delays.append(delay)
+
+        # Concurrent queries return with the slowest one, sequential ones add up.
+        delay = max(delays, default=0.0) if run_async else sum(delays)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        return [response.deserialize() for response in responses] if deserialize else responses
+
+    def _respond(
+        self, axon: bt.AxonInfo, synapse: bt.Synapse, labels: list[float | None], timeout: float
+    ) -> tuple[bt.Synapse, float]:
+        """The response of the miner of the axon and how long it takes to arrive."""
+        miner = self.population.miners.get(axon.hotkey)
+        if miner is None and self.register_unknown:
+            miner = self.population.add(axon.hotkey)
+
+        latency = None if miner is None else self.population.latency(miner)
+        if latency is None:
+            return self._response(synapse, axon, timeout, HTTPStatus.SERVICE_UNAVAILABLE, 0.0), 0.0
+        if latency >= timeout:
+            return self._response(synapse, axon, timeout, HTTPStatus.REQUEST_TIMEOUT, timeout), timeout
+
+        probabilities = self.population.predict(miner, labels)
+        if self.population.is_malformed(miner):
+            probabilities = self.population.malformed(probabilities)
+        return self._response(synapse, axon, timeout, HTTPStatus.OK, latency, fake_probabilities=probabilities), latency
+
+    def _response(
+        self,
+        synapse: bt.Synapse,
+        axon: bt.AxonInfo,
+        timeout: float,
+        status: HTTPStatus,
+        process_time: float,
+        **fields,
+    ) -> bt.Synapse:
+        # A shallow copy, the request fields are shared with every response.
+        return synapse.model_copy(
+            update={
+                **fields,
+                "timeout": timeout,
+                "dendrite": bt.TerminalInfo(
+                    status_code=int(status),
+                    status_message=status.phrase,
+                    process_time=process_time,
+                    hotkey=self.keypair.ss58_address,
+                ),
+                "axon": bt.TerminalInfo(status_code=int(status), hotkey=axon.hotkey, ip=axon.ip, port=axon.port),
+            }
+        )
 
     def __str__(self) -> str:
         """
@@ -0,0 +1,197 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from enum import Enum
+
+import bittensor as bt
+
+from fakenews.exceptions import CircuitOpenError
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker guarding calls to an upstream service.
+
+    While closed, the outcomes of the last `window_size` calls are tracked and the circuit opens once at least
+    `minimum_calls` were made and the failure rate reaches `failure_rate_threshold`. While open, calls fail fast with
+    `CircuitOpenError` until the next probe is scheduled. Then the circuit becomes half-open and lets
+    `half_open_max_calls` probe calls through: a successful probe closes the circuit, a failed one opens it again and
+    doubles the time until the next probe, up to `max_open_timeout`. Probes still in flight once the first one settled
+    the state count as regular calls.
+
+    `is_failure` tells which exceptions count against the service, by default all of them. Others, e.g. the service
+    rejecting a request, count as successful calls since the service answered.
+
+    Usage:
+        with breaker.guard():
+            await call_service()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        minimum_calls: int = 4,
+        window_size: int = 10,
+        open_timeout: float = 30.0,
+        max_open_timeout: float = 600.0,
+        half_open_max_calls: int = 1,
+        is_failure: Callable[[Exception], bool] | None = None,
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.open_timeout = open_timeout
+        self.max_open_timeout = max_open_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.is_failure = is_failure
+
+        self._lock = threading.Lock()
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._state = CircuitState.CLOSED
+        self._current_open_timeout = open_timeout
+        self._next_probe_at = 0.0
+        self._probes_in_flight = 0
+        self._times_opened = 0
+        self._rejected_calls = 0
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """
+        Guards a single call to the service.
+
+        Raises:
+            CircuitOpenError: If the circuit is open and the call is not allowed through as a probe.
+        """
+        is_probe = self._acquire()
+        try:
+            yield
+        except Exception as e:
+            self._record(success=self.is_failure is not None and not self.is_failure(e), is_probe=is_probe)
+            raise
+        except BaseException:
+            # Cancellations and interrupts say nothing about the health of the service.
+            self._release(is_probe)
+            raise
+        self._record(success=True, is_probe=is_probe)
+
+    def snapshot(self) -> dict:
+        """Returns the breaker state for monitoring."""
+        with self._lock:
+            calls = len(self._outcomes)
+            return {
+                "state": self._state.value,
+                "calls": calls,
+                "failure_rate": self._failure_rate(),
+                "times_opened": self._times_opened,
+                "rejected_calls": self._rejected_calls,
+                "next_probe_in": max(0.0, self._next_probe_at - time.monotonic())
+                if self._state == CircuitState.OPEN
+                else 0.0,
+            }
+
+    def _acquire(self) -> bool:
+        with self._lock:
+            if self._state == CircuitState.OPEN:
+                retry_in = self._next_probe_at - time.monotonic()
+                if retry_in > 0:
+                    self._rejected_calls += 1
+                    raise CircuitOpenError(f"Circuit {self.name} is open, next probe in {retry_in:.0f}s")
+                self._transition(CircuitState.HALF_OPEN)
+
+            if self._state == CircuitState.HALF_OPEN:
+                if self._probes_in_flight >= self.half_open_max_calls:
+                    self._rejected_calls += 1
+                    raise CircuitOpenError(f"Circuit {self.name} is half-open, waiting for the probe result")
+                self._probes_in_flight += 1
+                return True
+
+            return False
+
+    def _release(self, is_probe: bool):  # noqa: FBT001
+        if is_probe:
+            with self._lock:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def _record(self, success: bool, is_probe: bool):  # noqa: FBT001
+        with self._lock:
+            if is_probe:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if is_probe and self._state == CircuitState.HALF_OPEN:
+                if success:
+                    self._outcomes.clear()
+                    self._current_open_timeout = self.open_timeout
+                    self._transition(CircuitState.CLOSED)
+                else:
+                    self._current_open_timeout = min(self._current_open_timeout * 2, self.max_open_timeout)
+                    self._open()
+                return
+
+            self._outcomes.append(success)
+            if (
+                self._state == CircuitState.CLOSED
+                and len(self._outcomes) >= self.minimum_calls
+                and self._failure_rate() >= self.failure_rate_threshold
+            ):
+                self._open()
+
+    def _open(self):
+        self._times_opened += 1
+        self._next_probe_at = time.monotonic() + self._current_open_timeout
+        self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState):
+        if state == self._state:
+            return
+        self._state = state
+        if state == CircuitState.OPEN:
+            bt.logging.warning(f"Circuit {self.name} opened, failing fast for the next {self._current_open_timeout:.0f}s")
+        else:
+            bt.logging.info(f"Circuit {self.name} is {state.value}")
+
+    def _failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+
+_CIRCUIT_BREAKERS: dict[str, CircuitBreaker] = {}
+# Options each breaker was created with, to tell when a later client asks for different ones.
+_CIRCUIT_BREAKER_OPTIONS: dict[str, dict] = {}
+_CIRCUIT_BREAKERS_LOCK = threading.Lock()
+
+
+def get_circuit_breaker(name: str, **kwargs) -> CircuitBreaker:
+    """
+    Returns the process-wide circuit breaker for a service, creating it on first use, so all clients
+    of the same service share its state. The breaker keeps the options it was created with, a warning is logged when
+    they differ from the requested ones.
+    """
+    with _CIRCUIT_BREAKERS_LOCK:
+        if name not in _CIRCUIT_BREAKERS:
+            _CIRCUIT_BREAKERS[name] = CircuitBreaker(name, **kwargs)
+            _CIRCUIT_BREAKER_OPTIONS[name] = kwargs
+        elif kwargs != _CIRCUIT_BREAKER_OPTIONS[name]:
+            bt.logging.warning(
+                f"Circuit {name} was created with {_CIRCUIT_BREAKER_OPTIONS[name]}, ignoring the options {kwargs}"
+            )
+        return _CIRCUIT_BREAKERS[name]
+
+
+def circuit_breakers_snapshot() -> dict[str, dict]:
+    """Returns the state of every registered circuit breaker."""
+    with _CIRCUIT_BREAKERS_LOCK:
+        breakers = list(_CIRCUIT_BREAKERS.values())
+    return {breaker.name: breaker.snapshot() for breaker in breakers}
@@ -1,18 +1,27 @@
-import traceback
+import asyncio
 from http import HTTPStatus
 from typing import TYPE_CHECKING
 
 import bittensor as bt
-from aiohttp import BasicAuth, ClientSession, ClientTimeout
+from aiohttp import BasicAuth, ClientError, ClientResponseError, ClientSession, ClientTimeout
 
+from fakenews.exceptions import CircuitOpenError
 from fakenews.schemas import ArticleResponseModel
+from fakenews.services.circuit_breaker import get_circuit_breaker
 
 if TYPE_CHECKING:
     from substrateinterface import Keypair
 
 
+def _is_outage(error: Exception) -> bool:
+    """Whether the error says the news API is down, rejected requests (4xx) don't."""
+    if isinstance(error, ClientResponseError):
+        return error.status >= HTTPStatus.INTERNAL_SERVER_ERROR
+    return isinstance(error, (ClientError, asyncio.TimeoutError))
+
+
 class NewsAPIClient:
-    __slots__ = ["_auth"]
+    __slots__ = ["_auth", "_dataset_breaker", "_fetch_breaker"]
 
     BASE_URL = "http://84.32.185.173:8000"
     GET_ARTICLE_URL = f"{BASE_URL}/articles/random"
@@ -22,38 +31,44 @@ class NewsAPIClient:
         hotkey = keypair.ss58_address
         signature = f"0x{keypair.sign(hotkey).hex()}"
         self._auth = BasicAuth(hotkey, signature)
+        # Separate circuits, failing dataset uploads shouldn't stop the article fetching.
+        self._fetch_breaker = get_circuit_breaker("news_api", is_failure=_is_outage)
+        self._dataset_breaker = get_circuit_breaker("news_api_dataset", is_failure=_is_outage)
 
     async def fetch_article(self) -> ArticleResponseModel | None:
-        try:
-            async with (
-                ClientSession() as session,
-                session.get(
-                    self.GET_ARTICLE_URL,
-                    auth=self._auth,
-                ) as response,
-            ):
-                if response.status == HTTPStatus.UNAUTHORIZED:
-                    details = await response.json()
-                    raise Exception(f"Unauthorized: {details}")
-
-                response.raise_for_status()
-                article: ArticleResponseModel = await response.json(loads=ArticleResponseModel.model_validate_json)
-                return article
+        # Raises CircuitOpenError right away while the news API is considered down.
+        with self._fetch_breaker.guard():
+            try:
+                async with (
+                    ClientSession() as session,
+                    session.get(
+                        self.GET_ARTICLE_URL,
+                        auth=self._auth,
+                    ) as response,
+                ):
+                    if response.status == HTTPStatus.UNAUTHORIZED:
+                        details = await response.json()
+                        raise Exception(f"Unauthorized: {details}")
 
-        except BaseException as e:
-            bt.logging.warning(f"Error while getting article: {e}")
-            traceback.print_exc()
-            raise e
+                    response.raise_for_status()
+                    article: ArticleResponseModel = await response.json(loads=ArticleResponseModel.model_validate_json)
+                    return article
+
+            except BaseException as e:
+                bt.logging.warning(f"Error while getting article: {e}")
+                raise e
 
     async def save_articles_dataset(self, dataset: dict) -> None:
         try:
-            async with (
-                ClientSession() as session,
-                session.post(
-                    self.SAVE_ARTICLES_DATASET_URL, auth=self._auth, json=dataset, timeout=ClientTimeout(3)
-                ) as response,
-            ):
-                response.raise_for_status()
+            with self._dataset_breaker.guard():
+                async with (
+                    ClientSession() as session,
+                    session.post(
+                        self.SAVE_ARTICLES_DATASET_URL, auth=self._auth, json=dataset, timeout=ClientTimeout(3)
+                    ) as response,
+                ):
+                    response.raise_for_status()
+        except CircuitOpenError as e:
+            bt.logging.warning(f"Skipping dataset saving: {e}")
         except BaseException as e:
             bt.logging.warning(f"Error while saving dataset: {e}")
-            traceback.print_exc()
@@ -1,38 +1,54 @@
+import asyncio
+
 from bittensor import logging
-from openai import APIStatusError, AsyncOpenAI, InternalServerError
+from openai import APIConnectionError, APIStatusError, AsyncOpenAI, InternalServerError
 
 from fakenews.exceptions import OpenAIClientError, OpenAIInternalError
+from fakenews.services.circuit_breaker import get_circuit_breaker
 
 from .prompts import Prompt
 
 
+def _is_outage(error: Exception) -> bool:
+    """Whether the error says OpenAI is down, rejected requests (bad key, no balance, 4xx) don't."""
+    return isinstance(error, (OpenAIInternalError, APIConnectionError, asyncio.TimeoutError))
+
+
 class OpenAIClient(AsyncOpenAI):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, concurrent_prompts: int = 1, **kwargs):
+        """
+        Args:
+            concurrent_prompts (int): Number of prompts sent together, all of them are let through as probes while
+                the circuit is half-open.
+        """
         if not kwargs.get("api_key"):
             raise ValueError("OpenAI API key is required.")
         super().__init__(*args, **kwargs)
+        self._breaker = get_circuit_breaker("openai", half_open_max_calls=concurrent_prompts, is_failure=_is_outage)
 
     async def get_prompt_completions_async(self, prompt: Prompt) -> str:
         result = await self._get_completions_async(prompt.generate_messages(), prompt.TARGET_MODEL)
         return prompt.normalize_result(result)
 
     async def _get_completions_async(self, messages: list[dict], model: str) -> str:
-        try:
-            completions = await self.chat.completions.create(
-                model=model,
-                messages=messages,
-            )
-            response = completions.choices[0].message.content
-        except InternalServerError as e:
-            logging.error(f"Open AI is unavailable: {e}")
-            raise OpenAIInternalError from e
-
-        except APIStatusError as e:
-            logging.error(f"Failed to access OpenAI API. Check your API key balance or permission: {e}")
-            raise OpenAIClientError from e
-
-        except BaseException as e:
-            logging.error(f"Failed to get completions from OpenAI: {e}")
-            raise e
+        # Raises CircuitOpenError right away while OpenAI is considered down.
+        with self._breaker.guard():
+            try:
+                completions = await self.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                )
+                response = completions.choices[0].message.content
+            except InternalServerError as e:
+                logging.error(f"Open AI is unavailable: {e}")
+                raise OpenAIInternalError from e
+
+            except APIStatusError as e:
+                logging.error(f"Failed to access OpenAI API. Check your API key balance or permission: {e}")
+                raise OpenAIClientError from e
+
+            except BaseException as e:
+                logging.error(f"Failed to get completions from OpenAI: {e}")
+                raise e
 
         return response
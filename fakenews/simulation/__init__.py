@@ -0,0 +1,19 @@
+from .chain import SimulatedMetagraph, SimulatedSubtensor
+from .clock import VirtualBlockTracker, VirtualClock, VirtualEventLoop
+from .miners import DEFAULT_PROFILES, MinerPopulation, MinerProfile, load_profiles
+from .services import ArticleLabels, SyntheticLLMClient, SyntheticNewsAPIClient
+
+__all__ = [
+    "DEFAULT_PROFILES",
+    "ArticleLabels",
+    "MinerPopulation",
+    "MinerProfile",
+    "SimulatedMetagraph",
+    "SimulatedSubtensor",
+    "SyntheticLLMClient",
+    "SyntheticNewsAPIClient",
+    "VirtualBlockTracker",
+    "VirtualClock",
+    "VirtualEventLoop",
+    "load_profiles",
+]
@@ -0,0 +1,23 @@
+"""
+Runs the validator against a simulated network on a virtual clock.
+
+    python -m fakenews.simulation [--simulation.steps N] [--simulation.miners N] [--simulation.profiles FILE]
+        [--simulation.churn P] [--simulation.llm_latency SECONDS] [--simulation.seed N] [--neuron.* ...]
+
+Prints the throughput and how the weights set at the end relate to the accuracy of the simulated miners.
+"""
+
+import sys
+
+from fakenews.simulation.validator import SimulatedValidator
+
+
+def main() -> int:
+    validator = SimulatedValidator()
+    report = validator.simulate(validator.config.simulation.steps)
+    sys.stdout.write("\n".join(report.lines()) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+from types import SimpleNamespace
+
+import bittensor as bt
+import numpy as np
+
+from fakenews.base.utils.min_miners_alpha import calculate_minimum_miner_alpha
+from fakenews.simulation.clock import VirtualClock
+from fakenews.simulation.miners import MinerPopulation
+
+
+class SimulatedSubtensor:
+    """
+    In-process chain of a single subnet, with the subtensor methods the validator uses.
+
+    The validator is registered at uid 0 and the simulated miners at the following uids. Weights set by the
+    validator are kept in `weights` and update its `last_update` block, as on chain.
+    """
+
+    MIN_ALLOWED_WEIGHTS: int = 8
+    MAX_WEIGHT_LIMIT: float = 1.0
+    VALIDATOR_STAKE: float = 100_000.0
+
+    chain_endpoint = "simulation"
+
+    def __init__(
+        self,
+        clock: VirtualClock,
+        population: MinerPopulation,
+        netuid: int,
+        validator_hotkey: str,
+        num_miners: int,
+    ):
+        self.clock = clock
+        self.population = population
+        self.netuid = netuid
+
+        n = num_miners + 1
+        self.hotkeys = [validator_hotkey] + [""] * num_miners
+        self.coldkeys = ["sim-validator-coldkey"] + [""] * num_miners
+        self.stakes = np.zeros(n, dtype=np.float32)
+        self.stakes[0] = self.VALIDATOR_STAKE
+        self.last_update = np.zeros(n, dtype=np.int64)
+        self.weights = np.zeros(n, dtype=np.float32)
+        self.weights_set = 0
+        self.replaced = 0
+
+        for uid in range(1, n):
+            self.register(uid)
+
+    @property
+    def n(self) -> int:
+        return len(self.hotkeys)
+
+    def register(self, uid: int):
+        """Registers a new miner at the given uid, replacing the previous one."""
+        self.population.retire(self.hotkeys[uid])
+        miner = self.population.spawn(uid)
+        self.hotkeys[uid] = miner.hotkey
+        self.coldkeys[uid] = f"{miner.hotkey}-coldkey"
+        # Enough stake to pass the minimum miner alpha for a while.
+        self.stakes[uid] = 10 * calculate_minimum_miner_alpha()
+        self.last_update[uid] = self.clock.block
+
+    def churn(self, rate: float):
+        """Replaces one random miner with probability `rate`."""
+        if rate > 0 and self.population.rng.random() < rate:
+            self.register(int(self.population.rng.integers(1, self.n)))
+            self.replaced += 1
+
+    def get_current_block(self) -> int:
+        return self.clock.block
+
+    def is_hotkey_registered(self, netuid: int, hotkey_ss58: str) -> bool:
+        return netuid == self.netuid and hotkey_ss58 in self.hotkeys
+
+    def metagraph(self, netuid: int) -> "SimulatedMetagraph":
+        metagraph = SimulatedMetagraph(netuid)
+        metagraph.sync(subtensor=self)
+        return metagraph
+
+    def get_stake_for_coldkey(self, coldkey: str) -> list[SimpleNamespace]:
+        return [
+            SimpleNamespace(netuid=self.netuid, stake=bt.Balance.from_tao(float(self.stakes[uid])))
+            for uid, uid_coldkey in enumerate(self.coldkeys)
+            if uid_coldkey == coldkey
+        ]
+
+    def min_allowed_weights(self, netuid: int) -> int:
+        return self.MIN_ALLOWED_WEIGHTS
+
+    def max_weight_limit(self, netuid: int) -> float:
+        return self.MAX_WEIGHT_LIMIT
+
+    def serve_axon(self, netuid: int, axon: "bt.axon") -> bool:
+        return True
+
+    def set_weights(self, wallet: "bt.wallet", netuid: int, uids, weights, **kwargs) -> tuple[bool, str]:
+        uid = self.hotkeys.index(wallet.hotkey.ss58_address)
+        self.weights = np.zeros(self.n, dtype=np.float32)
+        self.weights[np.asarray(uids, dtype=np.int64)] = np.asarray(weights, dtype=np.float32)
+        total = self.weights.sum()
+        if total > 0:
+            self.weights /= total
+        self.last_update[uid] = self.clock.block
+        self.weights_set += 1
+        return True, ""
+
+
+class SimulatedMetagraph:
+    """Metagraph of a `SimulatedSubtensor`, only updated by `sync`."""
+
+    def __init__(self, netuid: int):
+        self.netuid = netuid
+        self.hotkeys: list[str] = []
+        self.coldkeys: list[str] = []
+        self.axons: list[bt.AxonInfo] = []
+        self.n = np.int64(0)
+        self.uids = np.zeros(0, dtype=np.int64)
+        self.S = np.zeros(0, dtype=np.float32)
+        self.validator_permit = np.zeros(0, dtype=bool)
+        self.last_update = np.zeros(0, dtype=np.int64)
+
+    def sync(self, subtensor: SimulatedSubtensor, **kwargs):
+        self.hotkeys = list(subtensor.hotkeys)
+        self.coldkeys = list(subtensor.coldkeys)
+        self.axons = [
+            bt.AxonInfo(version=1, ip="127.0.0.1", port=8091 + uid, ip_type=4, hotkey=hotkey, coldkey=coldkey)
+            for uid, (hotkey, coldkey) in enumerate(zip(self.hotkeys, self.coldkeys, strict=True))
+        ]
+        self.n = np.int64(subtensor.n)
+        self.uids = np.arange(subtensor.n, dtype=np.int64)
+        self.S = subtensor.stakes.copy()
+        self.validator_permit = np.arange(subtensor.n) == 0
+        self.last_update = subtensor.last_update.copy()
+
+    def __str__(self) -> str:
+        return f"SimulatedMetagraph(netuid:{self.netuid}, n:{int(self.n)})"
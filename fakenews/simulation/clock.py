@@ -0,0 +1,111 @@
+import asyncio
+import selectors
+
+from fakenews.utils.block_tracker import BlockTracker
+
+
+class VirtualClock:
+    """
+    Simulated time, it only moves when advanced, by the simulation or by an event loop waiting for a timer.
+
+    Blocks are derived from the time, one every BLOCK_TIME seconds.
+    """
+
+    BLOCK_TIME: float = BlockTracker.BLOCK_TIME
+
+    def __init__(self, start_time: float = 1_700_000_000.0, start_block: int = 1_000_000):
+        self.start_time = start_time
+        self.start_block = start_block
+        self._elapsed = 0.0
+
+    def monotonic(self) -> float:
+        return self._elapsed
+
+    def time(self) -> float:
+        return self.start_time + self._elapsed
+
+    @property
+    def block(self) -> int:
+        return self.start_block + int(self._elapsed // self.BLOCK_TIME)
+
+    def advance(self, seconds: float):
+        if seconds > 0:
+            self._elapsed += seconds
+
+
+class _VirtualSelector(selectors.BaseSelector):
+    """Polls the real selector without blocking and advances the clock instead of waiting for a timer."""
+
+    def __init__(self, clock: VirtualClock):
+        self._clock = clock
+        self._selector = selectors.DefaultSelector()
+
+    def register(self, fileobj, events, data=None):
+        return self._selector.register(fileobj, events, data)
+
+    def unregister(self, fileobj):
+        return self._selector.unregister(fileobj)
+
+    def modify(self, fileobj, events, data=None):
+        return self._selector.modify(fileobj, events, data)
+
+    def select(self, timeout=None):
+        if timeout is None:
+            # Nothing scheduled, only another thread can wake the loop up, so wait for it for real.
+            return self._selector.select(None)
+        # Skips the syscall otherwise, wake-ups from other threads are picked up once nothing is scheduled.
+        self._clock.advance(timeout)
+        return []
+
+    def close(self):
+        self._selector.close()
+
+    def get_map(self):
+        return self._selector.get_map()
+
+
+class VirtualEventLoop(asyncio.SelectorEventLoop):
+    """
+    Event loop running on a virtual clock, `asyncio.sleep` and timeouts return as soon as nothing else is runnable.
+
+    Work done on other threads, e.g. `asyncio.to_thread`, still takes real time, the clock doesn't move meanwhile
+    unless a timer is due.
+    """
+
+    def __init__(self, clock: VirtualClock):
+        super().__init__(selector=_VirtualSelector(clock))
+        self.clock = clock
+
+    def time(self) -> float:
+        return self.clock.monotonic()
+
+
+class VirtualBlockTracker(BlockTracker):
+    """Reads the block from a virtual clock instead of following a chain."""
+
+    def __init__(self, clock: VirtualClock):
+        super().__init__(lambda: None)
+        self.clock = clock
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    @property
+    def block(self) -> int:
+        return self.clock.block
+
+    def wait_for_block_sync(self, block: int, timeout: float | None = None) -> int:
+        wait = (block - self.clock.block) * self.BLOCK_TIME
+        self.clock.advance(wait if timeout is None else min(wait, timeout))
+        return self.clock.block
+
+    async def wait_for_block(self, block: int, timeout: float | None = None) -> int:  # noqa: ASYNC109
+        wait = (block - self.clock.block) * self.BLOCK_TIME
+        if timeout is not None and wait > timeout:
+            await asyncio.sleep(timeout)
+            raise asyncio.TimeoutError
+        await asyncio.sleep(max(wait, 0.0))
+        return self.clock.block
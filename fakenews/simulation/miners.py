@@ -0,0 +1,151 @@
+import json
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class MinerProfile:
+    """
+    Behaviour of a kind of simulated miner.
+
+    Attributes:
+        name (str): Name the results are grouped by.
+        share (float): Relative share of the population with this profile.
+        accuracy (float): Mean probability to classify an article right, every miner draws its own around it.
+        accuracy_spread (float): Standard deviation of the accuracy across the miners of the profile.
+        latency_median (float): Median response time in seconds.
+        latency_sigma (float): Shape of the log-normal response time, higher values give heavier tails.
+        unreachable_rate (float): Probability that a query doesn't reach the miner at all.
+        timeout_rate (float): Probability that the miner accepts a query but never answers it.
+        malformed_rate (float): Probability that an answer doesn't follow the protocol, e.g. of the wrong length or
+            holding values out of [0, 1].
+    """
+
+    name: str
+    share: float = 1.0
+    accuracy: float = 0.7
+    accuracy_spread: float = 0.05
+    latency_median: float = 3.0
+    latency_sigma: float = 0.5
+    unreachable_rate: float = 0.0
+    timeout_rate: float = 0.0
+    malformed_rate: float = 0.0
+
+
+DEFAULT_PROFILES: tuple[MinerProfile, ...] = (
+    MinerProfile("strong", share=0.2, accuracy=0.9, latency_median=4.0),
+    MinerProfile("average", share=0.5, accuracy=0.75, latency_median=3.0, latency_sigma=0.8),
+    MinerProfile("random", share=0.2, accuracy=0.5, accuracy_spread=0.0, latency_median=0.5),
+    MinerProfile(
+        "flaky",
+        share=0.1,
+        accuracy=0.7,
+        latency_median=6.0,
+        latency_sigma=1.2,
+        unreachable_rate=0.3,
+        timeout_rate=0.05,
+        malformed_rate=0.05,
+    ),
+)
+
+
+def load_profiles(path: str) -> list[MinerProfile]:
+    """Reads a JSON list of profiles, every item holding the fields of `MinerProfile`."""
+    with open(path) as f:
+        return [MinerProfile(**profile) for profile in json.load(f)]
+
+
+@dataclass(frozen=True)
+class SimulatedMiner:
+    hotkey: str
+    profile: MinerProfile
+    accuracy: float
+
+
+class MinerPopulation:
+    """Draws simulated miners from weighted profiles and samples their answers."""
+
+    def __init__(self, profiles: list[MinerProfile] | tuple[MinerProfile, ...] = DEFAULT_PROFILES, seed: int = 0):
+        if not profiles:
+            raise ValueError("At least one miner profile is required")
+
+        self.profiles = list(profiles)
+        self.miners: dict[str, SimulatedMiner] = {}
+        self.rng = np.random.default_rng(seed)
+
+        shares = np.array([profile.share for profile in self.profiles], dtype=np.float64)
+        self._shares = shares / shares.sum()
+        self._spawned = 0
+
+    def spawn(self, uid: int) -> SimulatedMiner:
+        """Registers a new miner with a fresh hotkey for the given uid."""
+        miner = self.add(f"sim-miner-{uid}-{self._spawned}")
+        self._spawned += 1
+        return miner
+
+    def add(self, hotkey: str) -> SimulatedMiner:
+        """Registers a miner with the given hotkey, its profile drawn by share."""
+        profile = self.profiles[self.rng.choice(len(self.profiles), p=self._shares)]
+        accuracy = float(np.clip(self.rng.normal(profile.accuracy, profile.accuracy_spread), 0.0, 1.0))
+        miner = SimulatedMiner(hotkey, profile, accuracy)
+        self.miners[hotkey] = miner
+        return miner
+
+    def retire(self, hotkey: str):
+        self.miners.pop(hotkey, None)
+
+    def predict(self, miner: SimulatedMiner, labels: list[float | None]) -> list[float]:
+        """
+        Fake probabilities of a miner for articles with the given labels.
+
+        Every article is classified right with the accuracy of the miner, with a confidence drawn uniformly between
+        0.5 and 1. Articles of unknown label get a coin flip.
+        """
+        confidences = self.rng.uniform(0.5, 1.0, size=len(labels))
+        correct = self.rng.random(len(labels)) < miner.accuracy
+        coin_flips = self.rng.integers(0, 2, size=len(labels)).astype(bool)
+        probabilities = []
+        for label, confidence, is_correct, coin_flip in zip(labels, confidences, correct, coin_flips, strict=True):
+            is_fake = coin_flip if label is None else round(label) == 1
+            probabilities.append(float(confidence if is_fake == is_correct else 1 - confidence))
+        return probabilities
+
+    def latency(self, miner: SimulatedMiner) -> float | None:
+        """
+        Response time of a query in seconds, None if the query doesn't reach the miner and infinite if the miner never
+        answers it.
+        """
+        profile = miner.profile
+        if profile.unreachable_rate and self.rng.random() < profile.unreachable_rate:
+            return None
+        if profile.timeout_rate and self.rng.random() < profile.timeout_rate:
+            return math.inf
+        return float(profile.latency_median * np.exp(profile.latency_sigma * self.rng.standard_normal()))
+
+    def is_malformed(self, miner: SimulatedMiner) -> bool:
+        """Whether the next answer of the miner breaks the protocol."""
+        rate = miner.profile.malformed_rate
+        return bool(rate) and self.rng.random() < rate
+
+    def malformed(self, probabilities: list[float]) -> list:
+        """
+        Breaks well-formed probabilities the way a faulty miner would: one missing, one out of [0, 1], one NaN or one
+        not a number at all.
+        """
+        broken = list(probabilities)
+        if not broken:
+            return [0.5]
+
+        index = int(self.rng.integers(len(broken)))
+        kind = self.rng.choice(["missing", "out_of_range", "nan", "not_a_number"])
+        if kind == "missing":
+            del broken[index]
+        elif kind == "out_of_range":
+            broken[index] += float(self.rng.choice([-1.0, 1.0]))
+        elif kind == "nan":
+            broken[index] = math.nan
+        else:
+            broken[index] = str(broken[index])
+        return broken
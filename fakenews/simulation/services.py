@@ -0,0 +1,78 @@
+import asyncio
+from collections import OrderedDict
+
+import numpy as np
+
+from fakenews.schemas import ArticleResponseModel
+from fakenews.services.openai.prompts import ValidatorPrompt
+
+_WORDS = [
+    "government", "council", "minister", "report", "market", "city", "election", "court", "police", "company",
+    "energy", "climate", "school", "hospital", "river", "storm", "budget", "agreement", "investigation", "festival",
+    "team", "season", "study", "researchers", "officials", "residents",
+]  # fmt: skip
+
+
+class ArticleLabels:
+    """Labels of the last `size` generated articles by body, what the simulated miners are scored against."""
+
+    def __init__(self, size: int = 10_000):
+        self.size = size
+        self._labels: OrderedDict[str, float] = OrderedDict()
+
+    def add(self, body: str, label: float):
+        self._labels[body] = label
+        if len(self._labels) > self.size:
+            self._labels.popitem(last=False)
+
+    def get(self, body: str) -> float | None:
+        return self._labels.get(body)
+
+
+class SyntheticNewsAPIClient:
+    """In-process stand-in for `NewsAPIClient`, serving random articles and counting the saved dataset records."""
+
+    def __init__(self, seed: int = 0, article_words: int = 300):
+        self.rng = np.random.default_rng(seed)
+        self.article_words = article_words
+        self.fetched = 0
+        self.saved = 0
+
+    async def fetch_article(self) -> ArticleResponseModel:
+        self.fetched += 1
+        words = self.rng.choice(_WORDS, size=self.article_words)
+        return ArticleResponseModel(
+            id=self.fetched,
+            title=" ".join(words[:8]),
+            body=" ".join(words),
+            categories=["simulation"],
+            url=f"https://simulation.invalid/articles/{self.fetched}",
+        )
+
+    async def save_articles_dataset(self, dataset: list[dict]) -> None:
+        self.saved += len(dataset)
+
+
+class SyntheticLLMClient:
+    """
+    In-process stand-in for `OpenAIClient`, rewriting an article by shuffling its words after `latency` seconds.
+
+    The label of every rewrite, given by its prompt, is kept in `labels` for the simulated miners.
+    """
+
+    def __init__(self, labels: ArticleLabels, latency: float = 5.0, seed: int = 0):
+        self.labels = labels
+        self.latency = latency
+        self.rng = np.random.default_rng(seed)
+        self.completions = 0
+
+    async def get_prompt_completions_async(self, prompt: ValidatorPrompt) -> str:
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        self.completions += 1
+
+        words = prompt.article.split()
+        self.rng.shuffle(words)
+        body = f"{prompt.VERSION} {self.completions}: {' '.join(words)}"
+        self.labels.add(body, prompt.LABEL_PROBABILITY)
+        return body
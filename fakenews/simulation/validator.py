@@ -0,0 +1,175 @@
+import argparse
+import asyncio
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass, field
+
+import bittensor as bt
+import numpy as np
+from bittensor_wallet.mock import get_mock_wallet
+
+from fakenews.base.validator import BaseValidatorNeuron
+from fakenews.mock import MockDendrite
+from fakenews.simulation.chain import SimulatedMetagraph, SimulatedSubtensor
+from fakenews.simulation.clock import VirtualBlockTracker, VirtualClock, VirtualEventLoop
+from fakenews.simulation.miners import DEFAULT_PROFILES, MinerPopulation, load_profiles
+from fakenews.simulation.services import ArticleLabels, SyntheticLLMClient, SyntheticNewsAPIClient
+from fakenews.utils.config import add_simulation_args
+from fakenews.validator import forward, task as tasks
+
+
+@dataclass
+class SimulationReport:
+    steps: int
+    wall_seconds: float
+    simulated_seconds: float
+    blocks: int
+    weights_set: int
+    miners_replaced: int
+    # Spearman correlation of the last weights set with the accuracy of the miners.
+    weights_accuracy_correlation: float | None
+    # Mean weight of the miners of every profile.
+    weights_by_profile: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def cycles_per_minute(self) -> float:
+        return 60 * self.steps / self.wall_seconds if self.wall_seconds else 0.0
+
+    def lines(self) -> list[str]:
+        correlation = self.weights_accuracy_correlation
+        lines = [
+            f"{self.steps} steps in {self.wall_seconds:.1f} seconds, {self.cycles_per_minute:.0f} cycles per minute",
+            f"simulated {self.simulated_seconds / 3600:.1f} hours, {self.blocks} blocks, "
+            f"weights set {self.weights_set} times, {self.miners_replaced} miners replaced",
+            f"weights / accuracy rank correlation: {'-' if correlation is None else f'{correlation:.3f}'}",
+        ]
+        lines.extend(f"  {name}: mean weight {weight:.5f}" for name, weight in self.weights_by_profile.items())
+        return lines
+
+
+class SimulatedValidator(BaseValidatorNeuron):
+    """
+    The validator running against an in-process network on a virtual clock.
+
+    The chain, the miners, the article source and the LLM are simulated, see `--simulation.*`. Everything else is the
+    production code: the forward, the scoring, the metagraph sync, the weights setting and the checkpoints, taken
+    every `--simulation.checkpoint_every` steps. Waiting for miners, the LLM or the next step only moves the virtual
+    clock, so thousands of forward/sync cycles run per minute. The state is written to a fresh temporary directory,
+    removed once `simulate` returns.
+    """
+
+    @classmethod
+    def add_args(cls, parser: argparse.ArgumentParser):
+        super().add_args(parser)
+        add_simulation_args(cls, parser)
+
+    @classmethod
+    def check_config(cls, config: "bt.Config"):
+        config.neuron.full_path = tempfile.mkdtemp(prefix="fakenews-simulation-")
+        super().check_config(config)
+
+    def __init__(self, config=None):
+        # The base validator runs its forwards on the current event loop.
+        self.clock = VirtualClock()
+        asyncio.set_event_loop(VirtualEventLoop(self.clock))
+
+        # BaseNeuron merges the given config over its own defaults, pass ours so the simulation defaults are kept.
+        super().__init__(config=config or self.config())
+        bt.logging.info(f"Simulation state directory: {self.config.neuron.full_path}")
+
+    def create_network(self) -> tuple["bt.wallet", SimulatedSubtensor, SimulatedMetagraph]:
+        simulation = self.config.simulation
+        profiles = load_profiles(simulation.profiles) if simulation.profiles else DEFAULT_PROFILES
+
+        self.population = MinerPopulation(profiles, seed=simulation.seed)
+        self.article_labels = ArticleLabels()
+
+        wallet = get_mock_wallet()
+        subtensor = SimulatedSubtensor(
+            self.clock,
+            self.population,
+            netuid=self.config.netuid,
+            validator_hotkey=wallet.hotkey.ss58_address,
+            num_miners=simulation.miners,
+        )
+        return wallet, subtensor, subtensor.metagraph(self.config.netuid)
+
+    def create_block_tracker(self) -> VirtualBlockTracker:
+        return VirtualBlockTracker(self.clock)
+
+    def create_dendrite(self) -> MockDendrite:
+        # Axons of replaced miners are unreachable until the metagraph is synced, not new miners.
+        return MockDendrite(self.wallet, self.population, self.article_labels, register_unknown=False)
+
+    def create_tasks(self) -> list[tasks.ValidatorTask]:
+        simulation = self.config.simulation
+        self.news_api_client = SyntheticNewsAPIClient(seed=simulation.seed)
+        self.llm_client = SyntheticLLMClient(self.article_labels, latency=simulation.llm_latency, seed=simulation.seed)
+        return [
+            tasks.FakenewsDetectionNoOriginal(openai_client=self.llm_client, news_api_client=self.news_api_client),
+        ]
+
+    async def forward(self):
+        await forward(self)
+
+    def save_state(self):
+        # Checkpointing every step would dominate the simulation, the trackers are saved along with the state.
+        if self.step % self.config.simulation.checkpoint_every == 0:
+            super().save_state()
+
+    def save_miner_history(self):
+        pass
+
+    def simulate(self, steps: int) -> SimulationReport:
+        """Runs `steps` iterations of the main loop of `run`, the delay between steps moves the virtual clock."""
+        started_at = time.perf_counter()
+        started_block = self.block
+        self.sync()
+
+        for _ in range(steps):
+            self.loop.run_until_complete(self.concurrent_forward())
+            self.sync()
+            self.step += 1
+            self.subtensor.churn(self.config.simulation.churn)
+            self.clock.advance(self.FORWARD_DELAY_SECONDS)
+
+        super().save_state()
+        self.flush_checkpoints()
+        shutil.rmtree(self.config.neuron.full_path, ignore_errors=True)
+        return SimulationReport(
+            steps=steps,
+            wall_seconds=time.perf_counter() - started_at,
+            simulated_seconds=self.clock.monotonic(),
+            blocks=self.block - started_block,
+            weights_set=self.subtensor.weights_set,
+            miners_replaced=self.subtensor.replaced,
+            weights_accuracy_correlation=self._weights_accuracy_correlation(),
+            weights_by_profile=self._weights_by_profile(),
+        )
+
+    def _miners(self) -> list[tuple[int, float, str]]:
+        """Uid, accuracy and profile name of the registered miners."""
+        miners = []
+        for uid, hotkey in enumerate(self.subtensor.hotkeys):
+            miner = self.population.miners.get(hotkey)
+            if miner is not None:
+                miners.append((uid, miner.accuracy, miner.profile.name))
+        return miners
+
+    def _weights_accuracy_correlation(self) -> float | None:
+        miners = self._miners()
+        if self.subtensor.weights_set == 0 or not miners:
+            return None
+        weights = self.subtensor.weights[[uid for uid, _, _ in miners]]
+        accuracies = np.array([accuracy for _, accuracy, _ in miners])
+        weight_ranks, accuracy_ranks = np.argsort(np.argsort(weights)), np.argsort(np.argsort(accuracies))
+        if weight_ranks.std() == 0 or accuracy_ranks.std() == 0:
+            return None
+        return float(np.corrcoef(weight_ranks, accuracy_ranks)[0, 1])
+
+    def _weights_by_profile(self) -> dict[str, float]:
+        weights: dict[str, list[float]] = {}
+        for uid, _, name in self._miners():
+            weights.setdefault(name, []).append(float(self.subtensor.weights[uid]))
+        return {name: float(np.mean(values)) for name, values in weights.items()}
@@ -1,3 +1,3 @@
-from . import config, misc, uids
+from . import config, uids
 
-__all__ = ["config", "misc", "uids"]
+__all__ = ["config", "uids"]
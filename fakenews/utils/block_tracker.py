@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from typing import Final
+
+import bittensor as bt
+
+
+class BlockTracker:
+    """
+    Follows the chain head from a background thread, so reading the current block never does an RPC.
+
+    The poller owns its subtensor connection, built by `subtensor_factory`. After a new block is seen it sleeps
+    for most of the block time and then polls every `poll_interval` seconds until the next block shows up. The
+    latest block is published atomically and the threads and coroutines waiting for a block are woken up.
+    """
+
+    BLOCK_TIME: Final[float] = 12.0
+    # Share of the block time the poller sleeps after seeing a new block.
+    IDLE_SHARE: Final[float] = 0.75
+
+    def __init__(self, subtensor_factory: Callable[[], "bt.subtensor"], poll_interval: float = 1.0):
+        self.poll_interval = poll_interval
+
+        self._subtensor_factory = subtensor_factory
+        self._subtensor = None
+        self._block: int | None = None
+        self._updated_at = 0.0
+        self._condition = threading.Condition()
+        self._async_waiters: list[tuple[int, asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        """Fetches the current block on the calling thread, then follows the chain head in the background."""
+        if self._thread is not None:
+            return
+        self._subtensor = self._subtensor_factory()
+        self._publish(self._subtensor.get_current_block())
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="block-tracker", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(5)
+            self._thread = None
+
+    @property
+    def block(self) -> int:
+        """Latest block seen by the tracker."""
+        if self._block is None:
+            raise RuntimeError("Block tracker was not started")
+        return self._block
+
+    def wait_for_block_sync(self, block: int, timeout: float | None = None) -> int:
+        """
+        Blocks the calling thread until the chain reaches the given block.
+
+        Returns:
+            int: The latest block, which is lower than `block` if the timeout expired or the tracker was stopped.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._block is None or self._block < block:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if self._stop.is_set() or (remaining is not None and remaining <= 0):
+                    break
+                self._condition.wait(remaining if remaining is not None else self.BLOCK_TIME)
+            return self.block
+
+    async def wait_for_block(self, block: int, timeout: float | None = None) -> int:  # noqa: ASYNC109
+        """
+        Waits until the chain reaches the given block without blocking the event loop.
+
+        Raises:
+            asyncio.TimeoutError: If the block wasn't reached before the timeout.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._condition:
+            if self._block is not None and self._block >= block:
+                return self._block
+            waiter = (block, loop, future)
+            self._async_waiters.append(waiter)
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            with self._condition:
+                if waiter in self._async_waiters:
+                    self._async_waiters.remove(waiter)
+
+    def _publish(self, block: int):
+        with self._condition:
+            if self._block is not None and block <= self._block:
+                return False
+            self._block = block
+            self._updated_at = time.monotonic()
+
+            ready = [w for w in self._async_waiters if w[0] <= block]
+            self._async_waiters = [w for w in self._async_waiters if w[0] > block]
+            self._condition.notify_all()
+
+        for _, loop, future in ready:
+            loop.call_soon_threadsafe(_set_future_result, future, block)
+        return True
+
+    def _run(self):
+        while not self._stop.is_set():
+            next_block_in = self._updated_at + self.BLOCK_TIME * self.IDLE_SHARE - time.monotonic()
+            if self._stop.wait(max(next_block_in, self.poll_interval)):
+                break
+
+            try:
+                self._publish(self._subtensor.get_current_block())
+            except Exception as e:
+                bt.logging.warning(f"Failed to fetch the current block, reconnecting: {e}")
+                try:
+                    self._subtensor = self._subtensor_factory()
+                except Exception as e:
+                    bt.logging.warning(f"Failed to reconnect the block tracker: {e}")
+
+        with self._condition:
+            self._condition.notify_all()
+
+
+def _set_future_result(future: asyncio.Future, block: int):
+    if not future.done():
+        future.set_result(block)
@@ -0,0 +1,171 @@
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import BinaryIO
+
+import bittensor as bt
+import numpy as np
+
+# Writes the content of a checkpoint file, called by the worker thread.
+FileWriter = Callable[[BinaryIO], None]
+
+
+class Checkpointer:
+    """
+    Writes checkpoints of a neuron state from a background thread.
+
+    `save` takes a snapshot, a mapping of file names to writers, and returns right away. The writers run on the
+    worker thread, so they should only read data copied when the snapshot was taken. Snapshots requested while one is
+    pending replace it, only the latest one is written.
+
+    Every file is written to a temporary file, fsynced and renamed over the previous version, so a crash never leaves
+    a partially written checkpoint. The previous `generations` versions are kept as `<name>.1`, `<name>.2`, ... and
+    `candidates` lists them newest first, so loading can fall back to an older generation. Only saves made with
+    `rotate` start a new generation, others overwrite the latest version, so frequent saves don't push out the older
+    generations within seconds.
+    """
+
+    def __init__(self, directory: str, generations: int = 2):
+        self.directory = directory
+        self.generations = generations
+
+        # Pending files, with whether writing them starts a new generation.
+        self._pending: dict[str, tuple[FileWriter, bool]] | None = None
+        self._writing = False
+        self._written = 0
+        self._failed = 0
+        self._coalesced = 0
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="checkpointer", daemon=True)
+        self._thread.start()
+
+    def path(self, name: str, generation: int = 0) -> str:
+        path = os.path.join(self.directory, name)
+        return f"{path}.{generation}" if generation else path
+
+    @staticmethod
+    def generation(path: str) -> int:
+        """Generation of a path returned by `candidates`, 0 for the latest version."""
+        suffix = path.rsplit(".", 1)[-1]
+        return int(suffix) if suffix.isdigit() else 0
+
+    def candidates(self, name: str) -> list[str]:
+        """Paths of the existing generations of a file, newest first."""
+        paths = (self.path(name, generation) for generation in range(self.generations + 1))
+        return [path for path in paths if os.path.exists(path)]
+
+    def save(self, files: dict[str, FileWriter], *, rotate: bool = True):
+        """
+        Requests a checkpoint of the given files, merged into the pending one if it wasn't written yet.
+
+        Args:
+            files (dict[str, FileWriter]): Writers of the files to save, by file name.
+            rotate (bool): Whether the files start a new generation, otherwise they replace the latest version.
+        """
+        with self._condition:
+            if self._pending is None:
+                self._pending = {}
+            else:
+                self._coalesced += 1
+            for name, writer in files.items():
+                # A pending rotation is kept when a later save of the same file replaces its writer.
+                pending_rotate = name in self._pending and self._pending[name][1]
+                self._pending[name] = (writer, rotate or pending_rotate)
+            self._condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Waits until the pending checkpoint was written, e.g. before the neuron exits.
+
+        Returns:
+            bool: Whether it was written before the timeout.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending is None and not self._writing, timeout)
+
+    def stats(self) -> dict:
+        with self._condition:
+            return {
+                "written": self._written,
+                "failed": self._failed,
+                "coalesced": self._coalesced,
+                "pending": self._pending is not None,
+            }
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None)
+                files, self._pending = self._pending, None
+                self._writing = True
+
+            started_at = time.perf_counter()
+            written = False
+            try:
+                for name, (writer, rotate) in files.items():
+                    self._commit(name, writer, rotate=rotate)
+                written = True
+                bt.logging.debug(f"Checkpoint written in {time.perf_counter() - started_at:.2f} seconds")
+            except Exception as e:
+                bt.logging.error(f"Failed to write checkpoint: {e}")
+            finally:
+                with self._condition:
+                    self._writing = False
+                    if written:
+                        self._written += 1
+                    else:
+                        self._failed += 1
+                    self._condition.notify_all()
+
+    def _commit(self, name: str, writer: FileWriter, *, rotate: bool):
+        path = self.path(name)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                writer(f)
+                f.flush()
+                os.fsync(f.fileno())
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        if rotate:
+            for generation in range(self.generations, 0, -1):
+                previous = self.path(name, generation - 1)
+                if os.path.exists(previous):
+                    os.replace(previous, self.path(name, generation))
+        os.replace(tmp_path, path)
+        self._fsync_directory()
+
+    def _fsync_directory(self):
+        # Persists the renames, not supported on every platform.
+        try:
+            fd = os.open(self.directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def npz_writer(arrays: dict) -> FileWriter:
+    return lambda f: np.savez(f, **arrays)
+
+
+def json_writer(data: dict) -> FileWriter:
+    return lambda f: f.write(json.dumps(data).encode())
+
+
+def joblib_writer(obj) -> FileWriter:
+    def write(f: BinaryIO):
+        import joblib  # noqa: PLC0415 - deferred to keep it out of the startup path
+
+        joblib.dump(obj, f)
+
+    return write
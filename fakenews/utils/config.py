@@ -45,7 +45,8 @@ def check_config(cls, config: "bt.Config"):
     r"""Checks/validates the config namespace object."""
     bt.logging.check_config(config)
 
-    full_path = os.path.expanduser(
+    # A path set before the check, e.g. the temporary directory of a simulation, is kept.
+    full_path = config.neuron.get("full_path") or os.path.expanduser(
         "{}/{}/{}/netuid{}/{}".format(
             config.logging.logging_dir,  # TODO: change from ~/.bittensor/miners to ~/.bittensor/neurons
             config.wallet.name,
@@ -61,7 +62,13 @@ def check_config(cls, config: "bt.Config"):
 
     if not config.neuron.dont_save_events:
         # Add custom event logger for the events.
-        events_logger = setup_events_logger(config.neuron.full_path, config.neuron.events_retention_size)
+        events_logger = setup_events_logger(
+            config.neuron.full_path,
+            config.neuron.events_retention_size,
+            queue_size=config.neuron.events_queue_size,
+            json_lines=config.neuron.events_format == "json",
+            compress=config.neuron.events_compress,
+        )
         bt.logging.register_primary_logger(events_logger.name)
 
 
@@ -100,6 +107,28 @@ def add_args(cls, parser):
         default=2 * 1024 * 1024 * 1024,  # 2 GB
     )
 
+    parser.add_argument(
+        "--neuron.events_queue_size",
+        type=int,
+        help="Maximum number of events waiting to be written to the events file, new ones are dropped when full.",
+        default=10_000,
+    )
+
+    parser.add_argument(
+        "--neuron.events_format",
+        type=str,
+        choices=["text", "json"],
+        help="Format of the events file, json writes one compact JSON object per line.",
+        default="text",
+    )
+
+    parser.add_argument(
+        "--neuron.events_compress",
+        action="store_true",
+        help="If set, rotated events files are compressed with gzip.",
+        default=False,
+    )
+
     parser.add_argument(
         "--neuron.dont_save_events",
         action="store_true",
@@ -227,6 +256,127 @@ def add_validator_args(cls, parser):
         default=0.1,
     )
 
+    parser.add_argument(
+        "--neuron.min_timeout",
+        type=float,
+        help="Lower bound in seconds of the adaptive timeout miners are queried with.",
+        default=5,
+    )
+
+    parser.add_argument(
+        "--neuron.timeout_percentile",
+        type=float,
+        help="Percentile of the recent miner latencies the adaptive timeout is derived from.",
+        default=95,
+    )
+
+    parser.add_argument(
+        "--neuron.static_timeout",
+        action="store_true",
+        help="If set, miners are always queried with the static timeout of the task.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--neuron.generation_latency_budget",
+        type=float,
+        help="Seconds to wait for a live synapse generation before serving a cached one.",
+        default=30,
+    )
+
+    parser.add_argument(
+        "--neuron.fallback_max_age",
+        type=float,
+        help="Maximum age in seconds of a cached synapse that can be served as a fallback.",
+        default=30 * 60,
+    )
+
+    parser.add_argument(
+        "--neuron.fallback_max_uses",
+        type=int,
+        help="Maximum number of forwards a generated synapse can be served in.",
+        default=3,
+    )
+
+    parser.add_argument(
+        "--neuron.fallback_cache_size",
+        type=int,
+        help="Number of recently generated synapses kept per task for fallback.",
+        default=16,
+    )
+
+    parser.add_argument(
+        "--neuron.record_steps",
+        action="store_true",
+        help="Record every forward step in the steps directory of the validator, see fakenews.validator.replay.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--neuron.record_max_mb",
+        type=int,
+        help="Size in MB of a step records segment.",
+        default=64,
+    )
+
+    parser.add_argument(
+        "--neuron.record_max_segments",
+        type=int,
+        help="Number of step records segments kept.",
+        default=30,
+    )
+
+    parser.add_argument(
+        "--neuron.checkpoint_generations",
+        type=int,
+        help="Number of previous generations of the validator state kept to fall back to.",
+        default=2,
+    )
+
+    parser.add_argument(
+        "--neuron.reward_mode",
+        type=str,
+        choices=["window", "decay"],
+        help="Whether rewards combine the accuracies of the long and short windows, or the decayed accuracies.",
+        default="window",
+    )
+
+    parser.add_argument(
+        "--neuron.response_quorum",
+        type=float,
+        help="Share of the queried miners that should answer successfully before the stragglers get cut off, "
+        "cut miners are not scored. 1.0 waits for all.",
+        default=1.0,
+    )
+
+    parser.add_argument(
+        "--neuron.quorum_grace",
+        type=float,
+        help="Seconds the stragglers get once the response quorum is reached.",
+        default=2.0,
+    )
+
+    parser.add_argument(
+        "--neuron.unresponsive_threshold",
+        type=int,
+        help="Number of consecutive unanswered queries after which a miner is benched.",
+        default=3,
+    )
+
+    parser.add_argument(
+        "--neuron.max_backoff_steps",
+        type=int,
+        help="Maximum number of steps an unresponsive miner stays benched before it is probed again.",
+        default=64,
+    )
+
+    parser.add_argument(
+        "--neuron.hyperparameters_ttl",
+        type=int,
+        help="Number of blocks the subnet hyperparameters used to set weights are cached for.",
+        default=720,
+    )
+
     parser.add_argument(
         "--neuron.axon_off",
         "--axon_off",
@@ -258,6 +408,20 @@ def add_validator_args(cls, parser):
         default="gutenberg-fakenews",
     )
 
+    parser.add_argument(
+        "--wandb.queue_size",
+        type=int,
+        help="Maximum number of forward payloads waiting to be logged to wandb, new ones are dropped when full.",
+        default=256,
+    )
+
+    parser.add_argument(
+        "--wandb.scores_every",
+        type=int,
+        help="Log the scores of every miner once in this many forwards, only the queried ones otherwise.",
+        default=10,
+    )
+
     parser.add_argument(
         "--openai_api_key",
         type=str,
@@ -266,6 +430,69 @@ def add_validator_args(cls, parser):
     )
 
 
+def add_simulation_args(cls, parser):
+    """Add the arguments of the simulated validator, see `fakenews.simulation`."""
+
+    parser.add_argument(
+        "--simulation.steps",
+        type=int,
+        help="Number of forward/sync cycles to simulate.",
+        default=1000,
+    )
+
+    parser.add_argument(
+        "--simulation.miners",
+        type=int,
+        help="Number of simulated miners.",
+        default=256,
+    )
+
+    parser.add_argument(
+        "--simulation.profiles",
+        type=str,
+        help="JSON file with a list of miner profiles, see `MinerProfile`. A default population is used if unset.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--simulation.churn",
+        type=float,
+        help="Probability that a miner is replaced by a new one with a new hotkey, per step.",
+        default=0.0,
+    )
+
+    parser.add_argument(
+        "--simulation.llm_latency",
+        type=float,
+        help="Simulated seconds the article generation takes.",
+        default=5.0,
+    )
+
+    parser.add_argument(
+        "--simulation.checkpoint_every",
+        type=int,
+        help="Checkpoint the state once in this many steps, the validator checkpoints every step.",
+        default=100,
+    )
+
+    parser.add_argument(
+        "--simulation.seed",
+        type=int,
+        help="Seed of the simulated miners and articles.",
+        default=0,
+    )
+
+    # A simulation shouldn't touch the state of a real validator or report to wandb.
+    parser.set_defaults(
+        **{
+            "neuron.name": "simulation",
+            "neuron.axon_off": True,
+            "neuron.dont_save_events": True,
+            "wandb.off": True,
+        }
+    )
+
+
 def config(cls):
     """
     Returns the configuration object specific to this miner or validator after adding relevant arguments.
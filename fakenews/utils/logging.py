@@ -1,12 +1,148 @@
+import atexit
+import copy
+import gzip
+import json
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import shutil
+import threading
+import time
+from collections.abc import Callable
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from queue import Full, Queue
+from typing import Any
+
+import bittensor as bt
 
 EVENTS_LEVEL_NUM = 38
 DEFAULT_LOG_BACKUP_COUNT = 10
+DEFAULT_EVENTS_QUEUE_SIZE = 10_000
+# Longer messages are split, so they are not cut by the log sinks.
+MAX_LOG_MESSAGE_LENGTH = 3950
+
+LOG_LEVELS = {
+    "trace": 5,
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "success": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+
+_last_logged_at: dict[str, float] = {}
+_rate_limit_lock = threading.Lock()
+
+_events_listener: QueueListener | None = None
+
+
+# Formats the exceptions of queued records, before they are handed over to the listener.
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Queue handler that never blocks the caller: records that don't fit in the queue are dropped and counted.
+    The number of dropped records is reported in the log once the queue has room again.
+    """
+
+    def __init__(self, queue: Queue):
+        super().__init__(queue)
+        self.dropped = 0
+        self._unreported_dropped = 0
+        self._lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Unlike `QueueHandler.prepare`, keeps the formatted exception apart from the message, in `exc_text`, so the
+        formatter of the events file can write it in its own field.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            with self._lock:
+                self.dropped += 1
+                self._unreported_dropped += 1
+            return
+
+        with self._lock:
+            unreported_dropped, self._unreported_dropped = self._unreported_dropped, 0
+        if unreported_dropped:
+            self._report_dropped(record, unreported_dropped)
+
+    def _report_dropped(self, record: logging.LogRecord, count: int):
+        report = logging.makeLogRecord(
+            {
+                "name": record.name,
+                "levelno": EVENTS_LEVEL_NUM,
+                "levelname": logging.getLevelName(EVENTS_LEVEL_NUM),
+                "msg": f"{count} event records were dropped, the events queue was full",
+            }
+        )
+        try:
+            self.queue.put_nowait(report)
+        except Full:
+            with self._lock:
+                self._unreported_dropped += count
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats records as compact JSON objects, one per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, separators=(",", ":"), default=str)
+
+
+def _gzip_namer(name: str) -> str:
+    return f"{name}.gz"
+
+
+def _gzip_rotator(source: str, dest: str):
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
 
+def setup_events_logger(
+    full_path,
+    events_retention_size,
+    *,
+    queue_size: int = DEFAULT_EVENTS_QUEUE_SIZE,
+    json_lines: bool = False,
+    compress: bool = False,
+):
+    """
+    Sets up the `event` logger.
+
+    Records are handed over to a bounded queue and written to the rotating events file by a background listener
+    thread, so logging never does disk I/O on the caller thread. When the queue is full records are dropped.
+
+    Args:
+        full_path (str): Directory of the events file.
+        events_retention_size (int): Size in bytes at which the events file is rotated.
+        queue_size (int): Maximum number of records waiting to be written.
+        json_lines (bool): Write the events as JSON lines instead of text.
+        compress (bool): Gzip the rotated events files.
+    """
+    global _events_listener  # noqa: PLW0603
 
-def setup_events_logger(full_path, events_retention_size):
     logging.addLevelName(EVENTS_LEVEL_NUM, "EVENT")
 
     logger = logging.getLogger("event")
@@ -18,18 +154,100 @@ def setup_events_logger(full_path, events_retention_size):
 
     logging.Logger.event = event
 
-    formatter = logging.Formatter(
-        "%(asctime)s | %(levelname)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    if json_lines:
+        formatter = JsonLinesFormatter(datefmt="%Y-%m-%d %H:%M:%S")
+    else:
+        formatter = logging.Formatter(
+            "%(asctime)s | %(levelname)s | %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
 
     file_handler = RotatingFileHandler(
         os.path.join(full_path, "events.log"),
-        maxBytes=events_retention_size,
+        maxBytes=int(events_retention_size),
         backupCount=DEFAULT_LOG_BACKUP_COUNT,
     )
+    if compress:
+        file_handler.namer = _gzip_namer
+        file_handler.rotator = _gzip_rotator
     file_handler.setFormatter(formatter)
     file_handler.setLevel(EVENTS_LEVEL_NUM)
-    logger.addHandler(file_handler)
+
+    stop_events_logger()
+    for handler in [h for h in logger.handlers if isinstance(h, (DroppingQueueHandler, RotatingFileHandler))]:
+        logger.removeHandler(handler)
+
+    queue_handler = DroppingQueueHandler(Queue(maxsize=queue_size))
+    queue_handler.setLevel(EVENTS_LEVEL_NUM)
+    logger.addHandler(queue_handler)
+
+    _events_listener = QueueListener(queue_handler.queue, file_handler, respect_handler_level=True)
+    _events_listener.start()
 
     return logger
+
+
+def stop_events_logger():
+    """Writes the queued event records and stops the events listener thread."""
+    global _events_listener  # noqa: PLW0603
+
+    if _events_listener is None:
+        return
+    _events_listener.stop()
+    for handler in _events_listener.handlers:
+        handler.close()
+    _events_listener = None
+
+
+atexit.register(stop_events_logger)
+
+
+def is_log_level_enabled(level: str) -> bool:
+    """Whether messages of the given bittensor logging level are emitted."""
+    return bt.logging.get_level() <= LOG_LEVELS[level]
+
+
+def log_structured(
+    level: str,
+    message: str,
+    fields: Any | Callable[[], Any] = None,
+    *,
+    rate_limit: float = 0.0,
+    key: str | None = None,
+) -> bool:
+    """
+    Logs a message followed by structured fields serialized as compact JSON.
+
+    Nothing is built unless the level is enabled: `fields` can be a callable, which is only called when the
+    message is emitted. Long messages are split into chunks of `MAX_LOG_MESSAGE_LENGTH` characters.
+
+    Args:
+        level (str): Bittensor logging level, e.g. "debug".
+        message (str): Message, the serialized fields are appended to it.
+        fields (Any | Callable[[], Any]): JSON serializable fields, or a callable returning them.
+        rate_limit (float): Minimum number of seconds between two messages with the same key, 0 disables it.
+        key (str, optional): Rate limit key, defaults to the message.
+
+    Returns:
+        bool: Whether the message was emitted.
+    """
+    if not is_log_level_enabled(level):
+        return False
+
+    if rate_limit > 0:
+        key = key or message
+        now = time.monotonic()
+        with _rate_limit_lock:
+            if now - _last_logged_at.get(key, float("-inf")) < rate_limit:
+                return False
+            _last_logged_at[key] = now
+
+    if callable(fields):
+        fields = fields()
+    if fields is not None:
+        message = f"{message} {json.dumps(fields, separators=(',', ':'), default=str)}"
+
+    log = getattr(bt.logging, level)
+    for i in range(0, len(message), MAX_LOG_MESSAGE_LENGTH):
+        log(message[i : i + MAX_LOG_MESSAGE_LENGTH])
+    return True
@@ -0,0 +1,35 @@
+import time
+
+from fakenews.utils.logging import log_structured
+
+
+class StartupTimer:
+    """
+    Times the consecutive startup phases of a neuron, so the time to the first forward is measurable.
+
+    Every `mark` closes the phase that started at the previous mark. The first phase starts at `started_at`, e.g. when
+    the package started to be imported. For a per-module breakdown of the import time run python with `-X importtime`.
+    """
+
+    def __init__(self, started_at: float | None = None):
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self.phases: dict[str, float] = {}
+        self._last_mark = self.started_at
+
+    def mark(self, phase: str) -> float:
+        """Ends a phase, returns its duration in seconds."""
+        now = time.perf_counter()
+        duration = now - self._last_mark
+        self.phases[phase] = self.phases.get(phase, 0.0) + duration
+        self._last_mark = now
+        return duration
+
+    @property
+    def total(self) -> float:
+        return self._last_mark - self.started_at
+
+    def report(self) -> dict[str, float]:
+        return {**{phase: round(duration, 3) for phase, duration in self.phases.items()}, "total": round(self.total, 3)}
+
+    def log(self, message: str = "Startup phases in seconds:"):
+        log_structured("info", message, self.report)
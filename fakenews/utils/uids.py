@@ -27,6 +27,18 @@ def check_uid_availability(metagraph: "bt.metagraph.Metagraph", uid: int, vpermi
     return True
 
 
+def get_available_uids(self) -> list[int]:
+    """Returns the uids available for querying.
+    Returns:
+        uids (list[int]): Available uids.
+    """
+    return [
+        uid
+        for uid in range(self.metagraph.n.item())
+        if check_uid_availability(self.metagraph, uid, self.config.neuron.vpermit_tao_limit)
+    ]
+
+
 def get_random_uids(self, k: int, exclude: list[int] | None = None) -> np.ndarray:
     """Returns k available random uids from the metagraph.
     Args:
@@ -58,3 +70,162 @@ def get_random_uids(self, k: int, exclude: list[int] | None = None) -> np.ndarra
             k - len(candidate_uids),
         )
     return np.array(random.sample(available_uids, k))
+
+
+class UidScheduler:
+    """
+    Picks the miners to query, prioritizing the ones that were queried the least.
+
+    Every uid keeps a count of the queries it received. A batch is drawn by ranking the candidates by their count
+    plus a random jitter of up to `jitter` queries and taking the lowest ranked ones. Under-sampled miners are
+    therefore queried first, so every miner's history window fills at the same pace, while miners within `jitter`
+    queries of each other are mixed randomly, so the batches stay unpredictable.
+    """
+
+    def __init__(self, n: int, jitter: float = 2.0):
+        self.jitter = jitter
+        self.query_counts = np.zeros(n, dtype=np.int64)
+        self.last_queried_step = np.full(n, -1, dtype=np.int64)
+
+    def resize(self, n: int):
+        """Grows the state to `n` uids, new uids start with no queries."""
+        if n <= self.query_counts.size:
+            return
+        query_counts = np.zeros(n, dtype=np.int64)
+        query_counts[: self.query_counts.size] = self.query_counts
+        last_queried_step = np.full(n, -1, dtype=np.int64)
+        last_queried_step[: self.last_queried_step.size] = self.last_queried_step
+        self.query_counts = query_counts
+        self.last_queried_step = last_queried_step
+
+    def reset(self, uid: int):
+        """Forgets the queries of a uid, e.g. when its hotkey was replaced."""
+        self.query_counts[uid] = 0
+        self.last_queried_step[uid] = -1
+
+    def sample(self, candidates: list[int], k: int, step: int, *, record: bool = True) -> np.ndarray:
+        """Returns up to k uids out of the candidates and records them as queried at the given step.
+        Args:
+            candidates (list[int]): Uids available for querying.
+            k (int): Number of uids to return.
+            step (int): Current validator step.
+            record (bool): Whether to record the uids as queried, otherwise `record` has to be called for the uids
+                that end up being queried.
+        Returns:
+            uids (np.ndarray): Sampled uids.
+        """
+        candidates = np.asarray(candidates, dtype=np.int64)
+        k = min(k, candidates.size)
+        if k == 0:
+            return np.array([], dtype=np.int64)
+
+        self.resize(int(candidates.max()) + 1)
+        priority = self.query_counts[candidates] + np.random.uniform(0, self.jitter, size=candidates.size)
+        selected = candidates[np.argpartition(priority, k - 1)[:k]]
+        np.random.shuffle(selected)
+
+        if record:
+            self.record(selected, step)
+        return selected
+
+    def record(self, uids: np.ndarray, step: int):
+        """Records the uids as queried at the given step."""
+        self.query_counts[uids] += 1
+        self.last_queried_step[uids] = step
+
+    def coverage(self, candidates: list[int], step: int) -> dict:
+        """Returns how evenly the candidates were queried so far."""
+        candidates = np.asarray(candidates, dtype=np.int64)
+        candidates = candidates[candidates < self.query_counts.size]
+        if candidates.size == 0:
+            return {}
+
+        counts = self.query_counts[candidates]
+        never_queried = self.last_queried_step[candidates] < 0
+        steps_since_query = step - self.last_queried_step[candidates][~never_queried]
+        return {
+            "min_queries": int(counts.min()),
+            "max_queries": int(counts.max()),
+            "never_queried": int(never_queried.sum()),
+            "max_steps_since_query": int(steps_since_query.max()) if steps_since_query.size else None,
+        }
+
+
+class MinerHealth:
+    """
+    Benches miners that stopped answering, with exponential backoff.
+
+    After `failures_threshold` consecutive unanswered queries a miner is benched for one step, and every further
+    failure doubles the bench time up to `max_backoff_steps`. Once the bench time is over the miner is eligible again,
+    so the next query acts as a probe: an answer re-admits it right away, another failure benches it for longer.
+    """
+
+    def __init__(self, n: int, failures_threshold: int = 3, max_backoff_steps: int = 64):
+        self.failures_threshold = failures_threshold
+        self.max_backoff_steps = max_backoff_steps
+        self.consecutive_failures = np.zeros(n, dtype=np.int64)
+        self.benched_until_step = np.zeros(n, dtype=np.int64)
+
+    def resize(self, n: int):
+        """Grows the state to `n` uids, new uids start healthy."""
+        if n <= self.consecutive_failures.size:
+            return
+        consecutive_failures = np.zeros(n, dtype=np.int64)
+        consecutive_failures[: self.consecutive_failures.size] = self.consecutive_failures
+        benched_until_step = np.zeros(n, dtype=np.int64)
+        benched_until_step[: self.benched_until_step.size] = self.benched_until_step
+        self.consecutive_failures = consecutive_failures
+        self.benched_until_step = benched_until_step
+
+    def reset(self, uid: int):
+        """Forgets the failures of a uid, e.g. when its hotkey was replaced."""
+        self.consecutive_failures[uid] = 0
+        self.benched_until_step[uid] = 0
+
+    def record(self, uid: int, step: int, *, responsive: bool):
+        """Records the outcome of a query made at the given step."""
+        self.resize(uid + 1)
+        if responsive:
+            self.reset(uid)
+            return
+
+        self.consecutive_failures[uid] += 1
+        excess_failures = self.consecutive_failures[uid] - self.failures_threshold
+        if excess_failures >= 0:
+            backoff = min(2 ** min(excess_failures, 32), self.max_backoff_steps)
+            # Benched for the `backoff` steps after the one of the failed query.
+            self.benched_until_step[uid] = step + 1 + backoff
+
+    def is_benched(self, uids: np.ndarray, step: int) -> np.ndarray:
+        """Returns a mask of the uids that are benched at the given step."""
+        uids = np.asarray(uids, dtype=np.int64)
+        self.resize(int(uids.max()) + 1 if uids.size else 0)
+        return self.benched_until_step[uids] > step
+
+
+def sample_query_uids(self, available_uids: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the uids to query in this step.
+    The batch is drawn by the validator uid scheduler. Benched miners drawn into the batch are not queried, their
+    slots go to additional responsive miners instead. Only the queried uids are recorded by the scheduler.
+    Args:
+        available_uids (np.ndarray): Uids that can be queried.
+        k (int): Number of uids to query.
+    Returns:
+        uids (np.ndarray): Uids to query.
+        benched_uids (np.ndarray): Uids drawn into the batch but skipped because they are benched.
+    """
+    scheduled_uids = self.uid_scheduler.sample(available_uids, k=k, step=self.step, record=False)
+
+    benched_mask = self.miner_health.is_benched(scheduled_uids, self.step)
+    benched_uids = scheduled_uids[benched_mask]
+    query_uids = scheduled_uids[~benched_mask]
+    if benched_uids.size > 0:
+        replacement_candidates = np.setdiff1d(available_uids, scheduled_uids)
+        replacement_candidates = replacement_candidates[~self.miner_health.is_benched(replacement_candidates, self.step)]
+        replacement_uids = self.uid_scheduler.sample(
+            replacement_candidates, k=benched_uids.size, step=self.step, record=False
+        )
+        query_uids = np.concatenate([query_uids, replacement_uids])
+
+    self.uid_scheduler.record(query_uids, self.step)
+    return query_uids, benched_uids
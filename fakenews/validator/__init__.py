@@ -1,9 +1,38 @@
-from .forward import forward
-from .performance_tracker import PerformanceTracker
-from .reward import RewardCalculator
+import importlib
+import sys
+import types
+
+# Imported on first access, see `fakenews.__getattr__`.
+_EXPORTS = {
+    "forward": ".forward",
+    "MinerResponse": ".response",
+    "PerformanceTracker": ".performance_tracker",
+    "RewardCalculator": ".reward",
+}
 
 __all__ = [
+    "MinerResponse",
     "PerformanceTracker",
     "RewardCalculator",
     "forward",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+class _Package(types.ModuleType):
+    def __setattr__(self, name: str, value):
+        # The import system sets every submodule it imports as an attribute of the package. An export named after its
+        # submodule, `forward`, shadows the submodule instead, as `from .forward import forward` did.
+        if isinstance(value, types.ModuleType) and _EXPORTS.get(name) == f".{name}":
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
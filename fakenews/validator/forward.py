@@ -16,72 +16,156 @@
 # DEALINGS IN THE SOFTWARE.
 
 import time
-from contextlib import suppress
 
 import bittensor as bt
-import wandb
+import numpy as np
 
 from fakenews.base.validator import BaseValidatorNeuron
+from fakenews.services.circuit_breaker import circuit_breakers_snapshot
 from fakenews.utils import uids
+from fakenews.utils.logging import log_structured
+from fakenews.validator.query import stream_miner_responses
+from fakenews.validator.recorder import article_id
+from fakenews.validator.response import MinerResponse
 from fakenews.validator.reward import RewardCalculator
 from fakenews.validator.task import ValidatorTask, select_task
 
 
-async def forward(self: BaseValidatorNeuron):
-    miner_uids = uids.get_random_uids(self, k=self.config.neuron.sample_size)
-    bt.logging.info(f"Miners: {miner_uids.tolist()}")
-    axons = [self.metagraph.axons[uid] for uid in miner_uids]
+async def forward(self: BaseValidatorNeuron):  # noqa: PLR0915
+    available_uids = uids.get_available_uids(self)
+    query_uids, benched_uids = uids.sample_query_uids(self, available_uids, k=self.config.neuron.sample_size)
+    log_structured("info", "Miners:", lambda: {"query": query_uids.tolist(), "benched": benched_uids.tolist()})
+    axons = [self.metagraph.axons[uid] for uid in query_uids]
 
-    if len(miner_uids) == 0:
+    if len(query_uids) == 0:
         bt.logging.info("No miners available")
         return
 
     task: ValidatorTask = select_task(self.tasks)
     bt.logging.info(f"Selected task: {task.TASK_NAME}")
 
+    bundle_cache = self.bundle_caches[task]
     try:
-        synapse, labels = await task.prepare_synapse()
+        bundle, is_fallback = await bundle_cache.get()
     except BaseException as e:
         bt.logging.error(f"Failed to prepare synapse: {e}")
         return
 
+    synapse, labels, task_metadata = bundle.draw()
+
+    timeout_controller = self.timeout_controllers[task]
+    timeout = timeout_controller.timeout_for(synapse)
+    performance_tracker = self.performance_trackers[task]
+
+    miner_responses: list[MinerResponse] = []
+    rewards = []
+    miner_rewards_calculating_metadata = []
+
+    def score(r: MinerResponse):
+        reward, metadata = RewardCalculator.get_miner_reward(
+            labels=labels,
+            probs=r.probabilities,
+            uid=r.uid,
+            hotkey=r.hotkey,
+            performance_trackers=self.performance_trackers,
+            current_task=task,
+            reward_mode=self.config.neuron.reward_mode,
+        )
+        miner_responses.append(r)
+        rewards.append(reward)
+        miner_rewards_calculating_metadata.append(metadata)
+
+    # Score the responses as they arrive, so the scoring overlaps the wait for the slower miners.
+    cut_uids = []
     start = time.perf_counter()
-    responses = await self.dendrite(
-        axons=axons,
-        synapse=synapse,
-        deserialize=True,
-        timeout=task.TIMEOUT,
-    )
+    async for r in stream_miner_responses(
+        self.dendrite,
+        query_uids,
+        axons,
+        synapse,
+        timeout,
+        quorum=self.config.neuron.response_quorum,
+        grace=self.config.neuron.quorum_grace,
+    ):
+        if r.is_cut:
+            # Not scored, the miner may well have answered in time.
+            cut_uids.append(r.uid)
+            continue
+        performance_tracker.update_response(r.uid, r.latency, r.status_code, r.hotkey)
+        self.miner_health.record(r.uid, self.step, responsive=not r.is_unreachable)
+        score(r)
+
+    timeout_controller.observe(synapse, miner_responses)
 
     # Log the results for monitoring purposes.
-    bt.logging.info(f"Received responses in {time.perf_counter() - start:.2f} seconds: {responses}")
+    log_structured(
+        "info",
+        f"Received {len(miner_responses)} responses in {time.perf_counter() - start:.2f} seconds "
+        f"(timeout {timeout:.2f}s, {len(cut_uids)} cut after the quorum):",
+        lambda: {int(r.uid): r.probabilities for r in miner_responses},
+    )
 
-    # Adjust the scores based on responses from miners.
-    rewards, calculating_metadata = RewardCalculator.get_rewards(
-        labels=labels,
-        axons=axons,
-        uids=miner_uids,
-        responses=responses,
-        performance_trackers=self.performance_trackers,
-        current_task=task,
+    RewardCalculator.log_result(task, miner_rewards_calculating_metadata)
+    calculating_metadata = RewardCalculator.calculating_metadata(
+        miner_rewards_calculating_metadata, self.config.neuron.reward_mode
     )
 
-    bt.logging.info(f"Scored responses: {rewards.tolist()}")
+    miner_uids = np.array([r.uid for r in miner_responses], dtype=np.int64)
+    rewards = np.array(rewards)
+    responses = [r.probabilities for r in miner_responses]
+    log_structured("info", "Scored responses:", rewards.tolist)
 
-    self.update_scores(rewards, miner_uids)
+    # Adjust the scores based on responses from miners.
+    self.update_scores(rewards, miner_uids, task)
     self.save_miner_history()
 
+    if self.step_recorder is not None:
+        self.step_recorder.record(
+            {
+                "step": int(self.step),
+                "time": time.time(),
+                "task": task.TASK_NAME,
+                "reward_weight": task.REWARD_WEIGHT,
+                "uids": miner_uids.tolist(),
+                "hotkeys": [r.hotkey for r in miner_responses],
+                "labels": labels,
+                "responses": [m[task.TASK_NAME]["normalized_probabilities"] for m in miner_rewards_calculating_metadata],
+                "latencies": [round(r.latency, 3) for r in miner_responses],
+                "status_codes": [int(r.status_code) for r in miner_responses],
+                "stake": self.has_enough_stake[miner_uids].tolist(),
+                "article_ids": [article_id(body) for body in synapse.articles_to_review],
+                "original_article_id": bundle.metadata.get("original_article_id"),
+            }
+        )
+
     if not self.config.wandb.off:
         wandb_logging_context = {
             "rewards": rewards.tolist(),
             "rewards_calculating_metadata": calculating_metadata,
             "miner_uids": miner_uids.tolist(),
-            "scores": self.scores.tolist(),
+            "benched_uids": benched_uids.tolist(),
+            "cut_uids": [int(uid) for uid in cut_uids],
+            "benched_count": int(self.miner_health.is_benched(available_uids, self.step).sum()),
+            "query_coverage": self.uid_scheduler.coverage(available_uids, self.step),
+            "scores": self.weighted_scores(),
             "responses": responses,
+            "timeout": timeout,
+            "timeout_controller": timeout_controller.state(),
+            "latencies": [r.latency for r in miner_responses],
+            "status_codes": [r.status_code for r in miner_responses],
+            "latency_metrics": [
+                performance_tracker.get_metrics(r.uid, target_metrics=performance_tracker.RESPONSE_METRICS)
+                for r in miner_responses
+            ],
             "labels": labels,
-            "task_metadata": task.metadata(),
+            "task_metadata": task_metadata,
+            "synapse_fallback": is_fallback,
+            "synapse_source_stats": bundle_cache.stats(),
+            "circuit_breakers": circuit_breakers_snapshot(),
+            "wandb_logger": self.wandb_logger.stats(),
         }
-        with suppress(Exception):
-            wandb.log(wandb_logging_context)
+        self.wandb_logger.log(wandb_logging_context)
 
-    await task.save_dataset()
+    if not bundle.dataset_saved:
+        bundle.dataset_saved = True
+        await task.save_dataset(bundle.dataset)
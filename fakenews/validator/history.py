@@ -0,0 +1,89 @@
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import ClassVar
+
+import numpy as np
+
+
+@dataclass
+class CompactHistory:
+    """
+    Prediction and label history of a miner in a compact form, one byte per prediction and one bit per label.
+
+    Probabilities are quantized to uint8 levels 0-254, so 0.0, 0.5 and 1.0 are exact. Probabilities above 0.5 are
+    never quantized down to 0.5, so rounding a dequantized prediction gives the same label as rounding the original
+    one and the accuracy is unchanged. The invalid prediction marker -1 is stored as 255.
+    """
+
+    INVALID: ClassVar[int] = 255
+    INVALID_PREDICTION: ClassVar[float] = -1.0
+    LEVELS: ClassVar[int] = 254
+
+    predictions: np.ndarray
+    labels: np.ndarray
+    length: int
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __reduce__(self):
+        # Pickled as raw bytes, the numpy array headers would outweigh a history of a few hundred predictions.
+        return self._from_bytes, (self.predictions.tobytes(), self.labels.tobytes(), self.length)
+
+    @classmethod
+    def _from_bytes(cls, predictions: bytes, labels: bytes, length: int) -> "CompactHistory":
+        return cls(
+            predictions=np.frombuffer(predictions, dtype=np.uint8).copy(),
+            labels=np.frombuffer(labels, dtype=np.uint8).copy(),
+            length=length,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return self.predictions.nbytes + self.labels.nbytes
+
+    @classmethod
+    def quantize(cls, predictions: np.ndarray) -> np.ndarray:
+        predictions = np.asarray(predictions, dtype=np.float64)
+        invalid = predictions == cls.INVALID_PREDICTION
+        probs = np.clip(np.nan_to_num(predictions), 0.0, 1.0)
+
+        quantized = np.round(probs * cls.LEVELS)
+        half = cls.LEVELS // 2
+        quantized[(probs > half / cls.LEVELS) & (quantized <= half)] = half + 1
+        quantized[invalid] = cls.INVALID
+        return quantized.astype(np.uint8)
+
+    @classmethod
+    def dequantize(cls, quantized: np.ndarray) -> np.ndarray:
+        predictions = quantized.astype(np.float64) / cls.LEVELS
+        predictions[quantized == cls.INVALID] = cls.INVALID_PREDICTION
+        return predictions
+
+    @classmethod
+    def from_deques(cls, predictions: Iterable[float], labels: Iterable[int]) -> "CompactHistory":
+        """
+        Builds the compact history from the prediction and label deques of a tracker.
+
+        Raises:
+            ValueError: If the histories have different lengths or a label isn't 0 or 1.
+        """
+        predictions = np.fromiter(predictions, dtype=np.float64)
+        labels = np.fromiter(labels, dtype=np.float64)
+        if len(predictions) != len(labels):
+            raise ValueError(f"History length mismatch: {len(predictions)} predictions, {len(labels)} labels")
+        if not np.isin(labels, (0, 1)).all():
+            raise ValueError("Only binary labels can be stored in a compact history")
+
+        return cls(
+            predictions=cls.quantize(predictions),
+            labels=np.packbits(labels.astype(np.uint8)),
+            length=len(predictions),
+        )
+
+    def to_deques(self, maxlen: int | None = None) -> tuple[deque, deque]:
+        """Returns the prediction and label deques of the history, keeping the last `maxlen` entries."""
+        predictions = self.dequantize(self.predictions).tolist()
+        labels = np.unpackbits(self.labels, count=self.length).tolist()
+        return deque(predictions, maxlen=maxlen), deque(labels, maxlen=maxlen)
@@ -0,0 +1,185 @@
+"""
+Exports the validator state and the miner performance history to columnar files and prints summary statistics.
+
+    python -m fakenews.validator.history_export <state directory> [--output DIR] [--uid UID ...] [--hotkey HOTKEY ...]
+
+The state directory is the `neuron.full_path` of a validator. It can be read while the validator runs: checkpoints are
+renamed into place, so every file is read as one consistent version. Trackers are loaded one task at a time.
+
+Every task history is written to `<task>_history.parquet`, or `<task>_history.npz` when pyarrow isn't installed, with
+the columns uid, hotkey, position, prediction and label. Position 0 is the oldest stored prediction of a miner and
+invalid predictions are -1. The scores of `state.npz` are written to `scores.parquet` or `scores.npz`.
+"""
+
+import argparse
+import glob
+import importlib.util
+import os
+import sys
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+# Imports bittensor, which would parse the command line first, see `main`.
+if TYPE_CHECKING:
+    from fakenews.validator.performance_tracker import PerformanceTracker
+
+HISTORY_SUFFIX = "_performance_history.pkl"
+
+
+def history_columns(
+    tracker: "PerformanceTracker",
+    uids: Iterable[int] | None = None,
+    hotkeys: Iterable[str] | None = None,
+) -> dict[str, np.ndarray]:
+    """Flattens the history of the miners matching the filters into columns."""
+    uids = set(uids) if uids else None
+    hotkeys = set(hotkeys) if hotkeys else None
+
+    columns = {"uid": [], "hotkey": [], "position": [], "prediction": [], "label": []}
+    for uid, predictions in tracker.prediction_history.items():
+        hotkey = tracker.miner_hotkeys.get(uid, "")
+        if (uids is not None and uid not in uids) or (hotkeys is not None and hotkey not in hotkeys):
+            continue
+        count = len(predictions)
+        columns["uid"].append(np.full(count, uid, dtype=np.int32))
+        columns["hotkey"].append(np.full(count, hotkey))
+        columns["position"].append(np.arange(count, dtype=np.int32))
+        columns["prediction"].append(np.fromiter(predictions, dtype=np.float32, count=count))
+        columns["label"].append(np.fromiter(tracker.label_history[uid], dtype=np.uint8, count=count))
+
+    dtypes = {"uid": np.int32, "hotkey": np.str_, "position": np.int32, "prediction": np.float32, "label": np.uint8}
+    return {name: np.concatenate(chunks) if chunks else np.array([], dtype=dtypes[name]) for name, chunks in columns.items()}
+
+
+def score_columns(
+    state: dict,
+    uids: Iterable[int] | None = None,
+    hotkeys: Iterable[str] | None = None,
+) -> dict[str, np.ndarray]:
+    """Columns uid, hotkey and one score column per task of a loaded `state.npz`."""
+    scores = np.atleast_2d(state["scores"])
+    task_names = state.get("task_names", ["combined"])
+    hotkeys_by_uid = np.asarray(state["hotkeys"], dtype=np.str_)[: scores.shape[1]]
+
+    keep = np.ones(scores.shape[1], dtype=bool)
+    if uids:
+        keep &= np.isin(np.arange(scores.shape[1]), list(uids))
+    if hotkeys:
+        keep &= np.isin(hotkeys_by_uid, list(hotkeys))
+
+    columns = {"uid": np.flatnonzero(keep).astype(np.int32), "hotkey": hotkeys_by_uid[keep]}
+    for name, row in zip(task_names, scores, strict=True):
+        columns[f"score_{name}"] = row[keep]
+    return columns
+
+
+def summarize(columns: dict[str, np.ndarray]) -> dict:
+    """Summary statistics of history columns, overall and per miner."""
+    valid = columns["prediction"] != -1
+    predictions, labels, uids = columns["prediction"][valid], columns["label"][valid], columns["uid"][valid]
+    correct = np.round(predictions) == labels
+    squared_errors = (predictions - labels) ** 2
+
+    miners = {}
+    if uids.size:
+        miner_uids, inverse, counts = np.unique(uids, return_inverse=True, return_counts=True)
+        accuracies = np.bincount(inverse, weights=correct) / counts
+        brier_scores = np.bincount(inverse, weights=squared_errors) / counts
+        miners = {
+            int(uid): {"predictions": int(count), "accuracy": float(accuracy), "brier_score": float(brier)}
+            for uid, count, accuracy, brier in zip(miner_uids, counts, accuracies, brier_scores, strict=True)
+        }
+
+    return {
+        "rows": len(columns["uid"]),
+        "miners": len(np.unique(columns["uid"])),
+        "invalid_share": float(1 - valid.mean()) if valid.size else None,
+        "accuracy": float(correct.mean()) if correct.size else None,
+        "brier_score": float(squared_errors.mean()) if squared_errors.size else None,
+        "by_miner": miners,
+    }
+
+
+def write_columns(columns: dict[str, np.ndarray], path: str, file_format: str) -> str:
+    """Writes the columns to `<path>.<format>`, returns the written path."""
+    if file_format == "parquet":
+        import pyarrow as pa  # noqa: PLC0415 - optional dependency
+        import pyarrow.parquet as pq  # noqa: PLC0415
+
+        path = f"{path}.parquet"
+        pq.write_table(pa.table(columns), path)
+    else:
+        path = f"{path}.npz"
+        np.savez(path, **columns)
+    return path
+
+
+def _default_format() -> str:
+    return "parquet" if importlib.util.find_spec("pyarrow") is not None else "npz"
+
+
+def _format_metric(value: float | None) -> str:
+    return "-" if value is None else f"{value:.4f}"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("state_dir", help="Validator state directory, the neuron.full_path of the validator.")
+    parser.add_argument("--output", help="Directory the columns are written to, only statistics are printed if unset.")
+    parser.add_argument("--format", choices=["parquet", "npz"], help="Output format, parquet if pyarrow is installed.")
+    parser.add_argument("--uid", type=int, action="append", help="Only export this miner UID, can be repeated.")
+    parser.add_argument("--hotkey", action="append", help="Only export this miner hotkey, can be repeated.")
+    parser.add_argument("--per-miner", action="store_true", help="Print the statistics of every miner.")
+    args = parser.parse_args(argv)
+
+    # Unpickling the trackers imports bittensor, which parses the command line as well, e.g. it would answer --help.
+    import joblib  # noqa: PLC0415 - only needed once the arguments are valid
+
+    file_format = args.format or _default_format()
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+    out = sys.stdout
+
+    state_path = os.path.join(args.state_dir, "state.npz")
+    if os.path.exists(state_path):
+        with np.load(state_path) as npz:
+            state = dict(npz)
+        columns = score_columns(state, args.uid, args.hotkey)
+        out.write(f"state: step {int(state['step'])}, {len(columns['uid'])} miners\n")
+        if args.output:
+            out.write(f"  written to {write_columns(columns, os.path.join(args.output, 'scores'), file_format)}\n")
+
+    history_paths = sorted(glob.glob(os.path.join(glob.escape(args.state_dir), f"*{HISTORY_SUFFIX}")))
+    if not history_paths:
+        out.write(f"No performance history found in {args.state_dir}\n")
+        return 1
+
+    for path in history_paths:
+        task_name = os.path.basename(path)[: -len(HISTORY_SUFFIX)]
+        tracker = joblib.load(path)
+        columns = history_columns(tracker, args.uid, args.hotkey)
+        del tracker
+
+        summary = summarize(columns)
+        out.write(
+            f"{task_name}: {summary['rows']} predictions of {summary['miners']} miners, "
+            f"invalid {_format_metric(summary['invalid_share'])}, accuracy {_format_metric(summary['accuracy'])}, "
+            f"brier score {_format_metric(summary['brier_score'])}\n"
+        )
+        if args.per_miner:
+            for uid, stats in summary["by_miner"].items():
+                out.write(
+                    f"  uid {uid}: {stats['predictions']} predictions, accuracy {stats['accuracy']:.4f}, "
+                    f"brier score {stats['brier_score']:.4f}\n"
+                )
+        if args.output:
+            written_path = write_columns(columns, os.path.join(args.output, f"{task_name}_history"), file_format)
+            out.write(f"  written to {written_path}\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
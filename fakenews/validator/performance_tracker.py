@@ -1,8 +1,13 @@
+import copy
+import math
 from collections import deque
+from http import HTTPStatus
+from typing import ClassVar
 
 import bittensor as bt
 import numpy as np
-from sklearn.metrics import accuracy_score
+
+from fakenews.validator.history import CompactHistory
 
 
 class PerformanceTracker:
@@ -10,14 +15,232 @@ class PerformanceTracker:
     Tracks all recent miner performance to facilitate reward computation.
     """
 
+    # Version of the header written next to the pickled tracker.
+    HEADER_VERSION = 1
+
     STORE_LAST_N_PREDICTIONS_DEFAULT = 500
+    STORE_LAST_N_RESPONSES = 300
+
+    PREDICTION_METRICS: ClassVar[tuple[str, ...]] = ("accuracy",)
+    CALIBRATION_METRICS: ClassVar[tuple[str, ...]] = ("brier_score", "log_loss", "calibration_error")
+    DECAY_METRICS: ClassVar[tuple[str, ...]] = ("decayed_accuracy_long", "decayed_accuracy_short")
+    RESPONSE_METRICS: ClassVar[tuple[str, ...]] = ("latency_p50", "latency_p95", "timeout_rate")
+    DEFAULT_METRICS: ClassVar[tuple[str, ...]] = ("accuracy",)
+    _EMPTY_METRICS: ClassVar[dict[str, float | None]] = {
+        "accuracy": 0,
+        "brier_score": None,
+        "log_loss": None,
+        "calibration_error": None,
+        "decayed_accuracy_long": 0,
+        "decayed_accuracy_short": 0,
+        "latency_p50": None,
+        "latency_p95": None,
+        "timeout_rate": None,
+    }
+
+    # Windows, besides the full history, for which calibration sums are kept up to date, the reward windows.
+    SUMMED_WINDOWS: ClassVar[tuple[int, ...]] = (20, 300)
+    CALIBRATION_BINS = 10
+    # Running sums: valid predictions, squared errors, log-losses, correct predictions, then one column per bin.
+    _SUMS_SIZE = 4 + CALIBRATION_BINS
+    # Probabilities are clipped to [eps, 1 - eps] for the log-loss.
+    LOG_LOSS_EPS = 1e-15
+
+    # Half-lives, in predictions, of the decayed accuracies. A half-life of W * ln(2) gives the predictions the same
+    # mean weight as a window of W predictions, these match the long and short reward windows.
+    LONG_HALF_LIFE_DEFAULT: ClassVar[float] = 300 * math.log(2)
+    SHORT_HALF_LIFE_DEFAULT: ClassVar[float] = 20 * math.log(2)
 
-    def __init__(self, store_last_n_predictions: int = STORE_LAST_N_PREDICTIONS_DEFAULT):
+    def __init__(
+        self,
+        store_last_n_predictions: int = STORE_LAST_N_PREDICTIONS_DEFAULT,
+        long_half_life: float = LONG_HALF_LIFE_DEFAULT,
+        short_half_life: float = SHORT_HALF_LIFE_DEFAULT,
+    ):
         self.prediction_history: dict[int, deque] = {}
         self.label_history: dict[int, deque] = {}
         self.miner_hotkeys: dict[int, str] = {}
         self.store_last_n_predictions: int = store_last_n_predictions
 
+        # Exponentially weighted sums of the correct predictions, for the long and short half-lives.
+        self.decay_half_lives: tuple[float, float] = (long_half_life, short_half_life)
+        self.decayed_sums: dict[int, list[float]] = {}
+
+        # Per-response transport metadata, kept in fixed size ring buffers.
+        self.latency_history: dict[int, np.ndarray] = {}
+        self.status_history: dict[int, np.ndarray] = {}
+        self.response_counts: dict[int, int] = {}
+
+        self._init_running_sums()
+        self._init_metrics_cache()
+
+    # The metrics cache is rebuilt on demand and the running sums are derived from the histories, neither is pickled.
+    _DERIVED_STATE = ("_metrics_cache", "_history_versions", "_running_sums")
+
+    def __getstate__(self) -> dict:
+        state = {key: value for key, value in self.__dict__.items() if key not in self._DERIVED_STATE}
+        return self._compact_state(state)
+
+    @staticmethod
+    def _compact_state(state: dict) -> dict:
+        """Replaces the prediction and label deques of a pickled state with compact histories."""
+        state = dict(state)
+        try:
+            state["compact_history"] = {
+                uid: CompactHistory.from_deques(predictions, state["label_history"][uid])
+                for uid, predictions in state["prediction_history"].items()
+            }
+        except ValueError as e:
+            bt.logging.warning(f"Pickling the full performance history, it can't be compacted: {e}")
+        else:
+            del state["prediction_history"], state["label_history"]
+        return state
+
+    def __setstate__(self, state: dict):
+        if "compact_history" in state:
+            maxlen = state["store_last_n_predictions"]
+            state["prediction_history"], state["label_history"] = {}, {}
+            for uid, history in state.pop("compact_history").items():
+                state["prediction_history"][uid], state["label_history"][uid] = history.to_deques(maxlen)
+
+        # Trackers pickled before response metadata was tracked don't have these attributes.
+        state.setdefault("latency_history", {})
+        state.setdefault("status_history", {})
+        state.setdefault("response_counts", {})
+        state.setdefault("decay_half_lives", (self.LONG_HALF_LIFE_DEFAULT, self.SHORT_HALF_LIFE_DEFAULT))
+        self.__dict__.update(state)
+        if "decayed_sums" not in state:
+            # Trackers pickled before the decayed accuracies were tracked, start them from the stored history.
+            self.decayed_sums = {}
+            for uid in self.prediction_history:
+                self.decayed_sums[uid] = [0.0, 0.0]
+                for prediction, label in zip(self.prediction_history[uid], self.label_history[uid], strict=True):
+                    self._update_decayed_sums(uid, prediction, label)
+        self._init_running_sums()
+        self._init_metrics_cache()
+
+    def _init_metrics_cache(self):
+        # Metrics computed per (uid, window, metrics), valid as long as the history version of the uid is unchanged.
+        self._metrics_cache: dict[tuple[int, int | None, tuple[str, ...]], tuple[int, dict]] = {}
+        self._history_versions: dict[int, int] = {}
+
+    def _bump_history_version(self, uid: int):
+        self._history_versions[uid] = self._history_versions.get(uid, 0) + 1
+
+    @property
+    def _running_windows(self) -> tuple[int, ...]:
+        return (*(w for w in self.SUMMED_WINDOWS if w < self.store_last_n_predictions), self.store_last_n_predictions)
+
+    def _init_running_sums(self):
+        """
+        Builds the running sums of every miner from its history.
+
+        Sums are kept per miner as an array of shape (windows, _SUMS_SIZE), with a row per running window: the number
+        of valid predictions, the sum of squared errors, the sum of log-losses, the number of correct predictions and,
+        per probability bin, the sum of prediction minus label.
+        """
+        self._running_sums: dict[int, np.ndarray] = {}
+        for uid in self.prediction_history:
+            predictions = np.asarray(self.prediction_history[uid], dtype=np.float64)
+            labels = np.asarray(self.label_history[uid], dtype=np.float64)
+            self._running_sums[uid] = np.stack(
+                [self._history_sums(predictions[-w:], labels[-w:]) for w in self._running_windows]
+            )
+
+    @classmethod
+    def _history_sums(cls, predictions: np.ndarray, labels: np.ndarray) -> np.ndarray:
+        sums = np.zeros(cls._SUMS_SIZE)
+        valid = predictions != -1
+        probs = np.clip(predictions[valid], 0.0, 1.0)
+        labels = labels[valid]
+        if probs.size == 0:
+            return sums
+
+        clipped = np.clip(probs, cls.LOG_LOSS_EPS, 1 - cls.LOG_LOSS_EPS)
+        bins = np.minimum((probs * cls.CALIBRATION_BINS).astype(np.int64), cls.CALIBRATION_BINS - 1)
+        sums[0] = probs.size
+        sums[1] = np.sum((probs - labels) ** 2)
+        sums[2] = -np.sum(labels * np.log(clipped) + (1 - labels) * np.log(1 - clipped))
+        sums[3] = np.sum(np.round(predictions[valid]) == labels)
+        sums[4:] = np.bincount(bins, weights=probs - labels, minlength=cls.CALIBRATION_BINS)
+        return sums
+
+    @classmethod
+    def _sample_sums(cls, prediction: float, label: int) -> np.ndarray | None:
+        if prediction == -1:
+            return None
+        prob = min(max(float(prediction), 0.0), 1.0)
+        clipped = min(max(prob, cls.LOG_LOSS_EPS), 1 - cls.LOG_LOSS_EPS)
+
+        sums = [0.0] * cls._SUMS_SIZE
+        sums[0] = 1.0
+        sums[1] = (prob - label) ** 2
+        sums[2] = -math.log(clipped) if label else -math.log(1 - clipped)
+        sums[3] = float(round(prediction) == label)
+        sums[4 + min(int(prob * cls.CALIBRATION_BINS), cls.CALIBRATION_BINS - 1)] = prob - label
+        return np.array(sums)
+
+    @property
+    def _decays(self) -> tuple[float, ...]:
+        return tuple(0.5 ** (1 / half_life) for half_life in self.decay_half_lives)
+
+    def _update_decayed_sums(self, uid: int, prediction: float, label: int):
+        if prediction == -1:
+            return
+        correct = float(round(prediction) == label)
+        sums = self.decayed_sums[uid]
+        for i, decay in enumerate(self._decays):
+            sums[i] = decay * sums[i] + correct
+
+    def _update_running_sums(self, uid: int, prediction: float, label: int):
+        """Adds a prediction to the running sums, and removes the predictions it pushes out of each window."""
+        predictions = self.prediction_history[uid]
+        labels = self.label_history[uid]
+        sums = self._running_sums[uid]
+        incoming = self._sample_sums(prediction, label)
+
+        for i, window in enumerate(self._running_windows):
+            if incoming is not None:
+                sums[i] += incoming
+            if len(predictions) >= window:
+                outgoing = self._sample_sums(predictions[-window], labels[-window])
+                if outgoing is not None:
+                    sums[i] -= outgoing
+            if sums[i, 0] == 0:
+                # Empty window, drop the floating point residue of the subtractions.
+                sums[i] = 0
+
+    def snapshot(self) -> "TrackerSnapshot":
+        """
+        Copies the state of the tracker, the copy can be pickled from another thread while the tracker is updated.
+
+        The histories are only compacted when the snapshot is pickled, so it's cheap to take on the event loop.
+        """
+        state = {}
+        for key, value in self.__dict__.items():
+            if key in self._DERIVED_STATE:
+                continue
+            if isinstance(value, dict):
+                # Per-uid deques, lists and arrays of numbers or immutable values, copying each is enough and much
+                # faster than a deep copy.
+                state[key] = {
+                    uid: item.copy() if isinstance(item, (deque, list, np.ndarray)) else item for uid, item in value.items()
+                }
+            else:
+                state[key] = copy.deepcopy(value)
+        return TrackerSnapshot(state)
+
+    def header(self) -> dict:
+        """Summary of the tracker that can be read without unpickling it."""
+        full_window = len(self._running_windows) - 1
+        return {
+            "version": self.HEADER_VERSION,
+            "store_last_n_predictions": self.store_last_n_predictions,
+            "num_miners": len(self.prediction_history),
+            "num_miners_with_predictions": sum(1 for sums in self._running_sums.values() if sums[full_window, 0] > 0),
+            "num_predictions": sum(len(history) for history in self.prediction_history.values()),
+        }
+
     def validate_storage_predictions_count(self):
         if self.store_last_n_predictions != self.STORE_LAST_N_PREDICTIONS_DEFAULT:
             bt.logging.warning(
@@ -46,6 +269,9 @@ class PerformanceTracker:
                         maxlen=self.store_last_n_predictions,
                     )
 
+            self._init_running_sums()
+            self._init_metrics_cache()
+
     def reset_miner_history(self, uid: int, miner_hotkey: str):
         """
         Reset the history for a miner.
@@ -53,6 +279,12 @@ class PerformanceTracker:
         self.prediction_history[uid] = deque(maxlen=self.store_last_n_predictions)
         self.label_history[uid] = deque(maxlen=self.store_last_n_predictions)
         self.miner_hotkeys[uid] = miner_hotkey
+        self.latency_history[uid] = np.zeros(self.STORE_LAST_N_RESPONSES, dtype=np.float32)
+        self.status_history[uid] = np.zeros(self.STORE_LAST_N_RESPONSES, dtype=np.uint16)
+        self.response_counts[uid] = 0
+        self._running_sums[uid] = np.zeros((len(self._running_windows), self._SUMS_SIZE))
+        self.decayed_sums[uid] = [0.0, 0.0]
+        self._bump_history_version(uid)
 
     def update(self, uid: int, prediction: int, label: int, miner_hotkey: str):
         """
@@ -63,8 +295,31 @@ class PerformanceTracker:
             self.reset_miner_history(uid, miner_hotkey)
 
         # Update histories
+        self._update_running_sums(uid, prediction, label)
+        self._update_decayed_sums(uid, prediction, label)
         self.prediction_history[uid].append(prediction)
         self.label_history[uid].append(label)
+        self._bump_history_version(uid)
+
+    def update_response(self, uid: int, latency: float, status_code: int, miner_hotkey: str):
+        """
+        Update the miner response metadata history
+        """
+        # Reset histories if miner is new or miner address has changed
+        if uid not in self.prediction_history or self.miner_hotkeys.get(uid) != miner_hotkey:
+            self.reset_miner_history(uid, miner_hotkey)
+
+        if uid not in self.response_counts:
+            # History loaded from a tracker pickled before response metadata was tracked.
+            self.latency_history[uid] = np.zeros(self.STORE_LAST_N_RESPONSES, dtype=np.float32)
+            self.status_history[uid] = np.zeros(self.STORE_LAST_N_RESPONSES, dtype=np.uint16)
+            self.response_counts[uid] = 0
+
+        position = self.response_counts[uid] % self.STORE_LAST_N_RESPONSES
+        self.latency_history[uid][position] = latency
+        self.status_history[uid][position] = status_code
+        self.response_counts[uid] += 1
+        self._bump_history_version(uid)
 
     def get_metrics(self, uid: int, window: int | None = None, target_metrics: list[str] | None = None):
         """
@@ -73,21 +328,51 @@ class PerformanceTracker:
         Args:
         - uid (int): Miner UID key
         - window (int, optional): The number of recent predictions to consider. If None, all stored predictions are used.
+            Response metrics consider the same number of recent responses.
+        - target_metrics (list[str], optional): Metrics to compute. Defaults to DEFAULT_METRICS.
 
         Returns:
         - dict:
             [accuracy] (float): The accuracy of the miner's predictions
+            [brier_score] (float | None): Mean squared error of the predicted probabilities
+            [log_loss] (float | None): Mean log-loss of the predicted probabilities
+            [calibration_error] (float | None): Expected calibration error over CALIBRATION_BINS probability bins
+            [decayed_accuracy_long] (float): Exponentially decayed accuracy with the long half-life
+            [decayed_accuracy_short] (float): Exponentially decayed accuracy with the short half-life
+            [latency_p50] (float | None): Median latency of the successful responses
+            [latency_p95] (float | None): 95th percentile latency of the successful responses
+            [timeout_rate] (float | None): Fraction of the responses that timed out
+
+        Unlike the accuracy, calibration metrics aren't scaled down when the window isn't full. Prediction metrics are
+        read from running sums for the full history and SUMMED_WINDOWS, other windows are computed from the history.
+
+        Decayed accuracies ignore the window. Like the accuracy of a window that isn't full, they start low and
+        approach the accuracy of the miner as predictions are added.
+
+        Metrics are cached until the history of the miner changes.
         """
-        available_metrics = {
-            "accuracy": 0,
-        }
+        target_metrics = tuple(target_metrics or self.DEFAULT_METRICS)
+        unknown_metrics = set(target_metrics) - set(self._EMPTY_METRICS)
+        if unknown_metrics:
+            raise ValueError(f"Unknown metrics requested: {sorted(unknown_metrics)}")
+
+        key = (uid, window, target_metrics)
+        version = self._history_versions.get(uid, 0)
+        cached = self._metrics_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return dict(cached[1])
+
+        metrics = self._compute_metrics(uid, window, target_metrics)
+        self._metrics_cache[key] = (version, metrics)
+        return dict(metrics)
+
+    def _compute_metrics(self, uid: int, window: int | None, target_metrics: tuple[str, ...]) -> dict:
+        available_metrics = {metric: self._EMPTY_METRICS[metric] for metric in target_metrics}
 
         if uid not in self.prediction_history:
             return available_metrics
 
-        recent_preds = list(self.prediction_history[uid])
-        recent_labels = list(self.label_history[uid])
-
+        history_length = len(self.prediction_history[uid])
         window_k = 1
 
         # If window is larger than available data, use all available data
@@ -102,29 +387,94 @@ class PerformanceTracker:
                 )
                 window = min(window, self.store_last_n_predictions)
 
-            _window = min(window, len(recent_preds))
-            recent_preds = recent_preds[-_window:]
-            recent_labels = recent_labels[-_window:]
+            _window = min(window, history_length)
             window_k = _window / window
 
-        keep_idx = [i for i, p in enumerate(recent_preds) if p != -1]
-        pred_probs = np.array([recent_preds[i] for i in keep_idx])
-        predictions = np.round(pred_probs)
-        labels = np.array([recent_labels[i] for i in keep_idx])
-
-        if len(labels) == 0 or len(predictions) == 0:
-            return available_metrics
+        if any(metric in self.RESPONSE_METRICS for metric in target_metrics):
+            available_metrics.update(
+                {
+                    metric: value
+                    for metric, value in self._get_response_metrics(uid, window).items()
+                    if metric in target_metrics
+                }
+            )
 
-        try:
-            accuracy = accuracy_score(labels, predictions) * window_k
+        if any(metric in self.DECAY_METRICS for metric in target_metrics):
             available_metrics.update(
                 {
-                    "accuracy": accuracy,
+                    metric: value * (1 - decay)
+                    for metric, value, decay in zip(self.DECAY_METRICS, self.decayed_sums[uid], self._decays, strict=True)
+                    if metric in target_metrics
                 }
             )
 
-        except Exception as e:
-            bt.logging.warning(f"Error in reward computation: {e}")
+        if not any(metric in self.PREDICTION_METRICS or metric in self.CALIBRATION_METRICS for metric in target_metrics):
             return available_metrics
 
+        sums = self._window_sums(uid, window)
+        count = sums[0]
+        if count == 0:
+            return available_metrics
+
+        if "accuracy" in target_metrics:
+            available_metrics["accuracy"] = float(sums[3] / count) * window_k
+        calibration_metrics = {
+            "brier_score": float(sums[1] / count),
+            "log_loss": float(sums[2] / count),
+            "calibration_error": float(np.sum(np.abs(sums[4:])) / count),
+        }
+        available_metrics.update(
+            {metric: value for metric, value in calibration_metrics.items() if metric in target_metrics}
+        )
+
         return available_metrics
+
+    def _window_sums(self, uid: int, window: int | None) -> np.ndarray:
+        """Sums of the last `window` predictions, read from the running sums for the full history and SUMMED_WINDOWS."""
+        windows = self._running_windows
+        window = self.store_last_n_predictions if window is None else window
+        if window in windows:
+            return self._running_sums[uid][windows.index(window)]
+
+        predictions = np.asarray(self.prediction_history[uid], dtype=np.float64)[-window:]
+        labels = np.asarray(self.label_history[uid], dtype=np.float64)[-window:]
+        return self._history_sums(predictions, labels)
+
+    def _get_response_metrics(self, uid: int, window: int | None) -> dict[str, float | None]:
+        count = min(self.response_counts.get(uid, 0), self.STORE_LAST_N_RESPONSES)
+        if window is not None:
+            count = min(count, window)
+        if count == 0:
+            return {metric: self._EMPTY_METRICS[metric] for metric in self.RESPONSE_METRICS}
+
+        # Ring buffer positions of the last `count` responses.
+        positions = (self.response_counts[uid] - 1 - np.arange(count)) % self.STORE_LAST_N_RESPONSES
+        latencies = self.latency_history[uid][positions]
+        statuses = self.status_history[uid][positions]
+
+        successful_latencies = latencies[statuses == HTTPStatus.OK]
+        latency_p50 = latency_p95 = None
+        if successful_latencies.size > 0:
+            latency_p50, latency_p95 = (float(p) for p in np.percentile(successful_latencies, [50, 95]))
+
+        return {
+            "latency_p50": latency_p50,
+            "latency_p95": latency_p95,
+            "timeout_rate": float(np.mean(statuses == HTTPStatus.REQUEST_TIMEOUT)),
+        }
+
+
+class TrackerSnapshot:
+    """Point in time state of a `PerformanceTracker`, unpickled as the tracker itself."""
+
+    def __init__(self, state: dict):
+        self.state = state
+
+    def __reduce__(self):
+        return _restore_tracker, (PerformanceTracker._compact_state(self.state),)  # noqa: SLF001
+
+
+def _restore_tracker(state: dict) -> PerformanceTracker:
+    tracker = PerformanceTracker.__new__(PerformanceTracker)
+    tracker.__setstate__(state)
+    return tracker
@@ -0,0 +1,85 @@
+import asyncio
+import math
+from collections.abc import AsyncIterator
+
+import bittensor as bt
+import numpy as np
+
+from fakenews.protocol import ArticleSynapse
+from fakenews.validator.response import MinerResponse
+
+
+async def query_miner(
+    dendrite: bt.dendrite,
+    uid: int,
+    axon: bt.AxonInfo,
+    synapse: ArticleSynapse,
+    timeout: float,  # noqa: ASYNC109
+) -> MinerResponse:
+    """Queries a single miner, the dendrite sends a copy of the synapse."""
+    synapses = await dendrite(axons=[axon], synapse=synapse, deserialize=False, timeout=timeout)
+    return MinerResponse.from_synapse(uid, axon, synapses[0], timeout)
+
+
+async def stream_miner_responses(
+    dendrite: bt.dendrite,
+    uids: np.ndarray,
+    axons: list[bt.AxonInfo],
+    synapse: ArticleSynapse,
+    timeout: float,  # noqa: ASYNC109
+    *,
+    quorum: float = 1.0,
+    grace: float = 0.0,
+) -> AsyncIterator[MinerResponse]:
+    """
+    Queries the miners concurrently and yields their responses in the order they arrive.
+
+    Once `quorum` (a share of the queried miners) answered successfully, the stragglers get `grace` more seconds. The
+    ones still pending after that are cancelled and yielded as cut responses, see `MinerResponse.cut`, so the slowest
+    miners don't set the step time. With the default quorum of 1.0 every miner gets the full timeout.
+
+    Args:
+        dendrite (bt.dendrite): Dendrite to query the miners with.
+        uids (np.ndarray): Miner UIDs.
+        axons (list[bt.AxonInfo]): Miner axons, aligned with `uids`.
+        synapse (ArticleSynapse): Synapse to send.
+        timeout (float): Dendrite timeout in seconds.
+        quorum (float): Share of the miners that should answer before the stragglers are cut off.
+        grace (float): Seconds the stragglers get once the quorum is reached.
+    """
+    queries = {
+        asyncio.create_task(query_miner(dendrite, uid, axon, synapse, timeout)): (uid, axon)
+        for uid, axon in zip(uids, axons, strict=True)
+    }
+    pending = set(queries)
+    quorum_size = math.ceil(quorum * len(queries))
+    loop = asyncio.get_running_loop()
+    deadline = None
+    answered = 0
+
+    try:
+        while pending:
+            wait_timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            done, pending = await asyncio.wait(pending, timeout=wait_timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+
+            for query in done:
+                response = query.result()
+                # Fast failures don't count, they would cut the miners still working on an answer.
+                answered += response.is_success
+                yield response
+
+            if deadline is None and answered >= quorum_size and pending:
+                deadline = loop.time() + grace
+
+        if pending:
+            bt.logging.debug(f"Quorum reached, cancelling {len(pending)} queries still pending after {grace}s grace")
+        for query in pending:
+            query.cancel()
+        for query in pending:
+            uid, axon = queries[query]
+            yield MinerResponse.cut(uid, axon, len(synapse.articles_to_review), timeout)
+    finally:
+        for query in pending:
+            query.cancel()
@@ -0,0 +1,153 @@
+import glob
+import gzip
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+from collections.abc import Iterator
+from typing import Final
+
+import bittensor as bt
+
+SEGMENT_PREFIX: Final[str] = "steps-"
+SEGMENT_SUFFIX: Final[str] = ".jsonl.gz"
+
+
+def article_id(body: str) -> str:
+    """Short id of an article body, used where the body itself is too large to log."""
+    return hashlib.sha1(body.encode(), usedforsecurity=False).hexdigest()[:16]
+
+
+class StepRecorder:
+    """
+    Appends a record of every forward step to gzipped JSON lines segments, the input of `fakenews.validator.replay`.
+
+    Records are written to `steps-<start time in ns>.jsonl.gz` files in `directory`. A segment is closed once it holds
+    `max_bytes` of compressed records and only the last `max_segments` segments are kept.
+
+    `record` only enqueues the record, a background thread compresses and writes it, so the event loop never waits for
+    the disk. Every record is flushed once written, so a crash loses at most the records still queued. When the queue
+    is full new records are dropped.
+    """
+
+    VERSION: Final[int] = 1
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_segments: int = 30,
+        queue_size: int = 256,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_segments = max_segments
+
+        os.makedirs(directory, exist_ok=True)
+        self._raw = None
+        self._file: gzip.GzipFile | None = None
+        # Records to write, None closes the current segment.
+        self._queue: queue.Queue[dict | None] = queue.Queue(maxsize=queue_size)
+        self._dropped = 0
+        self._thread = threading.Thread(target=self._run, name="step-recorder", daemon=True)
+        self._thread.start()
+
+    def record(self, record: dict) -> bool:
+        """
+        Enqueues a step record without blocking, failures to write it are logged and don't interrupt the step.
+
+        The record is serialized by the worker, so it shouldn't be mutated after it was passed here.
+
+        Returns:
+            bool: Whether the record was enqueued, False when it was dropped because the queue is full.
+        """
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self._dropped += 1
+            if self._dropped == 1 or self._dropped % 100 == 0:
+                bt.logging.warning(f"Step recording queue is full, {self._dropped} records dropped so far")
+            return False
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Waits until every enqueued record was written.
+
+        Returns:
+            bool: Whether the queue was drained before the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: float | None = 60) -> bool:
+        """
+        Writes the queued records and closes the current segment, a later record opens a new one.
+
+        Returns:
+            bool: Whether the records were written and the segment closed before the timeout.
+        """
+        self._queue.put(None)
+        return self.flush(timeout)
+
+    def _run(self):
+        while True:
+            record = self._queue.get()
+            try:
+                if record is None:
+                    self._close_segment()
+                else:
+                    self._write(record)
+            except Exception as e:
+                bt.logging.warning(f"Failed to record the step: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, record: dict):
+        if self._file is None or self._raw.tell() >= self.max_bytes:
+            self._open_segment()
+        self._file.write(json.dumps({"v": self.VERSION, **record}, separators=(",", ":")).encode() + b"\n")
+        self._file.flush()
+
+    def _close_segment(self):
+        if self._file is not None:
+            self._file.close()
+            self._raw.close()
+            self._file = self._raw = None
+
+    def _open_segment(self):
+        self._close_segment()
+        name = f"{SEGMENT_PREFIX}{time.time_ns()}{SEGMENT_SUFFIX}"
+        self._raw = open(os.path.join(self.directory, name), "ab")  # noqa: SIM115 - kept open across steps
+        self._file = gzip.GzipFile(fileobj=self._raw, mode="ab")
+
+        for path in segment_paths(self.directory)[: -self.max_segments]:
+            os.remove(path)
+
+
+def segment_paths(directory: str) -> list[str]:
+    """Segments written by `StepRecorder`, oldest first."""
+    return sorted(glob.glob(os.path.join(glob.escape(directory), f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}")))
+
+
+def read_steps(directory: str) -> Iterator[dict]:
+    """Yields the recorded steps, oldest first. A truncated last record, e.g. after a crash, is skipped."""
+    for path in segment_paths(directory):
+        with gzip.open(path, "rb") as f:
+            try:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        bt.logging.warning(f"Skipping a malformed step record in {path}")
+            except EOFError:
+                bt.logging.warning(f"Step records segment {path} is truncated")
@@ -0,0 +1,171 @@
+"""
+Replays recorded forward steps to rebuild the performance trackers and the scores with different reward parameters.
+
+    python -m fakenews.validator.replay <steps directory> [--long-term-window N] [--short-term-window N]
+        [--long-alpha A] [--moving-average-alpha A] [--reward-mode window|decay]
+
+Steps are recorded by the validator with `--neuron.record_steps`, in the `steps` directory of its state directory.
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+# Imports bittensor, which would parse the command line first, see `main`.
+if TYPE_CHECKING:
+    from fakenews.validator.performance_tracker import PerformanceTracker
+
+
+@dataclass(frozen=True)
+class ReplayTask:
+    """Stands in for the validator task a step was recorded with, the reward only reads its name and weight."""
+
+    TASK_NAME: str
+    REWARD_WEIGHT: float
+
+
+@dataclass
+class ReplayResult:
+    steps: int = 0
+    seconds: float = 0.0
+    trackers: dict[str, "PerformanceTracker"] = field(default_factory=dict)
+    scores: dict[str, np.ndarray] = field(default_factory=dict)
+    reward_weights: dict[str, float] = field(default_factory=dict)
+
+    def weighted_scores(self) -> np.ndarray:
+        """Scores of the tasks combined by their reward weight, as the validator sets weights."""
+        size = max((len(scores) for scores in self.scores.values()), default=0)
+        weighted = np.zeros(size, dtype=np.float32)
+        for name, scores in self.scores.items():
+            weighted[: len(scores)] += self.reward_weights[name] * scores
+        return weighted
+
+
+def replay(
+    steps: Iterable[dict],
+    *,
+    long_term_window: int | None = None,
+    short_term_window: int | None = None,
+    long_alpha: float | None = None,
+    moving_average_alpha: float = 0.1,
+    reward_mode: str = "window",
+) -> ReplayResult:
+    """
+    Rebuilds the trackers and scores from recorded steps, with the reward parameters overridden where given.
+
+    Scores follow `BaseValidatorNeuron.update_scores`. The scores of a uid are reset when its hotkey changes, as the
+    metagraph resync does.
+    """
+    from fakenews.validator.performance_tracker import PerformanceTracker  # noqa: PLC0415 - imports bittensor
+    from fakenews.validator.reward import RewardCalculator  # noqa: PLC0415 - imports bittensor
+
+    overrides = {
+        name: value
+        for name, value in (
+            ("_LONG_TERM_WINDOW", long_term_window),
+            ("_SHORT_TERM_WINDOW", short_term_window),
+            ("_LONG_ALPHA", long_alpha),
+        )
+        if value is not None
+    }
+    calculator = type("ReplayRewardCalculator", (RewardCalculator,), overrides)
+
+    result = ReplayResult()
+    tasks: dict[str, ReplayTask] = {}
+    trackers: dict[ReplayTask, PerformanceTracker] = {}
+    hotkeys: dict[int, str] = {}
+    started_at = time.perf_counter()
+
+    for step in steps:
+        name = step["task"]
+        if name not in tasks:
+            tasks[name] = ReplayTask(name, step["reward_weight"])
+            trackers[tasks[name]] = PerformanceTracker()
+            result.scores[name] = np.zeros(0, dtype=np.float32)
+            result.reward_weights[name] = step["reward_weight"]
+        task = tasks[name]
+
+        uids = np.asarray(step["uids"], dtype=np.int64)
+        if uids.size == 0:
+            continue
+        _grow_scores(result.scores, int(uids.max()) + 1)
+        for uid, hotkey in zip(step["uids"], step["hotkeys"], strict=True):
+            if hotkeys.get(uid, hotkey) != hotkey:
+                for scores in result.scores.values():
+                    scores[uid] = 0
+            hotkeys[uid] = hotkey
+
+        rewards = np.array(
+            [
+                calculator.get_miner_reward(
+                    labels=step["labels"],
+                    probs=probs,
+                    uid=uid,
+                    hotkey=hotkey,
+                    performance_trackers=trackers,
+                    current_task=task,
+                    reward_mode=reward_mode,
+                )[0]
+                for uid, hotkey, probs in zip(step["uids"], step["hotkeys"], step["responses"], strict=True)
+            ]
+        ) * np.asarray(step["stake"], dtype=np.float32)
+
+        scores = result.scores[name]
+        scores[uids] = moving_average_alpha * rewards + (1 - moving_average_alpha) * scores[uids]
+        result.steps += 1
+
+    result.seconds = time.perf_counter() - started_at
+    result.trackers = {task.TASK_NAME: tracker for task, tracker in trackers.items()}
+    return result
+
+
+def _grow_scores(scores: dict[str, np.ndarray], size: int):
+    for name, task_scores in scores.items():
+        if len(task_scores) < size:
+            grown = np.zeros(size, dtype=np.float32)
+            grown[: len(task_scores)] = task_scores
+            scores[name] = grown
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("steps_dir", help="Directory of the recorded steps.")
+    parser.add_argument("--long-term-window", type=int)
+    parser.add_argument("--short-term-window", type=int)
+    parser.add_argument("--long-alpha", type=float)
+    parser.add_argument("--moving-average-alpha", type=float, default=0.1)
+    parser.add_argument("--reward-mode", default="window", help="Reward mode, window or decay.")
+    parser.add_argument("--top", type=int, default=10, help="Number of top scored miners to print.")
+    args = parser.parse_args(argv)
+
+    # Reading the steps imports bittensor, which parses the command line as well, e.g. it would answer --help.
+    from fakenews.validator.recorder import read_steps  # noqa: PLC0415 - only needed once the arguments are valid
+    from fakenews.validator.reward import RewardCalculator  # noqa: PLC0415 - only needed once the arguments are valid
+
+    if args.reward_mode not in RewardCalculator.REWARD_MODES:
+        parser.error(f"argument --reward-mode: expected one of {', '.join(RewardCalculator.REWARD_MODES)}")
+
+    result = replay(
+        read_steps(args.steps_dir),
+        long_term_window=args.long_term_window,
+        short_term_window=args.short_term_window,
+        long_alpha=args.long_alpha,
+        moving_average_alpha=args.moving_average_alpha,
+        reward_mode=args.reward_mode,
+    )
+
+    out = sys.stdout
+    out.write(f"Replayed {result.steps} steps in {result.seconds:.2f} seconds\n")
+    weighted_scores = result.weighted_scores()
+    for uid in np.argsort(-weighted_scores)[: args.top]:
+        out.write(f"  uid {uid}: {weighted_scores[uid]:.6f}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
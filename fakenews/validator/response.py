@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+from http import HTTPStatus
+
+import bittensor as bt
+
+from fakenews.protocol import ArticleSynapse
+
+# Status codes the dendrite sets when the miner couldn't be reached or didn't answer in time.
+UNREACHABLE_STATUS_CODES = frozenset(
+    {HTTPStatus.REQUEST_TIMEOUT, HTTPStatus.SERVICE_UNAVAILABLE, HTTPStatus.GATEWAY_TIMEOUT}
+)
+
+
+@dataclass
+class MinerResponse:
+    """
+    A miner answer together with the transport metadata the dendrite attached to it.
+    """
+
+    uid: int
+    hotkey: str
+    probabilities: list[float]
+    latency: float
+    status_code: int
+    is_timeout: bool
+    # Cancelled by the validator once the quorum answered, says nothing about the miner.
+    is_cut: bool = False
+
+    @property
+    def is_success(self) -> bool:
+        return self.status_code == HTTPStatus.OK
+
+    @property
+    def is_unreachable(self) -> bool:
+        """Whether the miner didn't answer at all, as opposed to answering with an error."""
+        return self.status_code in UNREACHABLE_STATUS_CODES
+
+    @classmethod
+    def unanswered(cls, uid: int, axon: bt.AxonInfo, num_articles: int, timeout: float) -> "MinerResponse":
+        """
+        Builds the response of a miner that wasn't queried, same as a timed out query.
+        """
+        return cls(
+            uid=int(uid),
+            hotkey=axon.hotkey,
+            probabilities=[-1.0] * num_articles,
+            latency=float(timeout),
+            status_code=HTTPStatus.REQUEST_TIMEOUT,
+            is_timeout=True,
+        )
+
+    @classmethod
+    def cut(cls, uid: int, axon: bt.AxonInfo, num_articles: int, timeout: float) -> "MinerResponse":
+        """Builds the response of a miner whose query was cancelled once the quorum answered."""
+        response = cls.unanswered(uid, axon, num_articles, timeout)
+        response.is_cut = True
+        return response
+
+    @classmethod
+    def from_synapse(cls, uid: int, axon: bt.AxonInfo, synapse: ArticleSynapse, timeout: float) -> "MinerResponse":
+        """
+        Builds the response from a synapse returned by the dendrite with `deserialize=False`.
+
+        Args:
+            uid (int): Miner UID.
+            axon (bt.AxonInfo): Miner axon the synapse was sent to.
+            synapse (ArticleSynapse): Synapse returned by the dendrite.
+            timeout (float): Timeout the miner was queried with, used as the latency of unanswered queries.
+        """
+        status_code = synapse.dendrite.status_code
+        status_code = int(status_code) if status_code is not None else HTTPStatus.REQUEST_TIMEOUT
+        is_timeout = status_code == HTTPStatus.REQUEST_TIMEOUT
+
+        process_time = synapse.dendrite.process_time
+        latency = float(process_time) if process_time is not None and not is_timeout else float(timeout)
+
+        return cls(
+            uid=int(uid),
+            hotkey=axon.hotkey,
+            probabilities=synapse.deserialize(),
+            latency=latency,
+            status_code=status_code,
+            is_timeout=is_timeout,
+        )
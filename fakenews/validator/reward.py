@@ -21,6 +21,7 @@ from typing import Final
 import bittensor as bt
 import numpy as np
 
+from fakenews.utils.logging import log_structured
 from fakenews.validator.performance_tracker import PerformanceTracker
 from fakenews.validator.task import ValidatorTask
 
@@ -32,6 +33,9 @@ class RewardCalculator:
     _LONG_TERM_WINDOW: Final[int] = 300
     _SHORT_TERM_WINDOW: Final[int] = 20
 
+    # "window" combines the accuracies of the long and short windows, "decay" the decayed accuracies of the tracker.
+    REWARD_MODES: Final[tuple[str, ...]] = ("window", "decay")
+
     @classmethod
     def get_rewards(
         cls,
@@ -41,9 +45,10 @@ class RewardCalculator:
         axons: list[bt.axon],
         performance_trackers: dict[ValidatorTask, PerformanceTracker],
         current_task: ValidatorTask,
+        reward_mode: str = "window",
     ) -> tuple[np.ndarray, dict]:
         """
-        Calculate rewards for the validators based on the responses from the miners.
+        Calculate the rewards of the current task based on the responses from the miners.
 
         Args:
             labels (list[float]): Ground truth labels for comparison.
@@ -52,110 +57,148 @@ class RewardCalculator:
             axons (list[bt.axon]): Miner axons.
             performance_trackers (dict[ValidatorTask, PerformanceTracker]): Task-specific performance trackers.
             current_task (ValidatorTask): The current validation task.
+            reward_mode (str): One of REWARD_MODES.
 
         Returns:
-            np.ndarray: Calculated rewards for each miner.
+            np.ndarray: Calculated rewards for each miner, not weighted by the reward weight of the task.
         """
         miner_rewards = []
         miner_rewards_calculating_metadata = []
 
         for axon, uid, probs in zip(axons, uids, responses):
-            metadata = {}
-            hotkey = axon.hotkey
-            final_reward = 0
-
-            normalized_probs = cls._normalize_miner_probs(probs, labels)
-
-            for task, performance_tracker in performance_trackers.items():
-                if task == current_task:
-                    for normalized_score, label in zip(normalized_probs, labels):
-                        performance_tracker.update(uid, normalized_score, label, hotkey)
-
-                tracked_hotkeys = performance_tracker.miner_hotkeys
-                if tracked_hotkeys.get(uid) != hotkey:
-                    bt.logging.warning(f"Miner hotkey changed for UID {uid}. Resetting performance metrics.")
-                    performance_tracker.reset_miner_history(uid, hotkey)
-
-                reward = 0
-                metrics_long = metrics_short = None
-
-                try:
-                    metrics_long = performance_tracker.get_metrics(uid, window=cls._LONG_TERM_WINDOW)
-                    metrics_short = performance_tracker.get_metrics(uid, window=cls._SHORT_TERM_WINDOW)
-                    reward = cls._evaluate_task_based_reward(metrics_long, metrics_short)
-                except Exception as e:
-                    bt.logging.error(f"Couldn't calculate reward for miner {uid}, score: {probs}, label: {labels}")
-                    bt.logging.exception(e)
-
-                weighted_reward = task.REWARD_WEIGHT * reward
-
-                metadata[task.TASK_NAME] = {
-                    "miner_uid": int(uid),
-                    "probabilities": probs,
-                    "normalized_probabilities": normalized_probs,
-                    "metrics_long": metrics_long,
-                    "metrics_short": metrics_short,
-                    "reward": reward,
-                    "reward_weight": task.REWARD_WEIGHT,
-                    "weighted_reward": weighted_reward,
-                }
-
-                final_reward += weighted_reward
-
-            miner_rewards.append(final_reward)
+            reward, metadata = cls.get_miner_reward(
+                labels=labels,
+                probs=probs,
+                uid=uid,
+                hotkey=axon.hotkey,
+                performance_trackers=performance_trackers,
+                current_task=current_task,
+                reward_mode=reward_mode,
+            )
+            miner_rewards.append(reward)
             miner_rewards_calculating_metadata.append(metadata)
 
         cls.log_result(current_task, miner_rewards_calculating_metadata)
 
-        calculating_metadata = {
+        return np.array(miner_rewards), cls.calculating_metadata(miner_rewards_calculating_metadata, reward_mode)
+
+    @classmethod
+    def get_miner_reward(
+        cls,
+        labels: list[float],
+        probs: list[float],
+        uid: int,
+        hotkey: str,
+        performance_trackers: dict[ValidatorTask, PerformanceTracker],
+        current_task: ValidatorTask,
+        reward_mode: str = "window",
+    ) -> tuple[float, dict]:
+        """
+        Records the response of a single miner and calculates its reward for the current task.
+        Only the performance tracker of the current task is updated and read, the rewards of the tasks are combined
+        by their reward weight when the weights are set.
+
+        Args:
+            labels (list[float]): Ground truth labels for comparison.
+            probs (list[float]): Miner response in the range [0.0, 1.0].
+            uid (int): Miner UID.
+            hotkey (str): Miner hotkey.
+            performance_trackers (dict[ValidatorTask, PerformanceTracker]): Task-specific performance trackers.
+            current_task (ValidatorTask): The current validation task.
+            reward_mode (str): One of REWARD_MODES.
+
+        Returns:
+            tuple[float, dict]: Miner reward for the current task and the metadata of its calculation.
+        """
+        if reward_mode not in cls.REWARD_MODES:
+            raise ValueError(f"Unknown reward mode {reward_mode}, expected one of {cls.REWARD_MODES}")
+
+        performance_tracker = performance_trackers[current_task]
+        normalized_probs = cls._normalize_miner_probs(probs, labels)
+
+        for normalized_score, label in zip(normalized_probs, labels, strict=True):
+            performance_tracker.update(uid, normalized_score, label, hotkey)
+
+        tracked_hotkeys = performance_tracker.miner_hotkeys
+        if tracked_hotkeys.get(uid) != hotkey:
+            bt.logging.warning(f"Miner hotkey changed for UID {uid}. Resetting performance metrics.")
+            performance_tracker.reset_miner_history(uid, hotkey)
+
+        reward = 0
+        metrics_long = metrics_short = None
+
+        try:
+            if reward_mode == "decay":
+                metrics_long = performance_tracker.get_metrics(uid, target_metrics=["decayed_accuracy_long"])
+                metrics_short = performance_tracker.get_metrics(uid, target_metrics=["decayed_accuracy_short"])
+                reward = cls._evaluate_task_based_reward(
+                    metrics_long["decayed_accuracy_long"], metrics_short["decayed_accuracy_short"]
+                )
+            else:
+                metrics_long = performance_tracker.get_metrics(uid, window=cls._LONG_TERM_WINDOW)
+                metrics_short = performance_tracker.get_metrics(uid, window=cls._SHORT_TERM_WINDOW)
+                reward = cls._evaluate_task_based_reward(metrics_long["accuracy"], metrics_short["accuracy"])
+        except Exception as e:
+            bt.logging.error(f"Couldn't calculate reward for miner {uid}, score: {probs}, label: {labels}")
+            bt.logging.exception(e)
+
+        metadata = {
+            current_task.TASK_NAME: {
+                "miner_uid": int(uid),
+                "probabilities": probs,
+                "normalized_probabilities": normalized_probs,
+                "metrics_long": metrics_long,
+                "metrics_short": metrics_short,
+                "reward": reward,
+                "reward_weight": current_task.REWARD_WEIGHT,
+                "weighted_reward": current_task.REWARD_WEIGHT * reward,
+            }
+        }
+
+        return reward, metadata
+
+    @classmethod
+    def calculating_metadata(cls, miner_rewards_calculating_metadata: list[dict], reward_mode: str = "window") -> dict:
+        return {
             "by_miner_details": miner_rewards_calculating_metadata,
+            "reward_mode": reward_mode,
             "long_alpha": cls._LONG_ALPHA,
             "long_term_window": cls._LONG_TERM_WINDOW,
             "short_term_window": cls._SHORT_TERM_WINDOW,
         }
 
-        return np.array(miner_rewards), calculating_metadata
-
     @classmethod
     def log_result(cls, current_task, miner_rewards_calculating_metadata):
-        normalized_metadata = defaultdict(list)
-        for miner_metadata in miner_rewards_calculating_metadata:
-            for task_name, metadata in miner_metadata.items():
-                normalized_metadata[task_name].append(
-                    {
-                        "uid": metadata["miner_uid"],
-                        "probs": metadata["probabilities"],
-                        "long": metadata["metrics_long"],
-                        "short": metadata["metrics_short"],
-                        "wght_rwd": metadata["weighted_reward"],
-                    }
-                )
-
-        normalized_metadata = dict(normalized_metadata)
-
-        log_message = (
+        def normalized_metadata():
+            normalized_metadata = defaultdict(list)
+            for miner_metadata in miner_rewards_calculating_metadata:
+                for task_name, metadata in miner_metadata.items():
+                    normalized_metadata[task_name].append(
+                        {
+                            "uid": metadata["miner_uid"],
+                            "probs": metadata["probabilities"],
+                            "long": metadata["metrics_long"],
+                            "short": metadata["metrics_short"],
+                            "wght_rwd": metadata["weighted_reward"],
+                        }
+                    )
+            return normalized_metadata
+
+        log_structured(
+            "debug",
             f"Calculating rewards for task {current_task.TASK_NAME}. Long alpha: {cls._LONG_ALPHA}, "
             + f"long term window: {cls._LONG_TERM_WINDOW}, short term window: {cls._SHORT_TERM_WINDOW}, "
-            + f"Miner calculating metadata: {str(normalized_metadata).replace(' ', '')}"
+            + "Miner calculating metadata:",
+            normalized_metadata,
         )
 
-        max_log_length = 3950
-        log_messages = []
-        if len(log_message) > max_log_length:
-            log_messages = [log_message[i : i + max_log_length] for i in range(0, len(log_message), max_log_length)]
-        else:
-            log_messages = [log_message]
-
-        for message in log_messages:
-            bt.logging.debug(message)
-
     @classmethod
     def _evaluate_task_based_reward(
         cls,
-        metrics_long: dict[str, float],
-        metrics_short: dict[str, float],
+        accuracy_long: float,
+        accuracy_short: float,
     ) -> float:
-        return cls._LONG_ALPHA * metrics_long["accuracy"] + (1 - cls._LONG_ALPHA) * metrics_short["accuracy"]
+        return cls._LONG_ALPHA * accuracy_long + (1 - cls._LONG_ALPHA) * accuracy_short
 
     @staticmethod
     def _normalize_miner_probs(probs: list[float], labels: list[float]) -> list[float]:
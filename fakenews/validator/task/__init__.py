@@ -1,10 +1,13 @@
 from .base import ValidatorTask, select_task
+from .bundle_cache import SynapseBundle, SynapseBundleCache
 from .fakenews_detection_no_original import FakenewsDetectionNoOriginal
 from .fakenews_detection_with_original import FakenewsDetectionWithOriginal
 
 __all__ = [
     "FakenewsDetectionNoOriginal",
     "FakenewsDetectionWithOriginal",
+    "SynapseBundle",
+    "SynapseBundleCache",
     "ValidatorTask",
     "select_task",
 ]
@@ -23,6 +23,10 @@ class ValidatorTask(ABC):
         """Abstract method to save the dataset."""
         ...
 
+    def dataset(self) -> list[dict]:
+        """Returns the dataset records produced by the last prepared synapse."""
+        return []
+
     def metadata(self) -> dict:
         """Returns metadata about the task."""
         return {
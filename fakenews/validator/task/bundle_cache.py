@@ -0,0 +1,167 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from random import shuffle
+
+import bittensor as bt
+
+from fakenews.protocol import ArticleSynapse
+
+from .base import ValidatorTask
+
+
+@dataclass
+class SynapseBundle:
+    """
+    A generated synapse together with everything needed to score, log and persist it.
+    """
+
+    synapse: ArticleSynapse
+    labels: list[float]
+    metadata: dict
+    dataset: list[dict]
+    created_at: float = field(default_factory=time.monotonic)
+    uses: int = 0
+    dataset_saved: bool = False
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.created_at
+
+    def draw(self) -> tuple[ArticleSynapse, list[float], dict]:
+        """
+        Returns a fresh copy of the synapse with the articles reshuffled, so repeated serves of the same bundle
+        don't present the articles in the same order, together with the labels and the task metadata in the matching
+        order.
+        """
+        self.uses += 1
+
+        order = list(range(len(self.labels)))
+        shuffle(order)
+
+        synapse = ArticleSynapse(
+            articles_to_review=[self.synapse.articles_to_review[i] for i in order],
+            original_article=self.synapse.original_article,
+            fake_probabilities=[-1.0] * len(order),
+        )
+        metadata = dict(self.metadata)
+        generated = metadata.get("generated_articles_metadata")
+        if generated is not None and len(generated) == len(order):
+            metadata["generated_articles_metadata"] = [generated[i] for i in order]
+        return synapse, [self.labels[i] for i in order], metadata
+
+
+class SynapseBundleCache:
+    """
+    Stale-while-revalidate provider of synapses for a single task.
+
+    Every request starts (or joins) a live generation. If it doesn't finish within the latency budget or fails,
+    a recently generated bundle that hasn't been overused is served instead, while the live generation keeps
+    running in the background and refills the cache once it completes.
+    """
+
+    def __init__(
+        self,
+        task: ValidatorTask,
+        latency_budget: float,
+        max_age: float,
+        max_uses: int,
+        size: int,
+    ):
+        self._task = task
+        self._latency_budget = latency_budget
+        self._max_age = max_age
+        self._max_uses = max_uses
+        self._bundles: deque[SynapseBundle] = deque(maxlen=size)
+        self._refresh: asyncio.Future | None = None
+        self._stats = {"live": 0, "fallback": 0, "miss": 0}
+
+    async def get(self) -> tuple[SynapseBundle, bool]:
+        """
+        Returns a bundle to query the miners with.
+
+        Returns:
+            tuple[SynapseBundle, bool]: The bundle and whether it was served from the cache as a fallback.
+
+        Raises:
+            Exception: The generation error, if the live generation failed and no fallback is available.
+        """
+        if self._refresh is None or self._refresh.done():
+            self._refresh = asyncio.ensure_future(self._generate())
+            self._refresh.add_done_callback(self._on_refresh_done)
+
+        refresh = self._refresh
+        try:
+            bundle = await asyncio.wait_for(asyncio.shield(refresh), timeout=self._latency_budget)
+        except asyncio.TimeoutError:
+            fallback = self._pick_fallback()
+            if fallback is None:
+                bt.logging.warning(
+                    f"Synapse generation for {self._task.TASK_NAME} exceeded {self._latency_budget}s "
+                    "and no fallback is available, waiting for it."
+                )
+                return await self._serve_live(refresh)
+
+            bt.logging.warning(
+                f"Synapse generation for {self._task.TASK_NAME} exceeded {self._latency_budget}s, "
+                f"serving a cached bundle ({fallback.age:.0f}s old, used {fallback.uses} times)."
+            )
+        except Exception as e:
+            fallback = self._pick_fallback()
+            if fallback is None:
+                self._stats["miss"] += 1
+                raise
+
+            bt.logging.warning(
+                f"Synapse generation for {self._task.TASK_NAME} failed: {e}, "
+                f"serving a cached bundle ({fallback.age:.0f}s old, used {fallback.uses} times)."
+            )
+        else:
+            self._stats["live"] += 1
+            return bundle, False
+
+        self._stats["fallback"] += 1
+        return fallback, True
+
+    def stats(self) -> dict:
+        """Returns the counters of how synapses were served."""
+        served = self._stats["live"] + self._stats["fallback"]
+        return {
+            **self._stats,
+            "fallback_rate": self._stats["fallback"] / served if served else 0.0,
+            "cached_bundles": len(self._bundles),
+        }
+
+    async def _serve_live(self, refresh: asyncio.Future) -> tuple[SynapseBundle, bool]:
+        try:
+            bundle = await refresh
+        except Exception:
+            self._stats["miss"] += 1
+            raise
+
+        self._stats["live"] += 1
+        return bundle, False
+
+    async def _generate(self) -> SynapseBundle:
+        synapse, labels = await self._task.prepare_synapse()
+        # Snapshot the task state right away, the next generation overwrites it.
+        bundle = SynapseBundle(
+            synapse=synapse,
+            labels=labels,
+            metadata=self._task.metadata(),
+            dataset=self._task.dataset(),
+        )
+        self._bundles.append(bundle)
+        return bundle
+
+    def _pick_fallback(self) -> SynapseBundle | None:
+        candidates = [b for b in self._bundles if b.uses < self._max_uses and b.age <= self._max_age]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda b: (b.uses, b.age))
+
+    def _on_refresh_done(self, refresh: asyncio.Future):
+        # Retrieve the exception so a failed background refresh nobody awaited is not reported as unhandled.
+        if not refresh.cancelled() and refresh.exception() is not None:
+            bt.logging.debug(f"Background synapse generation for {self._task.TASK_NAME} failed: {refresh.exception()}")
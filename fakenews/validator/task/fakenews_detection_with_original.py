@@ -1,12 +1,11 @@
 import asyncio
-import traceback
 from random import choices, shuffle
 from typing import TYPE_CHECKING, ClassVar
 
 import bittensor as bt
 from pydantic import BaseModel, PrivateAttr
 
-from fakenews.exceptions import OpenAIInternalError
+from fakenews.exceptions import CircuitOpenError
 from fakenews.protocol import ArticleSynapse
 from fakenews.schemas import SaveLLMRewrittenArticleModel
 from fakenews.services.news_api import NewsAPIClient
@@ -81,16 +80,27 @@ class FakenewsDetectionWithOriginal(ValidatorTask):
     ALLOW_PROMPTS_REPEAT: bool = True
     PROMPTS_SAMPLE_SIZE: int = 2
 
-    def __init__(self, openai_api_key: str, keypair: "Keypair"):
+    def __init__(
+        self,
+        openai_api_key: str | None = None,
+        keypair: "Keypair | None" = None,
+        *,
+        openai_client: OpenAIClient | None = None,
+        news_api_client: NewsAPIClient | None = None,
+    ):
         """
         Initialize the task object with neccessary dependencies.
 
         Args:
-            openai_api_key (str): OpenAI API key.
-            keypair (Keypair): Hotkey keypair.
+            openai_api_key (str): OpenAI API key, unused if `openai_client` is given.
+            keypair (Keypair): Hotkey keypair, unused if `news_api_client` is given.
+            openai_client (OpenAIClient, optional): Client generating the articles, e.g. an in-process stand-in.
+            news_api_client (NewsAPIClient, optional): Client fetching the original articles and saving the dataset.
         """
-        self._openai_client = OpenAIClient(api_key=openai_api_key)
-        self._news_api_client = NewsAPIClient(keypair=keypair)
+        self._openai_client = openai_client or OpenAIClient(
+            api_key=openai_api_key, concurrent_prompts=self.PROMPTS_SAMPLE_SIZE
+        )
+        self._news_api_client = news_api_client or NewsAPIClient(keypair=keypair)
 
     async def prepare_synapse(self) -> ArticleSynapse | None:
         """
@@ -114,9 +124,10 @@ class FakenewsDetectionWithOriginal(ValidatorTask):
 
         try:
             results = await asyncio.gather(*(self._openai_client.get_prompt_completions_async(p) for p in prompts))
+        except CircuitOpenError:
+            raise
         except BaseException as e:
             bt.logging.error("Failed to fetch articles from LLM: %s", e)
-            traceback.print_exc()
             raise e
 
         generated_articles_metadata = []
@@ -155,12 +166,13 @@ class FakenewsDetectionWithOriginal(ValidatorTask):
     def metadata(self):
         return {
             **self.__metadata.model_dump(),
+            "original_article_id": self.__metadata.original_article_metadata._id,  # noqa: SLF001
             **super().metadata(),
         }
 
-    async def save_dataset(self) -> None:
+    def dataset(self) -> list[dict]:
         """
-        Saves the dataset to the database.
+        Builds the dataset records for the last prepared synapse.
         """
         dataset = []
         original_id = self.__metadata.original_article_metadata._id  # noqa: SLF001
@@ -174,7 +186,16 @@ class FakenewsDetectionWithOriginal(ValidatorTask):
                     type="fake" if generated_article.label == 1.0 else "paraphrased",
                 ).model_dump()
             )
-        await self._news_api_client.save_articles_dataset(dataset)
+        return dataset
+
+    async def save_dataset(self, dataset: list[dict] | None = None) -> None:
+        """
+        Saves the dataset to the database.
+
+        Args:
+            dataset (list[dict], optional): Records to save. Defaults to the records of the last prepared synapse.
+        """
+        await self._news_api_client.save_articles_dataset(self.dataset() if dataset is None else dataset)
 
     def _select_sampled_prompts(self) -> list[ValidatorPrompt]:
         sampled_prompts = []
@@ -0,0 +1,90 @@
+from collections import deque
+from typing import Final
+
+import bittensor as bt
+import numpy as np
+
+from fakenews.protocol import ArticleSynapse
+from fakenews.validator.response import MinerResponse
+
+
+class AdaptiveTimeout:
+    """
+    Derives the dendrite timeout of a task from the latencies its miners recently answered with.
+
+    Latencies of successful responses are normalized by the size of the queried articles and kept in a rolling
+    window. The timeout of the next query is a high percentile of that window scaled back to the size of the
+    articles being sent, with a safety margin, clamped to [floor, ceiling]. When a query sees too many timeouts the
+    controller multiplies the timeout by a backoff factor, which decays back once the network is healthy again.
+    Until enough latencies were observed the ceiling is used.
+    """
+
+    # Size of the articles in a typical synapse, in characters.
+    REFERENCE_ARTICLES_LENGTH: Final[int] = 6000
+    # Share of the latency that doesn't depend on the articles length (network, queueing, model warmup).
+    FIXED_LATENCY_SHARE: Final[float] = 0.5
+    UNHEALTHY_TIMEOUT_RATE: Final[float] = 0.2
+    BACKOFF_FACTOR: Final[float] = 1.5
+    BACKOFF_DECAY: Final[float] = 0.9
+
+    def __init__(
+        self,
+        floor: float,
+        ceiling: float,
+        *,
+        percentile: float = 95,
+        margin: float = 1.5,
+        window: int = 1000,
+        min_samples: int = 50,
+        enabled: bool = True,
+    ):
+        if floor <= 0:
+            raise ValueError(f"Timeout floor should be positive, got {floor}")
+
+        self.floor = min(floor, ceiling)
+        self.ceiling = ceiling
+        self.percentile = percentile
+        self.margin = margin
+        self.min_samples = min_samples
+        self.enabled = enabled
+
+        self._normalized_latencies: deque[float] = deque(maxlen=window)
+        self._backoff = 1.0
+
+    def timeout_for(self, synapse: ArticleSynapse) -> float:
+        """Returns the timeout to query the miners with the given synapse."""
+        if not self.enabled or len(self._normalized_latencies) < self.min_samples:
+            return float(self.ceiling)
+
+        latency = np.percentile(self._normalized_latencies, self.percentile) * self._length_scale(synapse)
+        return float(np.clip(latency * self.margin * self._backoff, self.floor, self.ceiling))
+
+    def observe(self, synapse: ArticleSynapse, responses: list[MinerResponse]):
+        """Records the responses of a query made with the given synapse."""
+        if not responses:
+            return
+
+        scale = self._length_scale(synapse)
+        self._normalized_latencies.extend(r.latency / scale for r in responses if r.is_success)
+
+        timeout_rate = sum(r.is_timeout for r in responses) / len(responses)
+        if timeout_rate > self.UNHEALTHY_TIMEOUT_RATE:
+            self._backoff = min(self._backoff * self.BACKOFF_FACTOR, self.ceiling / self.floor)
+            bt.logging.debug(f"{timeout_rate:.0%} of the miners timed out, timeout backoff: {self._backoff:.2f}")
+        else:
+            self._backoff = max(1.0, self._backoff * self.BACKOFF_DECAY)
+
+    def state(self) -> dict:
+        """Returns the controller state for monitoring."""
+        samples = len(self._normalized_latencies)
+        return {
+            "samples": samples,
+            "backoff": self._backoff,
+            "normalized_latency_percentile": float(np.percentile(self._normalized_latencies, self.percentile))
+            if samples
+            else None,
+        }
+
+    def _length_scale(self, synapse: ArticleSynapse) -> float:
+        length = sum(len(article) for article in synapse.articles_to_review) + len(synapse.original_article or "")
+        return self.FIXED_LATENCY_SHARE + (1 - self.FIXED_LATENCY_SHARE) * length / self.REFERENCE_ARTICLES_LENGTH
@@ -0,0 +1,180 @@
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Final
+
+import bittensor as bt
+import numpy as np
+
+from fakenews.validator.recorder import article_id as body_article_id
+
+
+class WandbLogger:
+    """
+    Logs the forward payloads to wandb from a background thread.
+
+    `log` only enqueues the payload, so the event loop never waits for wandb serialization or network I/O. The
+    worker drains the queue in batches and slims every payload before logging it:
+        - the full scores vector is logged every `scores_every` payloads, in between only the scores of the queried
+          miners are logged;
+        - article bodies are replaced by ids and every body is logged once, in the `articles` key.
+    When the queue is full new payloads are dropped, the number of dropped payloads is logged with the next one.
+    """
+
+    # Number of article ids remembered as already logged.
+    SEEN_ARTICLES_SIZE: Final[int] = 10_000
+
+    def __init__(
+        self,
+        *,
+        queue_size: int = 256,
+        batch_size: int = 16,
+        scores_every: int = 10,
+    ):
+        self.batch_size = batch_size
+        self.scores_every = max(1, scores_every)
+
+        self._queue: queue.Queue[dict] = queue.Queue(maxsize=queue_size)
+        self._seen_articles: OrderedDict[str, None] = OrderedDict()
+        self._logged = 0
+        self._dropped = 0
+        self._unreported_dropped = 0
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="wandb-logger", daemon=True)
+        self._thread.start()
+
+    def log(self, payload: dict) -> bool:
+        """
+        Enqueues a payload without blocking.
+
+        The payload is serialized by the worker, so it shouldn't be mutated after it was passed here.
+
+        Returns:
+            bool: Whether the payload was enqueued, False when it was dropped because the queue is full.
+        """
+        try:
+            self._queue.put_nowait(payload)
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+                self._unreported_dropped += 1
+                dropped = self._dropped
+            if dropped == 1 or dropped % 100 == 0:
+                bt.logging.warning(f"Wandb logging queue is full, {dropped} payloads dropped so far")
+            return False
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Waits until every enqueued payload was logged, e.g. before the wandb run is finished.
+
+        Returns:
+            bool: Whether the queue was drained before the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def new_run(self):
+        """
+        Forgets the article bodies logged so far, so the next run logs them again, and logs the full scores next.
+        Call it between two runs, once the queue was flushed.
+        """
+        with self._lock:
+            self._seen_articles.clear()
+            self._logged = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"logged": self._logged, "dropped": self._dropped, "queued": self._queue.qsize()}
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._log_batch(batch)
+            except Exception as e:
+                bt.logging.warning(f"Failed to log {len(batch)} payloads to wandb: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _log_batch(self, batch: list[dict]):
+        import wandb  # noqa: PLC0415 - imported by the worker, wandb takes seconds to import
+
+        for payload in batch:
+            wandb.log(self.slim(payload))
+
+    def slim(self, payload: dict) -> dict:
+        """Returns the payload as it's logged to wandb."""
+        payload = dict(payload)
+
+        with self._lock:
+            log_full_scores = self._logged % self.scores_every == 0
+            self._logged += 1
+            if self._unreported_dropped:
+                payload["wandb_dropped"] = self._unreported_dropped
+                self._unreported_dropped = 0
+
+        scores = payload.pop("scores", None)
+        if scores is not None:
+            scores = np.asarray(scores)
+            if log_full_scores:
+                payload["scores"] = scores.tolist()
+            else:
+                payload["miner_scores"] = scores[np.asarray(payload.get("miner_uids", []), dtype=np.int64)].tolist()
+
+        if "task_metadata" in payload:
+            articles = {}
+            with self._lock:
+                payload["task_metadata"] = self._replace_article_bodies(payload["task_metadata"], articles)
+            if articles:
+                payload["articles"] = articles
+
+        return payload
+
+    def _replace_article_bodies(self, metadata: dict, articles: dict) -> dict:
+        metadata = dict(metadata)
+
+        original_article = metadata.get("original_article_metadata")
+        if original_article and "body" in original_article:
+            original_id = metadata.get("original_article_id")
+            article_id = f"original-{original_id}" if original_id is not None else None
+            metadata["original_article_metadata"] = self._replace_body(original_article, articles, article_id)
+
+        generated_articles = metadata.get("generated_articles_metadata")
+        if generated_articles:
+            metadata["generated_articles_metadata"] = [
+                self._replace_body(article, articles) if "body" in article else article for article in generated_articles
+            ]
+
+        return metadata
+
+    def _replace_body(self, article: dict, articles: dict, article_id: str | None = None) -> dict:
+        article = dict(article)
+        body = article.pop("body")
+        if article_id is None:
+            article_id = body_article_id(body)
+        article["article_id"] = article_id
+
+        if article_id in self._seen_articles:
+            self._seen_articles.move_to_end(article_id)
+        else:
+            articles[article_id] = body
+            self._seen_articles[article_id] = None
+            if len(self._seen_articles) > self.SEEN_ARTICLES_SIZE:
+                self._seen_articles.popitem(last=False)
+
+        return article
@@ -28,9 +28,6 @@ class Validator(BaseValidatorNeuron):
     def __init__(self, config=None):
         super(Validator, self).__init__(config=config)
 
-        bt.logging.info("load_state()")
-        self.load_state()
-
     async def forward(self):
         """
         Validator forward pass. Consists of:
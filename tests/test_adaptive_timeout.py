@@ -0,0 +1,61 @@
+from fakenews.protocol import ArticleSynapse
+from fakenews.validator.response import MinerResponse
+from fakenews.validator.timeout import AdaptiveTimeout
+
+
+def make_synapse(length: int = AdaptiveTimeout.REFERENCE_ARTICLES_LENGTH):
+    return ArticleSynapse(articles_to_review=["a" * (length // 2)] * 2, fake_probabilities=[-1.0, -1.0])
+
+
+def make_responses(latencies: list[float], timeouts: int = 0, timeout: float = 30):
+    responses = [MinerResponse(i, str(i), [0.0, 1.0], latency, 200, False) for i, latency in enumerate(latencies)]
+    responses += [MinerResponse(i, str(i), [-1.0, -1.0], timeout, 408, True) for i in range(timeouts)]
+    return responses
+
+
+def test_ceiling_until_enough_samples():
+    controller = AdaptiveTimeout(floor=5, ceiling=30, min_samples=10)
+    controller.observe(make_synapse(), make_responses([1.0] * 9))
+    assert controller.timeout_for(make_synapse()) == 30
+
+
+def test_timeout_follows_latency_percentile():
+    controller = AdaptiveTimeout(floor=1, ceiling=30, percentile=100, margin=1.5, min_samples=10)
+    controller.observe(make_synapse(), make_responses([2.0] * 9 + [4.0]))
+    assert controller.timeout_for(make_synapse()) == 6.0
+
+
+def test_timeout_scales_with_articles_length():
+    controller = AdaptiveTimeout(floor=1, ceiling=60, min_samples=10)
+    controller.observe(make_synapse(), make_responses([4.0] * 10))
+    short = controller.timeout_for(make_synapse(AdaptiveTimeout.REFERENCE_ARTICLES_LENGTH // 2))
+    long = controller.timeout_for(make_synapse(AdaptiveTimeout.REFERENCE_ARTICLES_LENGTH * 2))
+    assert short < controller.timeout_for(make_synapse()) < long
+
+
+def test_timeout_is_clamped():
+    controller = AdaptiveTimeout(floor=5, ceiling=30, min_samples=10)
+    controller.observe(make_synapse(), make_responses([0.1] * 10))
+    assert controller.timeout_for(make_synapse()) == 5
+
+    controller.observe(make_synapse(), make_responses([100.0] * 1000))
+    assert controller.timeout_for(make_synapse()) == 30
+
+
+def test_backoff_on_timeouts_and_recovery():
+    controller = AdaptiveTimeout(floor=1, ceiling=30, min_samples=10)
+    controller.observe(make_synapse(), make_responses([2.0] * 10))
+    healthy = controller.timeout_for(make_synapse())
+
+    controller.observe(make_synapse(), make_responses([2.0] * 5, timeouts=5))
+    assert controller.timeout_for(make_synapse()) > healthy
+
+    for _ in range(50):
+        controller.observe(make_synapse(), make_responses([2.0] * 10))
+    assert controller.timeout_for(make_synapse()) == healthy
+
+
+def test_disabled_controller_uses_ceiling():
+    controller = AdaptiveTimeout(floor=1, ceiling=30, min_samples=1, enabled=False)
+    controller.observe(make_synapse(), make_responses([2.0] * 10))
+    assert controller.timeout_for(make_synapse()) == 30
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+
+import pytest
+
+from fakenews.utils.block_tracker import BlockTracker
+
+
+class FakeSubtensor:
+    def __init__(self, block=100):
+        self.current_block = block
+        self.calls = 0
+
+    def get_current_block(self):
+        self.calls += 1
+        return self.current_block
+
+
+class FastBlockTracker(BlockTracker):
+    BLOCK_TIME = 0.04
+
+
+@pytest.fixture
+def subtensor():
+    return FakeSubtensor()
+
+
+@pytest.fixture
+def tracker(subtensor):
+    tracker = FastBlockTracker(lambda: subtensor, poll_interval=0.01)
+    tracker.start()
+    yield tracker
+    tracker.stop()
+
+
+def test_block_is_read_without_rpc(tracker, subtensor):
+    calls = subtensor.calls
+    assert [tracker.block for _ in range(100)] == [100] * 100
+    assert subtensor.calls - calls <= 1
+
+
+def test_block_is_not_available_before_start(subtensor):
+    with pytest.raises(RuntimeError):
+        _ = BlockTracker(lambda: subtensor).block
+
+
+def test_wait_for_block_sync(tracker, subtensor):
+    threading.Timer(0.05, lambda: setattr(subtensor, "current_block", 102)).start()
+    assert tracker.wait_for_block_sync(102, timeout=5) == 102
+    assert tracker.wait_for_block_sync(200, timeout=0.05) == 102
+
+
+async def test_wait_for_block(tracker, subtensor):
+    assert await tracker.wait_for_block(99) == 100
+
+    waiter = asyncio.create_task(tracker.wait_for_block(101, timeout=5))
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+    subtensor.current_block = 101
+    assert await waiter == 101
+
+    with pytest.raises(asyncio.TimeoutError):
+        await tracker.wait_for_block(200, timeout=0.05)
+    assert tracker._async_waiters == []
+
+
+def test_poller_recovers_from_rpc_errors(subtensor):
+    connections = []
+
+    def factory():
+        connections.append(subtensor)
+        return subtensor
+
+    tracker = FastBlockTracker(factory, poll_interval=0.01)
+    tracker.start()
+    subtensor.get_current_block = lambda: 1 / 0
+    tracker.wait_for_block_sync(101, timeout=0.1)
+    del subtensor.get_current_block
+    subtensor.current_block = 101
+    assert tracker.wait_for_block_sync(101, timeout=5) == 101
+    assert len(connections) > 1
+    tracker.stop()
@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from fakenews.exceptions import OpenAIInternalError
+from fakenews.protocol import ArticleSynapse
+from fakenews.validator.task import SynapseBundleCache, ValidatorTask
+
+
+class GeneratingTask(ValidatorTask):
+    TASK_NAME = "Generating"
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.fail = False
+        self.generated = 0
+
+    async def prepare_synapse(self):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise OpenAIInternalError
+        self.generated += 1
+        synapse = ArticleSynapse(
+            articles_to_review=[f"fake {self.generated}", f"original {self.generated}"],
+            fake_probabilities=[-1.0, -1.0],
+        )
+        return synapse, [1.0, 0.0]
+
+    async def save_dataset(self, *args, **kwargs): ...
+
+    def metadata(self):
+        return {
+            "generated": self.generated,
+            "generated_articles_metadata": [
+                {"body": f"fake {self.generated}", "label": 1.0},
+                {"body": f"original {self.generated}", "label": 0.0},
+            ],
+        }
+
+
+def make_cache(task, latency_budget=1.0, max_uses=3):
+    return SynapseBundleCache(task, latency_budget=latency_budget, max_age=60, max_uses=max_uses, size=4)
+
+
+async def test_live_generation_is_served_and_cached():
+    cache = make_cache(GeneratingTask())
+    bundle, is_fallback = await cache.get()
+    assert not is_fallback
+    assert bundle.metadata["generated"] == 1
+    assert cache.stats()["live"] == 1
+    assert cache.stats()["cached_bundles"] == 1
+
+
+async def test_draw_keeps_labels_aligned_with_articles():
+    cache = make_cache(GeneratingTask())
+    bundle, _ = await cache.get()
+    for _ in range(10):
+        synapse, labels, metadata = bundle.draw()
+        generated = metadata["generated_articles_metadata"]
+        for article, label, article_metadata in zip(synapse.articles_to_review, labels, generated, strict=True):
+            assert article.startswith("fake") == (label == 1.0)
+            assert article_metadata == {"body": article, "label": label}
+
+
+async def test_fallback_on_generation_error():
+    task = GeneratingTask()
+    cache = make_cache(task)
+    live, _ = await cache.get()
+    live.draw()
+
+    task.fail = True
+    bundle, is_fallback = await cache.get()
+    assert is_fallback
+    assert bundle is live
+    assert cache.stats()["fallback"] == 1
+
+
+async def test_error_without_fallback_is_raised():
+    task = GeneratingTask()
+    task.fail = True
+    cache = make_cache(task)
+    with pytest.raises(OpenAIInternalError):
+        await cache.get()
+    assert cache.stats()["miss"] == 1
+
+
+async def test_slow_generation_serves_fallback_and_refreshes_in_background():
+    task = GeneratingTask()
+    cache = make_cache(task, latency_budget=0.05)
+    await cache.get()
+
+    task.delay = 0.1
+    _, is_fallback = await cache.get()
+    assert is_fallback
+
+    await asyncio.sleep(0.2)
+    assert task.generated == 2
+    assert cache.stats()["cached_bundles"] == 2
+
+
+async def test_overused_bundles_are_not_served():
+    task = GeneratingTask()
+    cache = make_cache(task, max_uses=1)
+    live, _ = await cache.get()
+    live.draw()
+
+    task.fail = True
+    with pytest.raises(OpenAIInternalError):
+        await cache.get()
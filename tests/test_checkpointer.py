@@ -0,0 +1,66 @@
+import threading
+
+import numpy as np
+
+from fakenews.utils.checkpointer import Checkpointer, json_writer, npz_writer
+
+
+def test_checkpoint_is_written_atomically_with_generations(tmp_path):
+    checkpointer = Checkpointer(str(tmp_path), generations=2)
+    for step in range(4):
+        checkpointer.save({"state.npz": npz_writer({"step": step})})
+        assert checkpointer.flush(timeout=10)
+
+    candidates = checkpointer.candidates("state.npz")
+    assert candidates == [str(tmp_path / "state.npz"), str(tmp_path / "state.npz.1"), str(tmp_path / "state.npz.2")]
+    assert [int(np.load(path)["step"]) for path in candidates] == [3, 2, 1]
+    assert [checkpointer.generation(path) for path in candidates] == [0, 1, 2]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_saves_without_rotation_keep_the_generations(tmp_path):
+    checkpointer = Checkpointer(str(tmp_path), generations=2)
+    for step in range(3):
+        checkpointer.save({"state.npz": npz_writer({"step": step})})
+        assert checkpointer.flush(timeout=10)
+    for step in range(3, 6):
+        checkpointer.save({"state.npz": npz_writer({"step": step})}, rotate=False)
+        assert checkpointer.flush(timeout=10)
+
+    assert [int(np.load(path)["step"]) for path in checkpointer.candidates("state.npz")] == [5, 1, 0]
+
+
+def test_pending_saves_are_coalesced(tmp_path):
+    checkpointer = Checkpointer(str(tmp_path))
+    started, release = threading.Event(), threading.Event()
+
+    def blocking_writer(f):
+        started.set()
+        release.wait(10)
+        f.write(b"first")
+
+    checkpointer.save({"blocking": blocking_writer})
+    assert started.wait(10)
+    for step in range(5):
+        checkpointer.save({"state.json": json_writer({"step": step})})
+    release.set()
+    assert checkpointer.flush(timeout=10)
+
+    assert (tmp_path / "state.json").read_text() == '{"step": 4}'
+    assert checkpointer.stats() == {"written": 2, "failed": 0, "coalesced": 4, "pending": False}
+
+
+def test_failed_write_keeps_previous_checkpoint(tmp_path):
+    checkpointer = Checkpointer(str(tmp_path))
+    checkpointer.save({"state.json": json_writer({"step": 1})})
+    assert checkpointer.flush(timeout=10)
+
+    def failing_writer(f):
+        f.write(b"partial")
+        raise OSError("disk full")
+
+    checkpointer.save({"state.json": failing_writer})
+    assert checkpointer.flush(timeout=10)
+    assert (tmp_path / "state.json").read_text() == '{"step": 1}'
+    assert not (tmp_path / "state.json.tmp").exists()
+    assert checkpointer.stats()["failed"] == 1
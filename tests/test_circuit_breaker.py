@@ -0,0 +1,103 @@
+import time
+from unittest import mock
+
+import pytest
+
+from fakenews.exceptions import CircuitOpenError
+from fakenews.services.circuit_breaker import CircuitBreaker, CircuitState, get_circuit_breaker
+
+
+def call(breaker: CircuitBreaker, *, fail: bool):
+    with breaker.guard():
+        if fail:
+            raise ConnectionError
+
+
+def test_opens_on_failure_rate():
+    breaker = CircuitBreaker("test", failure_rate_threshold=0.5, minimum_calls=4, window_size=4)
+    call(breaker, fail=False)
+    call(breaker, fail=False)
+    with pytest.raises(ConnectionError):
+        call(breaker, fail=True)
+    assert breaker.state == CircuitState.CLOSED
+
+    with pytest.raises(ConnectionError):
+        call(breaker, fail=True)
+    assert breaker.state == CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        call(breaker, fail=False)
+    assert breaker.snapshot()["rejected_calls"] == 1
+
+
+def test_successful_probe_closes_circuit():
+    breaker = CircuitBreaker("test", minimum_calls=1, open_timeout=0.01)
+    with pytest.raises(ConnectionError):
+        call(breaker, fail=True)
+    assert breaker.state == CircuitState.OPEN
+
+    time.sleep(0.02)
+    call(breaker, fail=False)
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_failed_probe_backs_off():
+    breaker = CircuitBreaker("test", minimum_calls=1, open_timeout=0.01, max_open_timeout=1)
+    with pytest.raises(ConnectionError):
+        call(breaker, fail=True)
+
+    time.sleep(0.02)
+    with pytest.raises(ConnectionError):
+        call(breaker, fail=True)
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.snapshot()["next_probe_in"] > 0.01
+    assert breaker.snapshot()["times_opened"] == 2
+
+
+def test_half_open_allows_limited_probes():
+    breaker = CircuitBreaker("test", minimum_calls=1, open_timeout=0.01, half_open_max_calls=1)
+    with pytest.raises(ConnectionError):
+        call(breaker, fail=True)
+
+    time.sleep(0.02)
+    with breaker.guard():
+        assert breaker.state == CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            call(breaker, fail=False)
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_concurrent_probes_settle_on_the_first_result():
+    breaker = CircuitBreaker("test", minimum_calls=2, open_timeout=0.01, half_open_max_calls=2)
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            call(breaker, fail=True)
+
+    time.sleep(0.02)
+    with pytest.raises(ConnectionError), breaker.guard():
+        call(breaker, fail=False)
+        assert breaker.state == CircuitState.CLOSED
+        raise ConnectionError
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_errors_not_counted_as_failures():
+    breaker = CircuitBreaker("test", minimum_calls=1, window_size=1, is_failure=lambda e: isinstance(e, ConnectionError))
+    for _ in range(3):
+        with pytest.raises(PermissionError), breaker.guard():
+            raise PermissionError
+    assert breaker.state == CircuitState.CLOSED
+
+    with pytest.raises(ConnectionError):
+        call(breaker, fail=True)
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_shared_breaker_warns_on_different_options():
+    breaker = get_circuit_breaker("test_shared", minimum_calls=2)
+    with mock.patch("bittensor.logging.warning") as mocked_log:
+        assert get_circuit_breaker("test_shared", minimum_calls=2) is breaker
+        mocked_log.assert_not_called()
+        assert get_circuit_breaker("test_shared", minimum_calls=3) is breaker
+        mocked_log.assert_called_once()
+    assert breaker.minimum_calls == 2
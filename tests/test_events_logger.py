@@ -0,0 +1,82 @@
+import gzip
+import json
+import logging
+from queue import Queue
+
+from fakenews.utils.logging import EVENTS_LEVEL_NUM, DroppingQueueHandler, setup_events_logger, stop_events_logger
+
+
+def make_record(message):
+    return logging.makeLogRecord({"name": "event", "levelno": EVENTS_LEVEL_NUM, "msg": message})
+
+
+def test_events_are_written_by_the_listener(tmp_path):
+    logger = setup_events_logger(str(tmp_path), 1024 * 1024)
+    logger.event("first")
+    logger.event("second")
+    stop_events_logger()
+
+    lines = (tmp_path / "events.log").read_text().splitlines()
+    assert [line.rsplit(" | ", 1)[1] for line in lines] == ["first", "second"]
+
+
+def test_json_lines_format(tmp_path):
+    logger = setup_events_logger(str(tmp_path), 1024 * 1024, json_lines=True)
+    logger.event("message %s", 1)
+    stop_events_logger()
+
+    entry = json.loads((tmp_path / "events.log").read_text())
+    assert entry["level"] == "EVENT"
+    assert entry["message"] == "message 1"
+    assert "exception" not in entry
+
+
+def test_json_lines_exception(tmp_path):
+    logger = setup_events_logger(str(tmp_path), 1024 * 1024, json_lines=True)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.event("failed", exc_info=True)
+    stop_events_logger()
+
+    entry = json.loads((tmp_path / "events.log").read_text())
+    assert entry["message"] == "failed"
+    assert entry["exception"].endswith("ValueError: boom")
+
+
+def test_text_format_keeps_the_exception(tmp_path):
+    logger = setup_events_logger(str(tmp_path), 1024 * 1024)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.event("failed", exc_info=True)
+    stop_events_logger()
+
+    text = (tmp_path / "events.log").read_text()
+    assert "| failed\nTraceback" in text
+    assert text.rstrip().endswith("ValueError: boom")
+
+
+def test_rotated_files_are_compressed(tmp_path):
+    logger = setup_events_logger(str(tmp_path), 200, compress=True)
+    for i in range(20):
+        logger.event(f"event {i}")
+    stop_events_logger()
+
+    rotated = sorted(tmp_path.glob("events.log.*.gz"))
+    assert rotated
+    assert "event" in gzip.decompress(rotated[0].read_bytes()).decode()
+
+
+def test_records_are_dropped_when_the_queue_is_full():
+    handler = DroppingQueueHandler(Queue(maxsize=2))
+    for i in range(3):
+        handler.emit(make_record(f"event {i}"))
+    assert handler.dropped == 1
+
+    while not handler.queue.empty():
+        handler.queue.get_nowait()
+    handler.emit(make_record("event 3"))
+
+    messages = [handler.queue.get_nowait().getMessage() for _ in range(2)]
+    assert messages == ["event 3", "1 event records were dropped, the events queue was full"]
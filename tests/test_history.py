@@ -0,0 +1,54 @@
+import pickle
+from collections import deque
+
+import numpy as np
+import pytest
+
+from fakenews.validator.history import CompactHistory
+from fakenews.validator.performance_tracker import PerformanceTracker
+
+
+def test_quantize_keeps_exact_values_and_sentinel():
+    predictions = np.array([0.0, 0.5, 1.0, -1.0])
+    assert CompactHistory.dequantize(CompactHistory.quantize(predictions)).tolist() == predictions.tolist()
+
+
+def test_quantize_keeps_rounded_label():
+    rng = np.random.default_rng(0)
+    predictions = np.concatenate([rng.random(10_000), [0.5 + 1e-9, 0.5 - 1e-9, 0.501, 0.499]])
+    dequantized = CompactHistory.dequantize(CompactHistory.quantize(predictions))
+    assert np.array_equal(np.round(dequantized), np.round(predictions))
+    assert np.abs(dequantized - predictions).max() <= 1 / CompactHistory.LEVELS
+
+
+def test_from_deques_round_trip():
+    predictions = deque([0.0, 1.0, -1, 0.5, 1, 0], maxlen=500)
+    labels = deque([0, 1, 1, 0, 1, 0], maxlen=500)
+    history = CompactHistory.from_deques(predictions, labels)
+    assert len(history) == 6
+    assert history.to_deques(500) == (predictions, labels)
+    assert history.to_deques(2) == (deque([1, 0]), deque([1, 0]))
+
+
+def test_from_deques_rejects_invalid_histories():
+    with pytest.raises(ValueError):
+        CompactHistory.from_deques([0.1, 0.2], [1])
+    with pytest.raises(ValueError):
+        CompactHistory.from_deques([0.1], [2])
+
+
+def test_tracker_pickle_size():
+    rng = np.random.default_rng(0)
+    tracker = PerformanceTracker()
+    for uid in range(16):
+        for _ in range(PerformanceTracker.STORE_LAST_N_PREDICTIONS_DEFAULT):
+            tracker.update(uid, float(rng.random()), int(rng.integers(0, 2)), f"hotkey_{uid}")
+
+    compact = len(pickle.dumps(tracker.__getstate__()["compact_history"]))
+    full = len(pickle.dumps((tracker.prediction_history, tracker.label_history)))
+    assert compact * 8 < full
+
+    loaded_tracker = pickle.loads(pickle.dumps(tracker))  # noqa: S301
+    assert loaded_tracker.label_history == tracker.label_history
+    assert loaded_tracker.get_metrics(3, window=300) == tracker.get_metrics(3, window=300)
+    assert loaded_tracker.prediction_history[3].maxlen == PerformanceTracker.STORE_LAST_N_PREDICTIONS_DEFAULT
@@ -0,0 +1,84 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+
+from fakenews.validator.history_export import history_columns, main, summarize
+from fakenews.validator.performance_tracker import PerformanceTracker
+
+
+@pytest.fixture
+def tracker():
+    tracker = PerformanceTracker()
+    for prediction, label in [(0.9, 1), (0.2, 1), (-1, 0)]:
+        tracker.update(1, prediction, label, "hotkey_1")
+    tracker.update(2, 0.1, 0, "hotkey_2")
+    return tracker
+
+
+def test_history_columns(tracker):
+    columns = history_columns(tracker)
+    assert columns["uid"].tolist() == [1, 1, 1, 2]
+    assert columns["hotkey"].tolist() == ["hotkey_1"] * 3 + ["hotkey_2"]
+    assert columns["position"].tolist() == [0, 1, 2, 0]
+    assert np.allclose(columns["prediction"], [0.9, 0.2, -1, 0.1])
+    assert columns["label"].tolist() == [1, 1, 0, 0]
+
+    assert history_columns(tracker, uids=[2])["uid"].tolist() == [2]
+    assert history_columns(tracker, hotkeys=["hotkey_1"])["uid"].tolist() == [1, 1, 1]
+    assert history_columns(tracker, uids=[3])["prediction"].size == 0
+
+
+def test_summarize(tracker):
+    summary = summarize(history_columns(tracker))
+    assert summary["rows"] == 4
+    assert summary["miners"] == 2
+    assert summary["invalid_share"] == 0.25
+    assert summary["accuracy"] == pytest.approx(2 / 3)
+    assert summary["by_miner"][1]["accuracy"] == 0.5
+    assert summary["by_miner"][2]["brier_score"] == pytest.approx(0.01)
+
+
+def test_export(tmp_path, tracker, capsys):
+    state_dir, output = tmp_path / "state", tmp_path / "export"
+    state_dir.mkdir()
+    joblib.dump(tracker, state_dir / "task_performance_history.pkl")
+    np.savez(
+        state_dir / "state.npz",
+        step=10,
+        scores=np.array([[0.0, 0.5, 0.25]]),
+        task_names=["task"],
+        hotkeys=["hotkey_0", "hotkey_1", "hotkey_2"],
+    )
+
+    assert main([str(state_dir), "--output", str(output), "--format", "npz", "--hotkey", "hotkey_1", "--per-miner"]) == 0
+
+    history = np.load(output / "task_history.npz")
+    assert history["uid"].tolist() == [1, 1, 1]
+    scores = np.load(output / "scores.npz")
+    assert scores["uid"].tolist() == [1]
+    assert scores["score_task"].tolist() == [0.5]
+
+    printed = capsys.readouterr().out
+    assert "state: step 10, 1 miners" in printed
+    assert "task: 3 predictions of 1 miners" in printed
+    assert "uid 1: 2 predictions, accuracy 0.5000" in printed
+
+
+def test_export_without_history(tmp_path):
+    assert main([str(tmp_path)]) == 1
+
+
+def test_help_shows_the_cli_usage():
+    result = subprocess.run(
+        [sys.executable, "-m", "fakenews.validator.history_export", "--help"],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parents[1],
+        check=True,
+    )
+    assert "state_dir" in result.stdout
+    assert "--logging.debug" not in result.stdout
@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from fakenews.base.utils.hyperparameters import SubnetHyperparameterCache
+from fakenews.base.utils.weight_utils import process_weights_for_netuid
+
+
+class FakeSubtensor:
+    def __init__(self):
+        self.calls = 0
+        self.min_weights = 2
+
+    def min_allowed_weights(self, netuid):
+        self.calls += 1
+        return self.min_weights
+
+    def max_weight_limit(self, netuid):
+        self.calls += 1
+        return 0.5
+
+
+def make_cache(block, ttl_blocks=10):
+    subtensor = FakeSubtensor()
+    return subtensor, SubnetHyperparameterCache(subtensor, 1, get_block=lambda: block[0], ttl_blocks=ttl_blocks)
+
+
+def test_values_are_cached_for_ttl_blocks():
+    block = [100]
+    subtensor, cache = make_cache(block)
+    cache.prewarm()
+    assert subtensor.calls == 2
+
+    block[0] = 109
+    assert cache.min_allowed_weights() == 2
+    assert subtensor.calls == 2
+
+    block[0] = 110
+    subtensor.min_weights = 3
+    assert cache.min_allowed_weights() == 3
+    assert subtensor.calls == 3
+
+
+def test_metagraph_hyperparameters_change_invalidates_cache():
+    subtensor, cache = make_cache([100])
+    assert not cache.observe_metagraph(SimpleNamespace(hparams=("a", 1)))
+    cache.prewarm()
+
+    assert not cache.observe_metagraph(SimpleNamespace(hparams=("a", 1)))
+    cache.min_allowed_weights()
+    assert subtensor.calls == 2
+
+    assert cache.observe_metagraph(SimpleNamespace(hparams=("a", 2)))
+    cache.min_allowed_weights()
+    assert subtensor.calls == 3
+
+
+def test_process_weights_reads_cached_hyperparameters():
+    subtensor, cache = make_cache([100])
+    cache.prewarm()
+    metagraph = SimpleNamespace(n=4)
+    uids, weights = process_weights_for_netuid(
+        uids=np.arange(4),
+        weights=np.array([0.1, 0.2, 0.3, 0.4], dtype=np.float32),
+        netuid=1,
+        subtensor=subtensor,
+        metagraph=metagraph,
+        hyperparameters=cache,
+    )
+    assert subtensor.calls == 2
+    assert uids.tolist() == [0, 1, 2, 3]
+    assert np.isclose(weights.sum(), 1)
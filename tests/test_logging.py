@@ -0,0 +1,44 @@
+import bittensor as bt
+import pytest
+
+from fakenews.utils import logging as fakenews_logging
+from fakenews.utils.logging import MAX_LOG_MESSAGE_LENGTH, log_structured
+
+
+@pytest.fixture
+def debug_messages(monkeypatch):
+    messages = []
+    monkeypatch.setattr(bt.logging, "debug", messages.append)
+    monkeypatch.setattr(fakenews_logging, "_last_logged_at", {})
+    return messages
+
+
+def test_fields_are_not_built_when_level_is_disabled(monkeypatch, debug_messages):
+    monkeypatch.setattr(bt.logging, "get_level", lambda: 20)
+
+    def fields():
+        raise AssertionError("fields should not be built")
+
+    assert not log_structured("debug", "message", fields)
+    assert debug_messages == []
+
+
+def test_fields_are_serialized_compactly(monkeypatch, debug_messages):
+    monkeypatch.setattr(bt.logging, "get_level", lambda: 10)
+    assert log_structured("debug", "Rewards:", lambda: {"uid": 1, "probs": [0.5, 1.0], "hotkey": object})
+    assert debug_messages == ['Rewards: {"uid":1,"probs":[0.5,1.0],"hotkey":"<class \'object\'>"}']
+
+
+def test_long_messages_are_chunked(monkeypatch, debug_messages):
+    monkeypatch.setattr(bt.logging, "get_level", lambda: 10)
+    log_structured("debug", "x" * (MAX_LOG_MESSAGE_LENGTH + 1))
+    assert [len(m) for m in debug_messages] == [MAX_LOG_MESSAGE_LENGTH, 1]
+
+
+def test_rate_limit(monkeypatch, debug_messages):
+    monkeypatch.setattr(bt.logging, "get_level", lambda: 10)
+    assert log_structured("debug", "message", rate_limit=60)
+    assert not log_structured("debug", "message", rate_limit=60)
+    assert log_structured("debug", "message", rate_limit=60, key="other")
+    assert log_structured("debug", "message")
+    assert len(debug_messages) == 3
@@ -0,0 +1,60 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from fakenews.utils.uids import MinerHealth, UidScheduler, sample_query_uids
+
+
+def test_benched_after_consecutive_failures():
+    health = MinerHealth(4, failures_threshold=3)
+    for step in range(2):
+        health.record(1, step, responsive=False)
+    assert not health.is_benched([1], step=2).any()
+
+    health.record(1, 2, responsive=False)
+    assert health.is_benched([1], step=3).tolist() == [True]
+    assert not health.is_benched([1], step=4).any()
+
+
+def test_backoff_doubles_and_is_capped():
+    health = MinerHealth(1, failures_threshold=1, max_backoff_steps=4)
+    backoffs = []
+    for _ in range(5):
+        health.record(0, 0, responsive=False)
+        backoffs.append(int(health.benched_until_step[0]) - 1)
+    assert backoffs == [1, 2, 4, 4, 4]
+
+
+def test_answer_readmits_immediately():
+    health = MinerHealth(2, failures_threshold=1)
+    health.record(0, 0, responsive=False)
+    health.record(0, 0, responsive=False)
+    assert health.is_benched([0], step=1).all()
+
+    health.record(0, 1, responsive=True)
+    assert not health.is_benched([0], step=1).any()
+    assert health.consecutive_failures[0] == 0
+
+
+def test_resize_and_reset():
+    health = MinerHealth(1, failures_threshold=1)
+    health.record(3, 0, responsive=False)
+    assert health.consecutive_failures.tolist() == [0, 0, 0, 1]
+    health.reset(3)
+    assert not health.is_benched([0, 1, 2, 3], step=0).any()
+
+
+def test_benched_slots_go_to_responsive_miners():
+    validator = SimpleNamespace(uid_scheduler=UidScheduler(8), miner_health=MinerHealth(8, failures_threshold=1), step=0)
+    for uid in (0, 1):
+        validator.miner_health.record(uid, 0, responsive=False)
+    validator.uid_scheduler.query_counts[2:] = 10
+
+    query_uids, benched_uids = sample_query_uids(validator, np.arange(8), k=4)
+
+    assert sorted(benched_uids.tolist()) == [0, 1]
+    assert len(query_uids) == 4
+    assert not set(query_uids.tolist()) & {0, 1}
+    # Only the queried miners count as queried.
+    assert validator.uid_scheduler.query_counts[[0, 1]].tolist() == [0, 0]
+    assert validator.uid_scheduler.query_counts[query_uids].tolist() == [11] * 4
@@ -0,0 +1,140 @@
+import json
+import threading
+from types import MethodType, SimpleNamespace
+
+import pytest
+
+from fakenews.base.validator import BaseValidatorNeuron
+from fakenews.utils.checkpointer import Checkpointer
+from fakenews.utils.timing import StartupTimer
+from fakenews.validator.performance_tracker import PerformanceTracker
+
+
+class Task:
+    def __init__(self, name):
+        self.TASK_NAME = name
+
+
+@pytest.fixture
+def validator(tmp_path):
+    validator = SimpleNamespace(
+        tasks=[Task("a"), Task("b")],
+        config=SimpleNamespace(neuron=SimpleNamespace(full_path=str(tmp_path))),
+        _miner_history_loaded=threading.Event(),
+        _state_generation=0,
+        _load_performance_tracker=BaseValidatorNeuron._load_performance_tracker,
+        _miner_history_name=BaseValidatorNeuron._miner_history_name,
+        checkpointer=Checkpointer(str(tmp_path)),
+    )
+    validator._miner_history_loaded.set()
+    validator.performance_trackers = dict.fromkeys(validator.tasks)
+    for name in (
+        "save_miner_history",
+        "_miner_history_files",
+        "load_miner_history",
+        "wait_for_miner_history",
+        "_load_miner_history",
+        "_log_miner_history_generation",
+    ):
+        setattr(validator, name, MethodType(getattr(BaseValidatorNeuron, name), validator))
+    return validator
+
+
+def test_miner_history_round_trip(validator, tmp_path):
+    tracker = PerformanceTracker()
+    tracker.update(1, 0.9, 1, "hotkey_1")
+    tracker.update(2, -1, 1, "hotkey_2")
+    validator.performance_trackers = {validator.tasks[0]: tracker, validator.tasks[1]: PerformanceTracker()}
+    validator.save_miner_history()
+    assert validator.checkpointer.flush(timeout=10)
+
+    header = json.loads((tmp_path / "a_performance_history.json").read_text())
+    assert header["version"] == PerformanceTracker.HEADER_VERSION
+    assert header["num_miners"] == 2
+    assert header["num_miners_with_predictions"] == 1
+    assert header["num_predictions"] == 2
+
+    validator.performance_trackers = dict.fromkeys(validator.tasks)
+    validator.load_miner_history()
+    assert validator.wait_for_miner_history(timeout=10)
+    loaded_tracker = validator.performance_trackers[validator.tasks[0]]
+    assert loaded_tracker.get_metrics(1) == tracker.get_metrics(1)
+    assert loaded_tracker.miner_hotkeys == tracker.miner_hotkeys
+
+
+def test_missing_miner_history_starts_fresh(validator):
+    validator.load_miner_history()
+    assert validator.wait_for_miner_history(timeout=10)
+    assert all(isinstance(tracker, PerformanceTracker) for tracker in validator.performance_trackers.values())
+
+
+def test_startup_timer():
+    timer = StartupTimer(started_at=0.0)
+    assert timer.mark("imports") > 0
+    timer.mark("state")
+    timer.mark("state")
+    report = timer.report()
+    assert list(report) == ["imports", "state", "total"]
+    assert report["total"] == pytest.approx(report["imports"] + report["state"], abs=0.01)
+
+
+def test_miner_history_saves_keep_the_generations(validator, tmp_path):
+    tracker = PerformanceTracker()
+    validator.performance_trackers = dict.fromkeys(validator.tasks, tracker)
+    for _ in range(3):
+        validator.save_miner_history()
+        assert validator.checkpointer.flush(timeout=10)
+
+    assert validator.checkpointer.candidates("a_performance_history.pkl") == [str(tmp_path / "a_performance_history.pkl")]
+
+
+def test_corrupted_miner_history_falls_back_to_previous_generation(validator, tmp_path):
+    tracker = PerformanceTracker()
+    tracker.update(1, 0.9, 1, "hotkey_1")
+    validator.performance_trackers = dict.fromkeys(validator.tasks, tracker)
+    # Saved along with the validator state, which starts a new generation.
+    validator.checkpointer.save(validator._miner_history_files())
+    assert validator.checkpointer.flush(timeout=10)
+    tracker.update(1, 0.1, 1, "hotkey_1")
+    validator.checkpointer.save(validator._miner_history_files())
+    assert validator.checkpointer.flush(timeout=10)
+
+    (tmp_path / "a_performance_history.pkl").write_bytes(b"corrupted")
+    validator.load_miner_history()
+    assert validator.wait_for_miner_history(timeout=10)
+    assert len(validator.performance_trackers[validator.tasks[0]].prediction_history[1]) == 1
+    assert len(validator.performance_trackers[validator.tasks[1]].prediction_history[1]) == 2
+
+
+def test_validator_starts_while_the_miner_history_loads(tmp_path, monkeypatch):
+    monkeypatch.setattr("sys.argv", ["validator", "--logging.logging_dir", str(tmp_path), "--simulation.miners", "8"])
+    from fakenews.simulation.validator import SimulatedValidator  # noqa: PLC0415 - imports the whole validator
+
+    release = threading.Event()
+
+    def load_performance_tracker(paths):
+        assert release.wait(timeout=10)
+        return PerformanceTracker(), None
+
+    monkeypatch.setattr(BaseValidatorNeuron, "_load_performance_tracker", staticmethod(load_performance_tracker))
+
+    validator = SimulatedValidator()
+    assert not validator.wait_for_miner_history(timeout=0)
+
+    # The initial sync saved the state but left the trackers being loaded alone.
+    assert validator.checkpointer.flush(timeout=10)
+    assert validator.checkpointer.candidates("state.npz")
+    assert not validator.checkpointer.candidates(validator._miner_history_name(validator.tasks[0]))
+
+    release.set()
+    assert validator.wait_for_miner_history(timeout=10)
+    assert all(isinstance(tracker, PerformanceTracker) for tracker in validator.performance_trackers.values())
+
+
+def test_exiting_the_validator_flushes_the_checkpoints():
+    flushed = []
+    validator = SimpleNamespace(is_running=False, flush_checkpoints=lambda: flushed.append(True))
+
+    BaseValidatorNeuron.__exit__(validator, KeyboardInterrupt, KeyboardInterrupt(), None)
+
+    assert flushed == [True]
@@ -0,0 +1,22 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from fakenews.base.miner import BaseMinerNeuron
+
+
+def make_miner(chain_last_update, last_update):
+    return SimpleNamespace(
+        uid=1,
+        metagraph=SimpleNamespace(last_update=np.array([0, chain_last_update])),
+        last_update=last_update,
+        config=SimpleNamespace(neuron=SimpleNamespace(epoch_length=100)),
+    )
+
+
+def test_next_sync_block_follows_the_last_local_sync():
+    assert BaseMinerNeuron.next_sync_block(make_miner(chain_last_update=10, last_update=500)) == 601
+
+
+def test_next_sync_block_waits_for_the_chain_epoch():
+    assert BaseMinerNeuron.next_sync_block(make_miner(chain_last_update=900, last_update=0)) == 1000
@@ -0,0 +1,135 @@
+import asyncio
+from http import HTTPStatus
+
+import bittensor as bt
+import numpy as np
+import pytest
+from bittensor_wallet.mock import get_mock_wallet
+
+from fakenews.mock import MockDendrite
+from fakenews.protocol import ArticleSynapse
+from fakenews.simulation import ArticleLabels, MinerPopulation, MinerProfile, VirtualClock, VirtualEventLoop
+from fakenews.simulation.miners import SimulatedMiner
+from fakenews.validator.reward import RewardCalculator
+
+
+@pytest.fixture
+def clock():
+    return VirtualClock()
+
+
+@pytest.fixture
+def loop(clock):
+    loop = VirtualEventLoop(clock)
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def wallet():
+    return get_mock_wallet()
+
+
+@pytest.fixture
+def labels():
+    labels = ArticleLabels()
+    labels.add("fake article", 1.0)
+    labels.add("real article", 0.0)
+    return labels
+
+
+@pytest.fixture
+def synapse():
+    return ArticleSynapse(articles_to_review=["fake article", "real article"], fake_probabilities=[-1.0, -1.0])
+
+
+def axon(hotkey: str) -> bt.AxonInfo:
+    return bt.AxonInfo(version=1, ip="127.0.0.1", port=8091, ip_type=4, hotkey=hotkey, coldkey="coldkey")
+
+
+def profile(name: str, **fields) -> MinerProfile:
+    return MinerProfile(name, **{"accuracy": 1.0, "accuracy_spread": 0.0, "latency_sigma": 0.0, **fields})
+
+
+def test_mock_dendrite_answers_after_the_miner_latency(clock, loop, wallet, labels, synapse):
+    population = MinerPopulation([profile("fast", latency_median=1.0)])
+    fast = population.add("fast")
+    population.miners["slow"] = SimulatedMiner("slow", profile("slow", latency_median=30.0), 1.0)
+    dendrite = MockDendrite(wallet, population, labels, register_unknown=False)
+
+    async def query():
+        return await asyncio.gather(
+            dendrite(axons=[axon(fast.hotkey)], synapse=synapse, deserialize=False, timeout=10),
+            dendrite(axons=[axon("slow")], synapse=synapse, deserialize=False, timeout=10),
+            dendrite(axons=[axon("unknown")], synapse=synapse, deserialize=False, timeout=10),
+        )
+
+    (fast,), (slow,), (unknown,) = loop.run_until_complete(query())
+
+    assert fast.dendrite.status_code == HTTPStatus.OK
+    assert float(fast.dendrite.process_time) == pytest.approx(1.0)
+    assert fast.axon.hotkey == "fast"
+    assert np.round(fast.fake_probabilities).tolist() == [1.0, 0.0]
+    assert slow.dendrite.status_code == HTTPStatus.REQUEST_TIMEOUT
+    assert unknown.dendrite.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert "unknown" not in population.miners
+    assert synapse.fake_probabilities == [-1.0, -1.0]
+    assert synapse.dendrite.status_code is None
+    assert clock.monotonic() == pytest.approx(10, abs=0.1)
+
+
+def test_mock_dendrite_registers_unknown_hotkeys(loop, wallet, synapse):
+    dendrite = MockDendrite(wallet)
+
+    (probabilities,) = loop.run_until_complete(dendrite(axons=[axon("miner-hotkey-1")], synapse=synapse, timeout=1e6))
+
+    assert "miner-hotkey-1" in dendrite.population.miners
+    assert len(probabilities) == 2
+    assert all(0 <= p <= 1 for p in probabilities)
+
+
+def test_mock_dendrite_injects_timeouts_and_malformed_payloads(loop, wallet, labels, synapse):
+    population = MinerPopulation()
+    population.miners["hanging"] = SimulatedMiner("hanging", profile("hanging", timeout_rate=1.0), 1.0)
+    population.miners["broken"] = SimulatedMiner("broken", profile("broken", malformed_rate=1.0), 1.0)
+    dendrite = MockDendrite(wallet, population, labels)
+
+    responses = [
+        loop.run_until_complete(dendrite(axons=[axon(hotkey)], synapse=synapse, deserialize=False, timeout=1e6))[0]
+        for hotkey in ["hanging"] + ["broken"] * 50
+    ]
+
+    assert responses[0].dendrite.status_code == HTTPStatus.REQUEST_TIMEOUT
+    for response in responses[1:]:
+        assert response.dendrite.status_code == HTTPStatus.OK
+        # A broken answer is scored as wrong on at least one article, right ones never get 0 or 1.
+        normalized = RewardCalculator._normalize_miner_probs(response.fake_probabilities, [1.0, 0.0])
+        assert normalized[0] == 0.0 or normalized[1] == 1.0
+
+
+def test_mock_dendrite_waits_once_for_the_slowest_axon(clock, loop, wallet, synapse):
+    population = MinerPopulation([profile("heavy_tail", latency_median=1.0, latency_sigma=1.0)], seed=3)
+    axons = [axon(population.spawn(uid).hotkey) for uid in range(5000)]
+    dendrite = MockDendrite(wallet, population)
+
+    responses = loop.run_until_complete(dendrite(axons=axons, synapse=synapse, deserialize=False, timeout=12))
+
+    latencies = [float(response.dendrite.process_time) for response in responses]
+    timed_out = [response.dendrite.status_code == HTTPStatus.REQUEST_TIMEOUT for response in responses]
+    assert len(responses) == len(axons)
+    assert [response.axon.hotkey for response in responses] == [a.hotkey for a in axons]
+    assert 0 < np.mean(timed_out) < 0.05
+    assert clock.monotonic() == pytest.approx(12, abs=0.1)
+    assert max(latencies) == 12
+    # The request fields are shared, not copied per axon.
+    assert all(response.articles_to_review is synapse.articles_to_review for response in responses)
+
+
+def test_mock_dendrite_sequential_queries_add_up(clock, loop, wallet, synapse):
+    population = MinerPopulation([profile("steady", latency_median=2.0)])
+    axons = [axon(population.spawn(uid).hotkey) for uid in range(3)]
+    dendrite = MockDendrite(wallet, population)
+
+    loop.run_until_complete(dendrite(axons=axons, synapse=synapse, timeout=12, run_async=False))
+
+    assert clock.monotonic() == pytest.approx(6, abs=0.1)
@@ -2,8 +2,10 @@ import os
 from collections import deque
 from unittest import mock
 
+import numpy as np
+import pytest
 from joblib import dump, load
-from sklearn.metrics import accuracy_score
+from sklearn.metrics import accuracy_score, brier_score_loss, log_loss
 
 from fakenews.validator.performance_tracker import PerformanceTracker
 
@@ -163,3 +165,177 @@ def test_dump_and_load():
     assert loaded_tracker.get_metrics(2, window=2) == tracker.get_metrics(2, window=2)
     assert loaded_tracker.get_metrics(2, window=1000) == tracker.get_metrics(2, window=1000)
     os.remove("tmp/test.pkl")
+
+
+def test_response_metrics_no_data():
+    tracker = PerformanceTracker()
+    tracker.update(1, 1, 1, "hotkey_1")
+    metrics = tracker.get_metrics(1, target_metrics=list(PerformanceTracker.RESPONSE_METRICS))
+    assert metrics == {"latency_p50": None, "latency_p95": None, "timeout_rate": None}
+
+
+def test_response_metrics():
+    tracker = PerformanceTracker()
+    for latency in range(1, 11):
+        tracker.update_response(1, float(latency), 200, "hotkey_1")
+    tracker.update_response(1, 30.0, 408, "hotkey_1")
+    tracker.update_response(1, 30.0, 408, "hotkey_1")
+
+    metrics = tracker.get_metrics(1, target_metrics=["latency_p50", "latency_p95", "timeout_rate"])
+    assert metrics["latency_p50"] == np.percentile(range(1, 11), 50)
+    assert metrics["latency_p95"] == np.percentile(range(1, 11), 95)
+    assert metrics["timeout_rate"] == 2 / 12
+
+    assert tracker.get_metrics(1, window=2, target_metrics=["timeout_rate"]) == {"timeout_rate": 1.0}
+
+
+def test_response_history_wraps_around():
+    tracker = PerformanceTracker()
+    for _ in range(PerformanceTracker.STORE_LAST_N_RESPONSES):
+        tracker.update_response(1, 30.0, 408, "hotkey_1")
+    tracker.update_response(1, 1.0, 200, "hotkey_1")
+
+    metrics = tracker.get_metrics(1, target_metrics=["latency_p50", "timeout_rate"])
+    assert metrics["latency_p50"] == 1.0
+    assert metrics["timeout_rate"] == 1 - 1 / PerformanceTracker.STORE_LAST_N_RESPONSES
+
+
+def test_response_history_reset_on_hotkey_change():
+    tracker = PerformanceTracker()
+    tracker.update_response(1, 30.0, 408, "hotkey_1")
+    tracker.update(1, 1, 1, "hotkey_2")
+    assert tracker.get_metrics(1, target_metrics=["timeout_rate"]) == {"timeout_rate": None}
+
+
+def test_load_tracker_pickled_without_response_history():
+    tracker = PerformanceTracker()
+    tracker.update(1, 1, 1, "hotkey_1")
+    state = tracker.__dict__.copy()
+    for attribute in ("latency_history", "status_history", "response_counts"):
+        del state[attribute]
+
+    loaded_tracker = PerformanceTracker.__new__(PerformanceTracker)
+    loaded_tracker.__setstate__(state)
+    loaded_tracker.update_response(1, 2.0, 200, "hotkey_1")
+    assert loaded_tracker.get_metrics(1, target_metrics=["latency_p50"]) == {"latency_p50": 2.0}
+
+
+def test_get_metrics_cached_until_update():
+    tracker = PerformanceTracker()
+    tracker.update(1, 1, 1, "hotkey_1")
+    with mock.patch.object(tracker, "_compute_metrics", wraps=tracker._compute_metrics) as compute:
+        assert tracker.get_metrics(1, window=10) == tracker.get_metrics(1, window=10)
+        assert compute.call_count == 1
+
+        tracker.update(1, 0, 1, "hotkey_1")
+        assert tracker.get_metrics(1, window=10)["accuracy"] == 0.5 * 2 / 10
+        assert compute.call_count == 2
+
+        tracker.update_response(1, 1.0, 200, "hotkey_1")
+        tracker.get_metrics(1, window=10)
+        assert compute.call_count == 3
+
+        tracker.reset_miner_history(1, "hotkey_1")
+        assert tracker.get_metrics(1, window=10) == tracker._compute_metrics(1, 10, ("accuracy",))
+        assert compute.call_count == 5
+
+
+def test_cached_metrics_not_shared():
+    tracker = PerformanceTracker()
+    tracker.update(1, 1, 1, "hotkey_1")
+    tracker.get_metrics(1)["accuracy"] = 0
+    assert tracker.get_metrics(1)["accuracy"] == 1.0
+
+
+def test_metrics_cache_not_pickled():
+    tracker = PerformanceTracker()
+    tracker.update(1, 1, 1, "hotkey_1")
+    tracker.get_metrics(1)
+    state = tracker.__getstate__()
+    assert "_metrics_cache" not in state
+    assert "_history_versions" not in state
+
+
+def _reference_calibration(predictions, labels):
+    predictions = np.asarray(predictions, dtype=float)
+    labels = np.asarray(labels)
+    valid = predictions != -1
+    probs, labels = predictions[valid], labels[valid]
+    bins = np.minimum((probs * PerformanceTracker.CALIBRATION_BINS).astype(int), PerformanceTracker.CALIBRATION_BINS - 1)
+    calibration_error = sum(
+        abs(probs[bins == b].mean() - labels[bins == b].mean()) * np.sum(bins == b) / len(probs) for b in np.unique(bins)
+    )
+    return {
+        "brier_score": brier_score_loss(labels, probs),
+        "log_loss": log_loss(labels, probs, labels=[0, 1]),
+        "calibration_error": calibration_error,
+    }
+
+
+def test_calibration_metrics_match_reference():
+    rng = np.random.default_rng(0)
+    tracker = PerformanceTracker()
+    predictions, labels = [], []
+    for _ in range(1200):
+        prediction = -1 if rng.random() < 0.1 else float(rng.random())
+        label = int(rng.integers(0, 2))
+        tracker.update(1, prediction, label, "hotkey_1")
+        predictions.append(prediction)
+        labels.append(label)
+
+    for window in (None, 20, 50, 300):
+        n = window or PerformanceTracker.STORE_LAST_N_PREDICTIONS_DEFAULT
+        metrics = tracker.get_metrics(1, window=window, target_metrics=list(PerformanceTracker.CALIBRATION_METRICS))
+        expected = _reference_calibration(predictions[-n:], labels[-n:])
+        for metric, value in expected.items():
+            assert np.isclose(metrics[metric], value), (window, metric)
+
+
+def test_calibration_metrics_no_valid_predictions():
+    tracker = PerformanceTracker()
+    tracker.update(1, -1, 1, "hotkey_1")
+    assert tracker.get_metrics(1, window=20, target_metrics=["brier_score", "log_loss"]) == {
+        "brier_score": None,
+        "log_loss": None,
+    }
+
+
+def test_calibration_sums_rebuilt_on_load():
+    tracker = PerformanceTracker()
+    for prediction, label in [(0.9, 1), (0.2, 1), (0.6, 0)]:
+        tracker.update(1, prediction, label, "hotkey_1")
+    state = tracker.__getstate__()
+    assert "_running_sums" not in state
+
+    loaded_tracker = PerformanceTracker.__new__(PerformanceTracker)
+    loaded_tracker.__setstate__(state)
+    target_metrics = list(PerformanceTracker.CALIBRATION_METRICS)
+    # Pickled probabilities are quantized to 1/254.
+    assert loaded_tracker.get_metrics(1, window=20, target_metrics=target_metrics) == pytest.approx(
+        tracker.get_metrics(1, window=20, target_metrics=target_metrics), abs=0.01
+    )
+
+
+def test_decayed_accuracy():
+    tracker = PerformanceTracker(long_half_life=1.0, short_half_life=2.0)
+    tracker.update(1, 0.9, 1, "hotkey_1")
+    tracker.update(1, 0.9, 0, "hotkey_1")
+    tracker.update(1, -1, 0, "hotkey_1")
+    metrics = tracker.get_metrics(1, target_metrics=list(PerformanceTracker.DECAY_METRICS))
+    # The correct prediction is one step old, the invalid one isn't counted.
+    assert metrics["decayed_accuracy_long"] == pytest.approx(0.5 * (1 - 0.5))
+    short_decay = 0.5**0.5
+    assert metrics["decayed_accuracy_short"] == pytest.approx(short_decay * (1 - short_decay))
+
+
+def test_decayed_accuracy_rebuilt_for_old_pickles():
+    tracker = PerformanceTracker()
+    for i in range(50):
+        tracker.update(1, i % 2, 1, "hotkey_1")
+    state = tracker.__getstate__()
+    expected = tracker.get_metrics(1, target_metrics=list(PerformanceTracker.DECAY_METRICS))
+    del state["decayed_sums"], state["decay_half_lives"]
+
+    loaded_tracker = PerformanceTracker.__new__(PerformanceTracker)
+    loaded_tracker.__setstate__(state)
+    assert loaded_tracker.get_metrics(1, target_metrics=list(PerformanceTracker.DECAY_METRICS)) == pytest.approx(expected)
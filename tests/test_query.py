@@ -0,0 +1,61 @@
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+
+from fakenews.protocol import ArticleSynapse
+from fakenews.validator.query import stream_miner_responses
+
+
+class DelayedDendrite:
+    def __init__(self, delays, status_codes=None):
+        self.delays = delays
+        self.status_codes = status_codes or {}
+        self.cancelled = []
+
+    async def __call__(self, axons, synapse, deserialize, timeout):  # noqa: ASYNC109
+        axon = axons[0]
+        try:
+            await asyncio.sleep(self.delays[axon.hotkey])
+        except asyncio.CancelledError:
+            self.cancelled.append(axon.hotkey)
+            raise
+        response = synapse.model_copy()
+        response.fake_probabilities = [0.5] * len(synapse.articles_to_review)
+        response.dendrite.status_code = self.status_codes.get(axon.hotkey, 200)
+        response.dendrite.process_time = str(self.delays[axon.hotkey])
+        return [response]
+
+
+def make_query(delays, status_codes=None):
+    uids = np.arange(len(delays))
+    axons = [SimpleNamespace(hotkey=str(uid)) for uid in uids]
+    synapse = ArticleSynapse(articles_to_review=["a", "b"], fake_probabilities=[])
+    dendrite = DelayedDendrite({str(uid): delay for uid, delay in zip(uids, delays, strict=True)}, status_codes)
+    return dendrite, uids, axons, synapse
+
+
+async def test_responses_arrive_in_completion_order():
+    dendrite, uids, axons, synapse = make_query([0.05, 0.0, 0.02])
+    responses = [r async for r in stream_miner_responses(dendrite, uids, axons, synapse, timeout=1)]
+    assert [r.uid for r in responses] == [1, 2, 0]
+    assert all(r.is_success and r.probabilities == [0.5, 0.5] for r in responses)
+
+
+async def test_stragglers_are_cancelled_after_quorum_and_grace():
+    dendrite, uids, axons, synapse = make_query([0.0, 0.01, 10, 10])
+    responses = [r async for r in stream_miner_responses(dendrite, uids, axons, synapse, timeout=12, quorum=0.5, grace=0.05)]
+    assert [r.uid for r in responses[:2]] == [0, 1]
+    assert sorted(r.uid for r in responses[2:]) == [2, 3]
+    assert all(r.is_cut and r.is_timeout and r.probabilities == [-1.0, -1.0] for r in responses[2:])
+    assert not any(r.is_cut for r in responses[:2])
+    await asyncio.sleep(0)
+    assert sorted(dendrite.cancelled) == ["2", "3"]
+
+
+async def test_failed_responses_dont_count_towards_quorum():
+    dendrite, uids, axons, synapse = make_query([0.0, 0.0, 0.05, 10], status_codes={"0": 503, "1": 503})
+    responses = [
+        r async for r in stream_miner_responses(dendrite, uids, axons, synapse, timeout=12, quorum=0.25, grace=0.01)
+    ]
+    assert [(r.uid, r.is_cut) for r in responses[2:]] == [(2, False), (3, True)]
@@ -0,0 +1,173 @@
+import gzip
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from fakenews.validator import PerformanceTracker, RewardCalculator
+from fakenews.validator.recorder import StepRecorder, article_id, read_steps, segment_paths
+from fakenews.validator.replay import ReplayTask, replay
+
+
+def make_steps(count: int, uids=(0, 1, 2), seed: int = 0) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    steps = []
+    for step in range(count):
+        labels = rng.integers(0, 2, size=2).tolist()
+        responses = []
+        for uid in uids:
+            # Higher uids are more accurate.
+            correct = rng.random(2) < 0.4 + 0.2 * uid
+            responses.append([float(label) if ok else float(1 - label) for label, ok in zip(labels, correct, strict=True)])
+        steps.append(
+            {
+                "step": step,
+                "task": "task",
+                "reward_weight": 1.0,
+                "uids": list(uids),
+                "hotkeys": [str(uid) for uid in uids],
+                "labels": labels,
+                "responses": responses,
+                "stake": [1.0] * len(uids),
+            }
+        )
+    return steps
+
+
+def test_steps_are_recorded_and_read_back(tmp_path):
+    recorder = StepRecorder(str(tmp_path))
+    steps = make_steps(5)
+    for step in steps:
+        recorder.record(step)
+    recorder.close()
+
+    assert [{k: v for k, v in record.items() if k != "v"} for record in read_steps(str(tmp_path))] == steps
+    assert all(record["v"] == StepRecorder.VERSION for record in read_steps(str(tmp_path)))
+
+
+def test_segments_are_rotated_and_pruned(tmp_path):
+    recorder = StepRecorder(str(tmp_path), max_bytes=1, max_segments=3)
+    for step in make_steps(6):
+        recorder.record(step)
+    recorder.close()
+
+    assert len(segment_paths(str(tmp_path))) == 3
+    assert [record["step"] for record in read_steps(str(tmp_path))] == [3, 4, 5]
+
+
+def test_records_are_dropped_under_backpressure(tmp_path, monkeypatch):
+    release = threading.Event()
+    recorder = StepRecorder(str(tmp_path), queue_size=2)
+    write = recorder._write
+
+    def blocked_write(record):
+        release.wait()
+        write(record)
+
+    monkeypatch.setattr(recorder, "_write", blocked_write)
+
+    results = [recorder.record(step) for step in make_steps(10)]
+    assert not all(results)
+    assert not recorder.flush(timeout=0.05)
+
+    release.set()
+    assert recorder.close(timeout=5)
+    assert len(list(read_steps(str(tmp_path)))) == sum(results)
+
+
+def test_truncated_segment_keeps_complete_records(tmp_path):
+    recorder = StepRecorder(str(tmp_path))
+    for step in make_steps(20):
+        recorder.record(step)
+    recorder.close()
+
+    (path,) = segment_paths(str(tmp_path))
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(data[: len(data) - 20])
+
+    steps = [record["step"] for record in read_steps(str(tmp_path))]
+    assert steps == list(range(len(steps)))
+    assert len(steps) < 20
+
+
+def test_malformed_record_is_skipped(tmp_path):
+    with gzip.open(tmp_path / "steps-1.jsonl.gz", "wb") as f:
+        f.write(b'{"step": 0}\n{"step": \n{"step": 2}\n')
+
+    assert [record["step"] for record in read_steps(str(tmp_path))] == [0, 2]
+
+
+def test_article_id_is_stable():
+    assert article_id("body") == article_id("body")
+    assert article_id("body") != article_id("other body")
+    assert len(article_id("body")) == 16
+
+
+def test_replay_matches_live_rewards():
+    steps = make_steps(50)
+    task = ReplayTask("task", 1.0)
+    trackers = {task: PerformanceTracker()}
+    scores = np.zeros(3, dtype=np.float32)
+    for step in steps:
+        rewards = np.array(
+            [
+                RewardCalculator.get_miner_reward(
+                    labels=step["labels"],
+                    probs=probs,
+                    uid=uid,
+                    hotkey=hotkey,
+                    performance_trackers=trackers,
+                    current_task=task,
+                )[0]
+                for uid, hotkey, probs in zip(step["uids"], step["hotkeys"], step["responses"], strict=True)
+            ]
+        )
+        scores = 0.1 * rewards + 0.9 * scores
+
+    result = replay(steps)
+
+    assert result.steps == 50
+    np.testing.assert_allclose(result.scores["task"], scores, rtol=1e-6)
+    tracker = result.trackers["task"]
+    for uid in range(3):
+        assert tracker.get_metrics(uid) == trackers[task].get_metrics(uid)
+    assert np.argmax(result.weighted_scores()) == 2
+
+
+def test_replay_overrides_reward_parameters():
+    steps = make_steps(50)
+
+    default = replay(steps)
+    short_only = replay(steps, long_alpha=0.0, short_term_window=5)
+    decay = replay(steps, reward_mode="decay")
+
+    assert not np.allclose(default.scores["task"], short_only.scores["task"])
+    assert not np.allclose(default.scores["task"], decay.scores["task"])
+
+
+def test_replay_resets_scores_on_hotkey_change():
+    steps = make_steps(20, uids=(1,))
+    for step in steps[10:]:
+        step["hotkeys"] = ["new"]
+
+    result = replay(steps)
+    fresh = replay(steps[10:])
+
+    assert result.scores["task"][1] == pytest.approx(fresh.scores["task"][1], rel=1e-6)
+
+
+def test_replay_help_shows_the_cli_usage():
+    result = subprocess.run(
+        [sys.executable, "-m", "fakenews.validator.replay", "--help"],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parents[1],
+        check=True,
+    )
+    assert "steps_dir" in result.stdout
+    assert "--logging.debug" not in result.stdout
@@ -131,3 +131,32 @@ def test_rewards_almost_full_positive_retrospective_less_than_1(task, axons, per
 
     rewards, _ = RewardCalculator.get_rewards(labels, [labels], uids, axons(uids), performance_trackers, task)
     assert np.less(rewards, np.array([1])).all()
+
+
+def test_get_rewards_decay_mode_converges_to_accuracy(task, axons, performance_trackers):
+    labels = [0, 1]
+    uids = [1]
+    for _ in range(5 * RewardCalculator._LONG_TERM_WINDOW):
+        rewards, metadata = RewardCalculator.get_rewards(
+            labels, [labels], uids, axons(uids), performance_trackers, task, reward_mode="decay"
+        )
+    assert np.allclose(rewards, [1.0], atol=0.01)
+    assert metadata["reward_mode"] == "decay"
+
+
+def test_get_rewards_decay_mode_follows_window_mode(task, axons):
+    labels = [0, 1]
+    uids = [1]
+    trackers = {mode: {task: PerformanceTracker()} for mode in RewardCalculator.REWARD_MODES}
+    for i in range(RewardCalculator._LONG_TERM_WINDOW):
+        responses = [labels if i % 4 else labels[::-1]]
+        rewards = {
+            mode: RewardCalculator.get_rewards(labels, responses, uids, axons(uids), trackers[mode], task, mode)[0]
+            for mode in RewardCalculator.REWARD_MODES
+        }
+    assert np.allclose(rewards["decay"], rewards["window"], atol=0.15)
+
+
+def test_get_rewards_unknown_mode(task, axons, performance_trackers):
+    with pytest.raises(ValueError):
+        RewardCalculator.get_rewards([0], [[0.0]], [1], axons([1]), performance_trackers, task, reward_mode="median")
@@ -0,0 +1,90 @@
+import asyncio
+import os
+import sys
+
+import numpy as np
+import pytest
+
+from fakenews.simulation import MinerPopulation, MinerProfile, VirtualClock, VirtualEventLoop
+
+
+@pytest.fixture
+def clock():
+    return VirtualClock(start_block=100)
+
+
+@pytest.fixture
+def loop(clock):
+    loop = VirtualEventLoop(clock)
+    yield loop
+    loop.close()
+
+
+def test_virtual_loop_sleeps_on_the_clock(clock, loop):
+    async def sleep():
+        await asyncio.gather(asyncio.sleep(600), asyncio.sleep(60))
+
+    loop.run_until_complete(asyncio.wait_for(sleep(), timeout=1000))
+
+    assert clock.monotonic() == pytest.approx(600, abs=0.1)
+    assert clock.block == 150
+
+
+def test_virtual_loop_times_out_on_the_clock(clock, loop):
+    with pytest.raises(asyncio.TimeoutError):
+        loop.run_until_complete(asyncio.wait_for(asyncio.sleep(100), timeout=10))
+    assert clock.monotonic() == pytest.approx(10, abs=0.1)
+
+
+def test_population_predicts_with_the_profile_accuracy():
+    population = MinerPopulation([MinerProfile("only", accuracy=0.8, accuracy_spread=0.0)], seed=1)
+    miner = population.spawn(1)
+    labels = [float(label) for label in np.random.default_rng(0).integers(0, 2, size=5000)]
+
+    probabilities = population.predict(miner, labels)
+
+    assert np.mean(np.round(probabilities) == labels) == pytest.approx(0.8, abs=0.02)
+    assert all(0 <= p <= 1 for p in probabilities)
+
+
+def test_population_draws_profiles_by_share():
+    profiles = [MinerProfile("a", share=3), MinerProfile("b", share=1, unreachable_rate=1.0)]
+    population = MinerPopulation(profiles, seed=0)
+
+    miners = [population.spawn(uid) for uid in range(2000)]
+
+    assert np.mean([miner.profile.name == "a" for miner in miners]) == pytest.approx(0.75, abs=0.03)
+    assert population.latency(next(m for m in miners if m.profile.name == "b")) is None
+
+
+def test_simulated_validator_sets_weights_by_accuracy(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "simulation",
+            "--logging.logging_dir",
+            str(tmp_path),
+            "--simulation.miners",
+            "32",
+            "--simulation.churn",
+            "0.1",
+            "--neuron.sample_size",
+            "16",
+        ],
+    )
+    from fakenews.simulation.validator import SimulatedValidator  # noqa: PLC0415 - imports the whole validator
+
+    validator = SimulatedValidator()
+    report = validator.simulate(150)
+
+    assert report.steps == 150
+    assert report.weights_set > 0
+    assert report.blocks >= 150 * validator.FORWARD_DELAY_SECONDS / VirtualClock.BLOCK_TIME
+    assert report.weights_accuracy_correlation > 0.3
+    assert report.weights_by_profile["strong"] > report.weights_by_profile["random"]
+    assert validator.news_api_client.saved > 0
+    assert validator.checkpointer.stats()["written"] > 0
+    # The state was written to a temporary directory, removed at the end, and nothing under the logging directory.
+    assert not os.path.exists(validator.config.neuron.full_path)
+    assert not list(tmp_path.rglob("simulation"))
@@ -0,0 +1,57 @@
+import numpy as np
+
+from fakenews.utils.uids import UidScheduler
+
+
+def test_sample_size_and_uniqueness():
+    scheduler = UidScheduler(10)
+    uids = scheduler.sample(list(range(10)), k=4, step=0)
+    assert len(uids) == 4
+    assert len(set(uids.tolist())) == 4
+
+
+def test_sample_more_than_available():
+    scheduler = UidScheduler(10)
+    uids = scheduler.sample([1, 2, 3], k=5, step=0)
+    assert sorted(uids.tolist()) == [1, 2, 3]
+    assert scheduler.sample([], k=5, step=0).size == 0
+
+
+def test_under_sampled_uids_are_prioritized():
+    scheduler = UidScheduler(10, jitter=0.5)
+    scheduler.query_counts[:] = 10
+    scheduler.query_counts[[3, 7]] = 0
+    uids = scheduler.sample(list(range(10)), k=2, step=5)
+    assert sorted(uids.tolist()) == [3, 7]
+    assert scheduler.last_queried_step[3] == 5
+
+
+def test_coverage_is_balanced():
+    scheduler = UidScheduler(64)
+    for step in range(100):
+        scheduler.sample(list(range(64)), k=16, step=step)
+    counts = scheduler.query_counts
+    assert counts.sum() == 1600
+    assert counts.max() - counts.min() <= scheduler.jitter + 1
+
+
+def test_batches_are_not_deterministic():
+    scheduler = UidScheduler(64)
+    batches = {tuple(sorted(scheduler.sample(list(range(64)), k=16, step=step).tolist())) for step in range(8)}
+    assert len(batches) > 4
+
+
+def test_resize_and_reset():
+    scheduler = UidScheduler(2)
+    scheduler.sample([0, 1], k=2, step=0)
+    scheduler.resize(4)
+    assert scheduler.query_counts.tolist() == [1, 1, 0, 0]
+    scheduler.reset(0)
+    assert scheduler.query_counts[0] == 0
+    assert scheduler.coverage([0, 1, 2, 3], step=1) == {
+        "min_queries": 0,
+        "max_queries": 1,
+        "never_queried": 3,
+        "max_steps_since_query": 1,
+    }
+    assert np.array_equal(scheduler.last_queried_step, [-1, 0, -1, -1])
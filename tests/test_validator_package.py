@@ -0,0 +1,19 @@
+import subprocess
+import sys
+from pathlib import Path
+
+
+def test_forward_export_shadows_its_submodule():
+    # The submodule is imported first, in a fresh interpreter, before the package export is looked up.
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import inspect\n"
+            "import fakenews.validator.forward\n"
+            "from fakenews.validator import forward\n"
+            "assert inspect.iscoroutinefunction(forward), forward\n",
+        ],
+        cwd=Path(__file__).parents[1],
+        check=True,
+    )
@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from fakenews.base.validator import BaseValidatorNeuron
+
+
+class Task:
+    def __init__(self, name, reward_weight):
+        self.TASK_NAME = name
+        self.REWARD_WEIGHT = reward_weight
+
+
+@pytest.fixture
+def validator():
+    validator = SimpleNamespace(
+        tasks=[Task("a", 0.75), Task("b", 0.25)],
+        scores=np.zeros((2, 4), dtype=np.float32),
+        has_enough_stake=np.ones(4, dtype=np.float32),
+        config=SimpleNamespace(neuron=SimpleNamespace(moving_average_alpha=0.5)),
+    )
+    validator.weighted_scores = lambda: BaseValidatorNeuron.weighted_scores(validator)
+    validator._restore_scores = lambda *args: BaseValidatorNeuron._restore_scores(validator, *args)
+    return validator
+
+
+def test_only_current_task_row_is_updated(validator):
+    BaseValidatorNeuron.update_scores(validator, np.array([1.0, 0.5]), np.array([0, 2]), validator.tasks[1])
+    assert validator.scores[0].tolist() == [0, 0, 0, 0]
+    assert validator.scores[1].tolist() == [0.5, 0, 0.25, 0]
+
+
+def test_rows_are_combined_by_reward_weight(validator):
+    validator.scores[0] = [1, 0, 0, 1]
+    validator.scores[1] = [0, 1, 0, 1]
+    assert validator.weighted_scores().tolist() == [0.75, 0.25, 0, 1]
+
+
+def test_single_vector_scores_are_migrated(validator):
+    scores = validator._restore_scores(np.array([0.1, 0.2, 0.3, 0.4]), None)
+    assert scores.shape == (2, 4)
+    assert np.allclose(scores[0], scores[1])
+    validator.scores = scores
+    assert np.allclose(validator.weighted_scores(), [0.1, 0.2, 0.3, 0.4])
+
+
+def test_saved_rows_are_mapped_by_task_name(validator):
+    saved = np.array([[0, 0, 0, 1], [1, 0, 0, 0]], dtype=np.float32)
+    scores = validator._restore_scores(saved, np.array(["b", "removed"]))
+    assert scores[1].tolist() == [0, 0, 0, 1]
+    # Tasks without a saved row start from the combined saved scores.
+    assert scores[0].tolist() == [0, 0, 0, 0.25]
@@ -0,0 +1,69 @@
+import threading
+
+import numpy as np
+
+from fakenews.validator.wandb_logger import WandbLogger
+
+
+def make_payload(uids, body="original body"):
+    return {
+        "miner_uids": uids,
+        "scores": np.arange(8, dtype=np.float32),
+        "task_metadata": {
+            "original_article_id": 42,
+            "original_article_metadata": {"body": body, "url": "url"},
+            "generated_articles_metadata": [{"body": "generated", "label": 1.0}],
+        },
+    }
+
+
+def test_scores_are_logged_at_lower_cadence():
+    logger = WandbLogger(scores_every=2)
+    first, second, third = (logger.slim(make_payload([1, 3])) for _ in range(3))
+    assert first["scores"] == list(range(8))
+    assert "scores" not in second
+    assert second["miner_scores"] == [1.0, 3.0]
+    assert "scores" in third
+
+
+def test_article_bodies_are_logged_once():
+    logger = WandbLogger()
+    first = logger.slim(make_payload([0]))
+    second = logger.slim(make_payload([0]))
+
+    assert set(first["articles"].values()) == {"original body", "generated"}
+    assert "articles" not in second
+    original = second["task_metadata"]["original_article_metadata"]
+    assert original == {"url": "url", "article_id": "original-42"}
+    assert "body" not in second["task_metadata"]["generated_articles_metadata"][0]
+
+
+def test_article_bodies_are_logged_again_to_a_new_run():
+    logger = WandbLogger(scores_every=10)
+    logger.slim(make_payload([0]))
+    logger.new_run()
+    payload = logger.slim(make_payload([0]))
+
+    assert set(payload["articles"].values()) == {"original body", "generated"}
+    assert payload["scores"] == list(range(8))
+
+
+def test_payloads_are_dropped_under_backpressure(monkeypatch):
+    release = threading.Event()
+    logged = []
+
+    def log_batch(batch):
+        release.wait()
+        logged.extend(batch)
+
+    logger = WandbLogger(queue_size=2, batch_size=1)
+    monkeypatch.setattr(logger, "_log_batch", log_batch)
+
+    results = [logger.log({"step": i}) for i in range(10)]
+    assert not all(results)
+    assert not logger.flush(timeout=0.05)
+
+    release.set()
+    assert logger.flush(timeout=5)
+    assert len(logged) == sum(results)
+    assert logger.stats()["dropped"] == results.count(False)
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from fakenews.base.utils.weight_utils import U16_MAX, convert_weights_and_uids_for_emit, normalize_max_weight
+
+
+def reference_normalize_max_weight(x: np.ndarray, limit: float = 0.1) -> np.ndarray:
+    """Loop based implementation the vectorized one must match."""
+    epsilon = 1e-7
+    weights = x.copy()
+    values = np.sort(weights)
+    if x.sum() == 0 or len(x) * limit <= 1:
+        return np.ones_like(x) / x.size
+    estimation = values / values.sum()
+    if estimation.max() <= limit:
+        return weights / weights.sum()
+    cumsum = np.cumsum(estimation, 0)
+    estimation_sum = np.array([(len(values) - i - 1) * estimation[i] for i in range(len(values))])
+    n_values = (estimation / (estimation_sum + cumsum + epsilon) < limit).sum()
+    cutoff_scale = (limit * cumsum[n_values - 1] - epsilon) / (1 - (limit * (len(estimation) - n_values)))
+    cutoff = cutoff_scale * values.sum()
+    weights[weights > cutoff] = cutoff
+    return weights / weights.sum()
+
+
+def reference_convert_weights_and_uids_for_emit(uids: np.ndarray, weights: np.ndarray):
+    """Loop based implementation the vectorized one must match."""
+    if np.sum(weights) == 0:
+        return [], []
+    max_weight = float(np.max(weights))
+    weights = [float(value) / max_weight for value in weights]
+    weight_vals = []
+    weight_uids = []
+    for weight_i, uid_i in zip(weights, uids, strict=True):
+        uint16_val = round(float(weight_i) * int(U16_MAX))
+        if uint16_val != 0:
+            weight_vals.append(uint16_val)
+            weight_uids.append(uid_i)
+    return weight_uids, weight_vals
+
+
+def random_weights(rng, n, dtype):
+    weights = rng.pareto(1.5, size=n).astype(dtype)
+    weights[rng.random(n) < 0.3] = 0
+    return weights
+
+
+@pytest.mark.parametrize("n", [1, 2, 16, 256, 4096])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("limit", [0.01, 0.1, 0.5])
+def test_normalize_max_weight_matches_reference(n, dtype, limit):
+    rng = np.random.default_rng(n)
+    for _ in range(5):
+        x = random_weights(rng, n, dtype)
+        expected = reference_normalize_max_weight(x, limit)
+        result = normalize_max_weight(x, limit)
+        assert result.dtype == expected.dtype
+        assert np.array_equal(result, expected)
+
+
+@pytest.mark.parametrize("n", [1, 2, 16, 256, 4096])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_convert_weights_and_uids_for_emit_matches_reference(n, dtype):
+    rng = np.random.default_rng(n)
+    uids = np.arange(n)
+    for _ in range(5):
+        weights = random_weights(rng, n, dtype)
+        assert convert_weights_and_uids_for_emit(uids, weights) == reference_convert_weights_and_uids_for_emit(uids, weights)
+
+
+def test_convert_weights_rounds_half_to_even():
+    # 0.5 / 65535 and 1.5 / 65535 scaled back to uint16 are exactly 0.5 and 1.5.
+    weights = np.array([1.0, 0.5 / U16_MAX, 1.5 / U16_MAX, 2.5 / U16_MAX])
+    expected = reference_convert_weights_and_uids_for_emit(np.arange(4), weights)
+    assert convert_weights_and_uids_for_emit(np.arange(4), weights) == expected
+
+
+def test_convert_weights_rejects_invalid_input():
+    with pytest.raises(ValueError):
+        convert_weights_and_uids_for_emit(np.arange(2), np.array([1.0, -1.0]))
+    with pytest.raises(ValueError):
+        convert_weights_and_uids_for_emit(np.arange(3), np.array([1.0, 1.0]))
+    assert convert_weights_and_uids_for_emit(np.arange(2), np.zeros(2)) == ([], [])